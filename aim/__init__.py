@@ -3,6 +3,7 @@
 # Core simulation classes
 from .core.agent import BaseAgent
 from .core.block import BaseBlock
+from .core.pool import AgentPool
 from .core.simulator import Simulator
 
 # Space
@@ -22,6 +23,7 @@ from .blocks.combine import CombineBlock
 from .blocks.split import SplitBlock
 from .blocks.resource.seize_block import SeizeBlock
 from .blocks.resource.release_block import ReleaseBlock
+from .blocks.resource.resource_use_block import ResourceUseBlock
 
 # Resource classes
 from .entities.resource.resource_agent import ResourceAgent
@@ -31,6 +33,7 @@ __all__ = [
     # Core
     'BaseAgent',
     'BaseBlock',
+    'AgentPool',
     'Simulator',
 
     # Space
@@ -52,6 +55,7 @@ __all__ = [
     # Resource Blocks
     'SeizeBlock',
     'ReleaseBlock',
+    'ResourceUseBlock',
 
     # Resource Classes
     'ResourceAgent',
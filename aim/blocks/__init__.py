@@ -7,12 +7,13 @@ from .queue import QueueBlock
 from .delay import DelayBlock
 from .restricted_area_start import RestrictedAreaStart
 from .restricted_area_end import RestrictedAreaEnd
-from .gate import GateBlock
+from .gate import GateBlock, GateState
 from .combine import CombineBlock
 from .split import SplitBlock
 from .switch import SwitchBlock
 from .move import MoveBlock
 from .move_resoure import MoveResourcelock
+from .composite import MoveDelaySeq
 
 __all__ = [
     'SourceBlock',
@@ -23,9 +24,11 @@ __all__ = [
     'RestrictedAreaStart',
     'RestrictedAreaEnd',
     'GateBlock',
+    'GateState',
     'CombineBlock',
     'SplitBlock',
     'SwitchBlock',
     'MoveBlock',
-    'MoveResourcelock'
+    'MoveResourcelock',
+    'MoveDelaySeq'
 ]
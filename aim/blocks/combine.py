@@ -1,6 +1,7 @@
 # blocks/combine.py
 
-from typing import List, Optional, Callable
+from collections import deque
+from typing import Deque, List, Optional, Callable
 from ..core.block import BaseBlock
 from ..core.agent import BaseAgent
 from ..core.simulator import Simulator
@@ -10,12 +11,20 @@ class _CombineInputPort:
     def __init__(self, parent: 'CombineBlock', port_name: str):
         self.parent = parent
         self.port_name = port_name
+        # Handler bound once by port name — take() makes no string compare per agent
+        self.take: Callable[[BaseAgent], None] = {
+            "container": parent._handle_container,
+            "pickup": parent._handle_pickup,
+        }.get(port_name, self._ignore)
 
-    def take(self, agent: BaseAgent) -> None:
-        if self.port_name == "container":
-            self.parent._handle_container(agent)
-        elif self.port_name == "pickup":
-            self.parent._handle_pickup(agent)
+    def take_many(self, agents: List[BaseAgent]) -> None:
+        take = self.take
+        for agent in agents:
+            take(agent)
+
+    @staticmethod
+    def _ignore(agent: BaseAgent) -> None:
+        pass
 
 class CombineBlock(BaseBlock):
     """
@@ -32,7 +41,7 @@ class CombineBlock(BaseBlock):
         self.container = _CombineInputPort(self, "container")
         self.pickup = _CombineInputPort(self, "pickup")
         self._held_container: Optional[BaseAgent] = None
-        self._pickup_queue: List[BaseAgent] = []
+        self._pickup_queue: Deque[BaseAgent] = deque()
 
 
     def take(self, agent: BaseAgent) -> None:
@@ -91,7 +100,7 @@ class CombineBlock(BaseBlock):
             return
 
         while self._pickup_queue and len(self._held_container.children_agents) < self.max_pickups:
-            pickup = self._pickup_queue.pop(0)
+            pickup = self._pickup_queue.popleft()
             self._add_pickup_to_container(pickup)
 
     @property
@@ -0,0 +1,110 @@
+# blocks/composite.py
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..core.block import BaseBlock
+from ..core.agent import BaseAgent
+from ..core.simulator import Simulator
+
+Point3D = Tuple[float, float, float]
+
+
+class MoveDelaySeq(BaseBlock):
+    """
+    Fused MoveBlock -> DelayBlock -> MoveBlock -> ... chain.
+    Each stage moves the agent to a target in the space, then holds it for a number of ticks;
+    after the last stage the agent is ejected. Timing matches the equivalent chain of blocks,
+    without the per-stage block transitions.
+    """
+
+    def __init__(
+        self,
+        simulator: Simulator,
+        space_name: str,
+        stages: Sequence[Tuple[Point3D, int]],
+        speed: float = 1.0
+    ):
+        """
+        :param simulator: Simulator instance.
+        :param space_name: Name of space to move in.
+        :param stages: (target_position, delay_ticks) per stage, in order.
+        :param speed: Default speed for agents (can be overridden per agent via .speed).
+        """
+        super().__init__(simulator)
+        if not stages:
+            raise ValueError("MoveDelaySeq needs at least one stage.")
+        self.space_name = space_name
+        self.space = simulator.get_space(space_name)
+        self.stages = [(tuple(target), delay_ticks) for target, delay_ticks in stages]
+        self.default_speed = speed
+        # Called as on_arrival(agent, stage_index) when an agent reaches a stage target
+        self.on_arrival: Optional[Callable[[BaseAgent, int], None]] = None
+        # Agent -> index of its current stage
+        self._stage: Dict[BaseAgent, int] = {}
+        # Agents currently travelling — the only ones _tick has to check
+        self._moving: List[BaseAgent] = []
+
+    def take(self, agent: BaseAgent) -> None:
+        """
+        Accept agent and start its first move from its current position
+        (space_state["position"], falling back to .start_position).
+        """
+        agent._enter_block(self)
+        if self.on_enter is not None:
+            self.on_enter(agent)
+
+        start_position = agent.space_state.get("position", getattr(agent, "start_position", None))
+        if start_position is None:
+            raise RuntimeError("Agent must have a position in space_state or a start_position attribute.")
+
+        self._agents.append(agent)
+        self._start_stage(agent, 0, tuple(start_position))
+
+    def _start_stage(self, agent: BaseAgent, stage: int, start_position: Point3D) -> None:
+        target_position = self.stages[stage][0]
+        initial_state = {
+            "start_position": start_position,
+            "target_position": target_position,
+            "speed": getattr(agent, 'speed', self.default_speed)
+        }
+        if not self.space.register(agent, initial_state):
+            raise RuntimeError(f"MoveDelaySeq: agent {agent.id} rejected by space")
+        self._stage[agent] = stage
+        self._moving.append(agent)
+
+    def _tick(self) -> None:
+        """
+        Start the delay of every agent that finished its move this tick.
+        """
+        if not self._moving:
+            return
+        is_complete = self.space.is_movement_complete
+        arrived = [agent for agent in self._moving if is_complete(agent)]
+        if not arrived:
+            return
+        self._moving = [agent for agent in self._moving if not is_complete(agent)]
+
+        for agent in arrived:
+            stage = self._stage[agent]
+            if self.on_arrival is not None:
+                self.on_arrival(agent, stage)
+            self._simulator._add_timer(
+                self.stages[stage][1], lambda agent=agent: self._end_delay(agent))
+
+    def _end_delay(self, agent: BaseAgent) -> None:
+        """
+        Internal: called by the simulator's timer — move on to the next stage or eject.
+        """
+        stage = self._stage[agent] + 1
+        if stage < len(self.stages):
+            self._start_stage(agent, stage, self.stages[stage - 1][0])
+            return
+
+        del self._stage[agent]
+        self._agents.remove(agent)
+        self._eject(agent)
+
+    @property
+    def size(self) -> int:
+        """Number of agents anywhere in the sequence."""
+        return len(self._stage)
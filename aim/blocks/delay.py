@@ -8,7 +8,8 @@ from ..core.simulator import Simulator
 class DelayBlock(BaseBlock):
     """
     Holds each agent for a fixed number of ticks, then ejects to next block.
-    Uses scheduled events for precision and efficiency.
+    Uses the simulator's timer wheel — only due agents are touched, and a DelayBlock
+    may feed another one directly.
     No internal polling. No per-tick scans.
     """
 
@@ -33,17 +34,12 @@ class DelayBlock(BaseBlock):
         eject_tick = self._simulator.current_tick + self.delay_ticks
         self._scheduled_ejections[agent] = eject_tick
 
-        # Use simulator's event scheduler
-        self._simulator.schedule_event(
-            callback=lambda tick: self._eject_agent(agent),
-            delay_ticks=self.delay_ticks,
-            recurring=False
-        )
+        self._simulator._add_timer(self.delay_ticks, lambda: self._eject_agent(agent))
 
     def _eject_agent(self, agent: BaseAgent) -> None:
         """
         Internal: eject agent to next block.
-        Called by scheduled event.
+        Called by the simulator's timer.
         """
         if agent not in self._scheduled_ejections:
             return
@@ -1,32 +1,50 @@
-from typing import List
+from collections import deque
+from enum import IntEnum
+from typing import Deque, Union
 from ..core.block import BaseBlock
 from ..core.agent import BaseAgent
 from ..core.simulator import Simulator
 from . import QueueBlock
 
+class GateState(IntEnum):
+    """Gate state — an int, so a closed gate is falsy and checks are integer compares."""
+    CLOSED = 0
+    OPEN = 1
+
+
+_GATE_STATES = {"closed": GateState.CLOSED, "open": GateState.OPEN}
+
+
 class GateBlock(BaseBlock):
+    # Nothing to release while the line is empty — ticked only once an agent waits
+    _polled_while_idle = False
+
     def __init__(
         self,
         simulator: Simulator,
-        initial_state: str = "closed",
+        initial_state: Union[str, GateState] = "closed",
         release_mode: str = "one"  # "one" or "all"
     ):
         super().__init__(simulator)
-        self._state = initial_state
-        self._release_mode = release_mode
-        self._waiting_agents: List[BaseAgent] = []
-
-        if initial_state not in ["open", "closed"]:
+        # Strings are resolved here once — _tick runs on every tick and toggle() may flip the state each time
+        if isinstance(initial_state, GateState):
+            self._state = initial_state
+        elif initial_state in _GATE_STATES:
+            self._state = _GATE_STATES[initial_state]
+        else:
             raise ValueError("initial_state must be 'open' or 'closed'")
         if release_mode not in ["one", "all"]:
             raise ValueError("release_mode must be 'one' or 'all'")
+        self._release_mode = release_mode
+        self._release_all = release_mode == "all"
+        self._waiting_agents: Deque[BaseAgent] = deque()
 
     def take(self, agent: BaseAgent) -> None:
         # Enforce: previous block must be QueueBlock
         if not isinstance(agent.current_block, QueueBlock):
             raise RuntimeError(
                 f"GateBlock {id(self)} only accepts agents from QueueBlock. "
-                f"Agent {id(agent)} came from {type(agent.current_block).__name__}."
+                f"Agent {agent.id} came from {type(agent.current_block).__name__}."
             )
 
         agent._enter_block(self)
@@ -34,33 +52,41 @@ class GateBlock(BaseBlock):
             self.on_enter(agent)
 
         self._waiting_agents.append(agent)
+        self._simulator._wake(self)
+
+    def _is_idle(self) -> bool:
+        return not self._waiting_agents
 
     def _tick(self) -> None:
-        if self._state == "open":
-            if self._release_mode == "one" and self._waiting_agents:
-                agent = self._waiting_agents.pop(0)
-                self._eject(agent)
-            elif self._release_mode == "all" and self._waiting_agents:
-                agents = self._waiting_agents[:]
-                self._waiting_agents.clear()
-                for agent in agents:
-                    self._eject(agent)
+        waiting = self._waiting_agents
+        if not (self._state and waiting):
+            return
+        # The whole line in "all" mode, else just its head — fixed up front, so agents
+        # that arrive while this tick releases wait for the next one
+        release_count = len(waiting) if self._release_all else 1
+        for _ in range(release_count):
+            self._eject(waiting.popleft())
 
     def toggle(self) -> None:
         """Toggle gate state: open ↔ closed."""
-        self._state = "closed" if self._state == "open" else "open"
+        self._state = GateState.CLOSED if self._state else GateState.OPEN
 
     def state(self) -> str:
         """Return current state: 'open' or 'closed'."""
+        return "open" if self._state else "closed"
+
+    @property
+    def gate_state(self) -> GateState:
+        """Current state as a GateState."""
         return self._state
 
     def open(self) -> None:
         """Open gate."""
-        self._state = "open"
+        self._state = GateState.OPEN
 
     def close(self) -> None:
         """Close gate."""
-        self._state = "closed"
+        self._state = GateState.CLOSED
 
     @property
     def size(self) -> int:
@@ -3,34 +3,101 @@
 from ..core.simulator import Simulator
 from ..core.block import BaseBlock
 from ..core.agent import BaseAgent
-from typing import Callable
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
 
 
 class IfBlock(BaseBlock):
-    def __init__(self, simulator: Simulator, condition: Callable[[BaseAgent], bool]):
+    # Number of coin flips drawn per refill when routing by probability
+    _COIN_BATCH = 8192
+
+    def __init__(
+        self,
+        simulator: Simulator,
+        condition: Optional[Callable[[BaseAgent], bool]] = None,
+        prob: Optional[float] = None,
+        decisions: Optional[Sequence[bool]] = None
+    ):
+        """
+        :param condition: Predicate per agent — True routes to the first output, False to the second.
+        :param prob: Instead of a condition, route to the first output with this probability.
+                     Decisions are drawn in batches from a NumPy generator seeded by the simulator.
+        :param decisions: Instead of a condition, precomputed routing decisions (list or NumPy bool array),
+                          consumed one per agent in arrival order.
+        """
         super().__init__(simulator)
-        self.condition = condition
+        if sum(option is not None for option in (condition, prob, decisions)) != 1:
+            raise ValueError("IfBlock needs exactly one of condition, prob or decisions")
+        self.prob = prob
+        if condition is not None:
+            self.condition = condition
+        elif decisions is not None:
+            self.condition = self._next_decision
+        else:
+            self.condition = self._coin_flip
+        # Converted once to Python bools so each lookup is a plain list index
+        self._decisions: List[bool] = np.asarray(decisions, dtype=bool).tolist() if decisions is not None else []
+        self._decision_index = 0
         self.output_connections = [None, None]
 
+        # Coin-flip buffer for prob routing — refilled lazily, one C call per _COIN_BATCH decisions
+        seed = (simulator.random_seed, len(simulator.blocks)) if simulator is not None else None
+        self._rng = np.random.default_rng(seed)
+        self._coins: List[bool] = []
+        self._coin_index = 0
+
+    def _coin_flip(self, agent: BaseAgent) -> bool:
+        """Condition used when routing by prob: next decision from the precomputed buffer."""
+        if self._coin_index >= len(self._coins):
+            self._coins = (self._rng.random(self._COIN_BATCH) < self.prob).tolist()
+            self._coin_index = 0
+        coin = self._coins[self._coin_index]
+        self._coin_index += 1
+        return coin
+
+    def _next_decision(self, agent: BaseAgent) -> bool:
+        """Condition used when routing by precomputed decisions."""
+        if self._decision_index >= len(self._decisions):
+            raise RuntimeError(f"IfBlock ran out of precomputed decisions after {len(self._decisions)} agents.")
+        decision = self._decisions[self._decision_index]
+        self._decision_index += 1
+        return decision
+
     def take(self, agent: BaseAgent) -> bool:
         agent._enter_block(self)
         self._agents.append(agent)
         return True
 
     def _tick(self) -> None:
-        # Process all agents waiting in this block
-        while self._agents:
-            agent = self._agents.pop(0)
-            if self.condition(agent):
-                if len(self.output_connections) > 0 and self.output_connections[0]:
-                    self.output_connections[0].take(agent)
-            else:
-                if len(self.output_connections) > 1 and self.output_connections[1]:
-                    self.output_connections[1].take(agent)
+        # Process all agents waiting in this block — walk the list by index and drop the
+        # routed prefix once, instead of an O(n) pop(0) per agent
+        agents = self._agents
+        routed = 0
+        if not agents:
+            return
+        # Branch takes bound once per tick, not looked up per agent
+        first, second = self.output_connections[0], self.output_connections[1]
+        take_first = first.take if first else None
+        take_second = second.take if second else None
+        condition = self.condition
+        try:
+            while routed < len(agents):
+                agent = agents[routed]
+                routed += 1
+                if condition(agent):
+                    if take_first is not None:
+                        take_first(agent)
+                else:
+                    if take_second is not None:
+                        take_second(agent)
+        finally:
+            del agents[:routed]
 
     def connect_first(self, block: BaseBlock):
         """Connect the 'True' branch."""
         self.output_connections[0] = block
+        self._forward = block.take
 
     def connect_second(self, block: BaseBlock):
         """Connect the 'False' branch."""
@@ -57,13 +57,16 @@ class ConveyorBlock(BaseBlock):
                 "Did you forget to call space.register_entity(end_entity)?"
             )
 
+        # Spaces that report arrivals from their update() pass spare a completion check per agent
+        self._arrived_agents = getattr(self.space, 'arrived_agents', None)
+
     def take(self, agent: BaseAgent) -> None:
         """
         Place agent in space at start_entity.
         Rejects agent if cannot be placed (e.g., collision).
         """
         if self._agent_entered_this_tick:
-            raise RuntimeError(f"ConveyorBlock: agent {id(agent)} rejected, only one per tick may enter")
+            raise RuntimeError(f"ConveyorBlock: agent {agent.id} rejected, only one per tick may enter")
         agent._enter_block(self)
         self._agent_entered_this_tick = True
 
@@ -72,7 +75,7 @@ class ConveyorBlock(BaseBlock):
             "end_entity": self.end_entity
         }
         if not self.space.register(agent, initial_state):
-            raise RuntimeError(f"ConveyorBlock: agent {id(agent)} rejected by space")
+            raise RuntimeError(f"ConveyorBlock: agent {agent.id} rejected by space")
 
         if self.on_enter is not None:
             self.on_enter(agent)
@@ -88,13 +91,25 @@ class ConveyorBlock(BaseBlock):
 
         self._agent_entered_this_tick = False
 
-        # Check each agent to see if movement is complete
+        if not self._agents:
+            return
+
+        # Split held agents into completed and moving in one pass
+        if self._arrived_agents is not None:
+            arrived = self._arrived_agents()
+            if not arrived:
+                return
+            is_complete = arrived.__contains__
+        else:
+            is_complete = self.space.is_movement_complete
         completed_agents = []
+        moving_agents = []
         for agent in self._agents:
-            if self.space.is_movement_complete(agent):
-                completed_agents.append(agent)
+            (completed_agents if is_complete(agent) else moving_agents).append(agent)
+        if not completed_agents:
+            return
 
         # Eject completed agents
+        self._agents = moving_agents
         for agent in completed_agents:
             self._eject(agent)
-            self._agents.remove(agent)
@@ -47,7 +47,7 @@ class MoveBlock(BaseBlock):
         }
 
         if not self.space.register(agent, initial_state):
-            raise RuntimeError(f"MoveBlock: agent {id(agent)} rejected by space")
+            raise RuntimeError(f"MoveBlock: agent {agent.id} rejected by space")
 
         self._agents.append(agent)
 
@@ -54,7 +54,7 @@ class MoveResourcelock(BaseBlock):
         }
 
         if not self.space.register(agent.resource_agent, initial_state):
-            raise RuntimeError(f"MoveResourceBlock: agent {id(agent.resource_agent)} rejected by space")
+            raise RuntimeError(f"MoveResourceBlock: agent {agent.resource_agent.id} rejected by space")
 
         agent._enter_block(self)
         if self.on_enter is not None:
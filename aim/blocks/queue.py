@@ -1,6 +1,7 @@
 # blocks/queue.py
 
-from typing import List, TYPE_CHECKING
+from collections import deque
+from typing import Deque, List, TYPE_CHECKING
 from ..core.block import BaseBlock
 from ..core.agent import BaseAgent
 from ..core.simulator import Simulator
@@ -10,44 +11,95 @@ class QueueBlock(BaseBlock):
     """
     Holds agents until downstream block can accept them.
     Does NOT reject agents in .take() — always accepts.
-    Every tick, tries to push waiting agents to next block.
+    Every tick, tries to push waiting agents to next block — an empty queue is not ticked.
     """
 
+    _polled_while_idle = False
+
     def __init__(self, simulator: 'Simulator'):
         super().__init__(simulator)
-        self._waiting_agents: List[BaseAgent] = []
+        # FIFO line — agents leave from the left in O(1)
+        self._waiting_agents: Deque[BaseAgent] = deque()
+        # Set by a target that will call _unstall() once it can accept again — no polling till then
+        self._stalled = False
 
     def take(self, agent: BaseAgent) -> None:
         """
         Always accepts agent. Never rejects.
+        An empty queue passes the agent straight on instead of holding it until its tick;
+        runs of empty queues are crossed in one loop, not one nested take() per queue.
         """
-        agent._enter_block(self)
-        self._waiting_agents.append(agent)
+        block = self
+        while True:
+            agent._enter_block(block)
+            outputs = block.output_connections
+            target = outputs[0] if outputs else None
+            if block._waiting_agents or target is None:
+                break
+            if block.on_exit is not None:
+                block.on_exit(agent)
+            if isinstance(target, QueueBlock) and type(target).take is QueueBlock.take:
+                block = target
+                continue
+            try:
+                target.take(agent)
+                return
+            except Exception:
+                # Rejected — held like any agent its tick failed to push
+                break
+        block._waiting_agents.append(agent)
+        if not block._stalled:
+            block._simulator._wake(block)
+
+    def take_many(self, agents: List[BaseAgent]) -> None:
+        """Accept a batch — one extend instead of an append per agent."""
+        for agent in agents:
+            agent._enter_block(self)
+        self._waiting_agents.extend(agents)
+        if agents and not self._stalled:
+            self._simulator._wake(self)
+
+    def _is_idle(self) -> bool:
+        return self._stalled or not self._waiting_agents
+
+    def _stall(self) -> None:
+        """Internal: stop ticking this queue, agents and all, until _unstall()."""
+        self._stalled = True
+
+    def _unstall(self) -> None:
+        """Internal: the target can accept again — resume pushing waiting agents."""
+        self._stalled = False
+        if self._waiting_agents:
+            self._simulator._wake(self)
 
     def _tick(self) -> None:
         """
         Try to push all waiting agents to next block.
         If rejected, agent stays in queue.
         """
-        if not self.output_connections or not self.output_connections[0]:
+        forward = self._forward
+        if forward is None:
             return
 
-        target_block = self.output_connections[0]
-        # Try to push agents — preserve order (FIFO)
+        # Try to push agents — preserve order (FIFO). Only the agents waiting now get a try;
+        # any that arrive meanwhile stay behind them
+        waiting = self._waiting_agents
         remaining = []
-        for agent in self._waiting_agents:
+        for _ in range(len(waiting)):
+            agent = waiting.popleft()
             # Try to push — if target block has .take() that might reject, handle it
             # But under new strategy, target blocks SHOULD NOT reject
             # If they do, we hold agent
             try:
                 if self.on_exit is not None:
                     self.on_exit(agent)
-                target_block.take(agent)
+                forward(agent)
             except Exception as e:
                 # If target block raises or rejects, hold agent
                 # print(f'ERROR: {e}')
                 remaining.append(agent)
-        self._waiting_agents = remaining
+        if remaining:
+            waiting.extendleft(reversed(remaining))
 
     @property
     def size(self) -> int:
@@ -1,7 +1,9 @@
 from .seize_block import SeizeBlock
 from .release_block import ReleaseBlock
+from .resource_use_block import ResourceUseBlock
 
 __all__ = [
     'SeizeBlock',
-    'ReleaseBlock'
+    'ReleaseBlock',
+    'ResourceUseBlock'
 ]
\ No newline at end of file
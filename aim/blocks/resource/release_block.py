@@ -7,6 +7,7 @@ from aim.entities.resource.resource_pool import ResourcePool
 class ReleaseBlock(BaseBlock):
     """
     Block that releases resources previously acquired by an agent in a Seize block.
+    Works entirely in take() — no tick logic, so the simulator never polls it.
     """
     
     def __init__(
@@ -50,9 +51,4 @@ class ReleaseBlock(BaseBlock):
         
         # Eject to next block
         self._eject(agent)
-    
-    def _tick(self) -> None:
-        """
-        Release block doesn't need special tick logic.
-        """
-        pass
\ No newline at end of file
+
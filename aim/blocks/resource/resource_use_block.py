@@ -0,0 +1,80 @@
+from typing import Dict, List
+from aim.core.block import BaseBlock
+from aim.core.agent import BaseAgent
+from aim.core.simulator import Simulator
+from aim.blocks.queue import QueueBlock
+from aim.entities.resource.resource_pool import ResourcePool
+from aim.entities.resource.resource_agent import ResourceAgent
+
+
+class ResourceUseBlock(BaseBlock):
+    """
+    Fused SeizeBlock -> DelayBlock -> ReleaseBlock.
+    Seizes resources for the agent, holds it for delay_ticks, then releases them and ejects the agent —
+    one pool call at each end and a single timer in between, no per-tick work.
+    Like SeizeBlock, rejects agents while resources are short, so place a QueueBlock upstream.
+    Agents are not held for resource movement (work_location), unlike SeizeBlock.
+    """
+
+    def __init__(
+        self,
+        simulator: Simulator,
+        resource_pool: ResourcePool,
+        delay_ticks: int = 1,
+        resource_count: int = 1
+    ):
+        """
+        :param simulator: The simulator instance
+        :param resource_pool: The ResourcePool to seize resources from and release them to
+        :param delay_ticks: Number of ticks each agent holds its resources
+        :param resource_count: Number of resources to seize per agent
+        """
+        super().__init__(simulator)
+        self.resource_pool = resource_pool
+        self.delay_ticks = delay_ticks
+        self.resource_count = resource_count
+        # Agent -> resources it holds until its delay ends
+        self._held: Dict[BaseAgent, List[ResourceAgent]] = {}
+
+    def take(self, agent: BaseAgent) -> None:
+        """
+        Seize resources and start the agent's delay.
+        Raises RuntimeError if not enough resources are available, to be handled by upstream QueueBlock.
+        """
+        acquired_resources = self.resource_pool.seize_resources(self.resource_count)
+        if len(acquired_resources) < self.resource_count:
+            # The upstream queue sleeps until a release instead of retrying every tick
+            if isinstance(agent.current_block, QueueBlock):
+                self.resource_pool._add_waiter(agent.current_block)
+            raise RuntimeError(
+                f"ResourceUseBlock: Not enough resources available. Needed: {self.resource_count}, "
+                f"Available: {self.resource_pool.get_available_count()}"
+            )
+
+        current_tick = self._simulator.current_tick
+        on_occupy = self.resource_pool.on_occupy
+        for resource in acquired_resources:
+            resource.occupied_by = agent
+            resource.is_available = False
+            resource.occupied_since_tick = current_tick
+            if on_occupy:
+                on_occupy(resource, agent)
+
+        agent._enter_block(self)
+        if self.on_enter:
+            self.on_enter(agent)
+
+        self._held[agent] = acquired_resources
+        self._simulator._add_timer(self.delay_ticks, lambda: self._finish(agent))
+
+    def _finish(self, agent: BaseAgent) -> None:
+        """
+        Internal: called by the simulator's timer — release the agent's resources and eject it.
+        """
+        self.resource_pool.release_resources(self._held.pop(agent))
+        self._eject(agent)
+
+    @property
+    def size(self) -> int:
+        """Number of agents currently holding resources in this block."""
+        return len(self._held)
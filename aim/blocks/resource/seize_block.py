@@ -2,6 +2,7 @@ from typing import Optional, List, Dict
 from aim.core.block import BaseBlock
 from aim.core.agent import BaseAgent
 from aim.core.simulator import Simulator
+from aim.blocks.queue import QueueBlock
 from aim.entities.resource.resource_pool import ResourcePool
 from aim.entities.resource.resource_agent import ResourceAgent
 
@@ -48,6 +49,10 @@ class SeizeBlock(BaseBlock):
             # Execute on_exit for the agent before raising exception
             if self.on_exit:
                 self.on_exit(agent)
+
+            # The upstream queue sleeps until a release instead of retrying every tick
+            if isinstance(agent.current_block, QueueBlock):
+                self.resource_pool._add_waiter(agent.current_block)
             
             # Raise exception to signal rejection
             raise RuntimeError(f"SeizeBlock: Not enough resources available. Needed: {self.resource_count}, Available: {len(acquired_resources)}")
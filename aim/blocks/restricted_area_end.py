@@ -35,10 +35,10 @@ class RestrictedAreaEnd(BaseBlock):
         if start_block is None:
             # Fallback: use the start_block passed in constructor
             start_block = self.start_block
-            print(f"WARNING: Agent {id(agent)} has no _restricted_area_start. Using constructor default.")
+            print(f"WARNING: Agent {agent.id} has no _restricted_area_start. Using constructor default.")
 
         if start_block != self.start_block:
-            print(f"WARNING: Agent {id(agent)} entered via different start block.")
+            print(f"WARNING: Agent {agent.id} entered via different start block.")
 
         # Notify start block
         start_block._on_agent_exit(agent)
@@ -39,7 +39,7 @@ class RestrictedAreaStart(BaseBlock):
         if not isinstance(agent.current_block, QueueBlock):
             raise RuntimeError(
                 f"RestrictedAreaStart {id(self)} only accepts agents from QueueBlock. "
-                f"Agent {id(agent)} came from {type(agent.current_block).__name__}. "
+                f"Agent {agent.id} came from {type(agent.current_block).__name__}. "
                 f"Place a QueueBlock upstream."
             )
 
@@ -53,16 +53,19 @@ class RestrictedAreaStart(BaseBlock):
             print(f"WARNING: RestrictedAreaStart {id(self)} has no end block set. Agents will not be released.")
             return
 
-        remaining = []
-        for agent in self._waiting_agents:
-            if self.current_agents < self.max_agents:
-                self.current_agents += 1
-                # Mark agent as inside restricted area (optional)
-                setattr(agent, '_restricted_area_start', self)
-                self._eject(agent)
-            else:
-                remaining.append(agent)
-        self._waiting_agents = remaining
+        # Admit from the head of the line only while slots are free — a full area costs O(1) per tick
+        # instead of rebuilding the whole waiting list
+        waiting = self._waiting_agents
+        admitted = 0
+        while admitted < len(waiting) and self.current_agents < self.max_agents:
+            agent = waiting[admitted]
+            admitted += 1
+            self.current_agents += 1
+            # Mark agent as inside restricted area (optional)
+            setattr(agent, '_restricted_area_start', self)
+            self._eject(agent)
+        if admitted:
+            del waiting[:admitted]
 
     def _on_agent_exit(self, agent: BaseAgent) -> None:
         """Called by RestrictedAreaEnd when agent exits."""
@@ -1,42 +1,76 @@
 # blocks/sink.py
 
+from typing import List, Optional
+
 from ..core.block import BaseBlock
 from ..core.agent import BaseAgent
+from ..core.pool import AgentPool
 from ..core.simulator import Simulator
 
 class SinkBlock(BaseBlock):
     """
-    Terminal block that absorbs and holds agents indefinitely.
+    Terminal block that absorbs and holds agents indefinitely — or only counts them.
     Useful for counting, logging, or ending agent journeys.
+    Has no tick logic — agents just sit here — so the simulator never polls it.
+    Subclasses may override _tick() to add logging or auto-eject after N ticks.
     """
 
     def __init__(self,
-            simulator: Simulator):
+            simulator: Simulator,
+            pool: Optional[AgentPool] = None,
+            keep_agents: bool = True):
+        """
+        :param pool: AgentPool to hand absorbed agents back to instead of holding them.
+                     Agents are only counted then, and must not be kept by on_enter.
+        :param keep_agents: Hold absorbed agents in .agents. False only counts them, so memory stays
+                            flat however many agents a long run absorbs. Implied False with a pool.
+        """
         super().__init__(simulator)
         self.simulator = simulator
+        self.pool = pool
+        self.keep_agents = keep_agents and pool is None
+        # Absorbed agents not held in _agents — pooled or dropped
+        self._dropped_count = 0
 
     def take(self, agent: BaseAgent) -> None:
         """
         Accept and hold agent forever (or until simulation ends).
-        Agents are stored internally and not passed on.
+        Agents are stored internally and not passed on — or recycled, if a pool is set.
         """
         agent._enter_block(self)
-        self._agents.append(agent)
+        if self.keep_agents:
+            self._agents.append(agent)
+        else:
+            self._dropped_count += 1
         if self.on_enter is not None:
             self.on_enter(agent)
         try:
             self.simulator.remove_agent(agent)
         except Exception:
             pass
+        if self.pool is not None:
+            self.pool.release(agent)
 
-    def _tick(self) -> None:
+    def take_many(self, agents: List[BaseAgent]) -> None:
         """
-        SinkBlock does nothing on tick — agents just sit here.
-        Override if you want to add logging or auto-eject after N ticks.
+        Accept a batch — agents leave the simulator in one pass instead of a list.remove() each.
         """
-        pass
+        on_enter = self.on_enter
+        for agent in agents:
+            agent._enter_block(self)
+            if on_enter is not None:
+                on_enter(agent)
+        self.simulator.remove_agents(agents)
+        if self.keep_agents:
+            self._agents.extend(agents)
+            return
+        self._dropped_count += len(agents)
+        if self.pool is not None:
+            release = self.pool.release
+            for agent in agents:
+                release(agent)
 
     @property
     def count(self) -> int:
         """Convenience: return number of agents absorbed."""
-        return len(self._agents)
+        return len(self._agents) + self._dropped_count
@@ -1,9 +1,14 @@
 # blocks/source.py
 
-from typing import Type, Optional, List, Callable
+from bisect import bisect_left
+from typing import Type, Optional, List, Callable, Sequence
+
+import numpy as np
 
 from ..core.block import BaseBlock
 from ..core.agent import BaseAgent
+from ..core.pool import AgentPool
+from ..core.schedules import SpawnSchedule, Periodic
 from ..core.simulator import Simulator
 
 class SourceBlock(BaseBlock):
@@ -16,17 +21,45 @@ class SourceBlock(BaseBlock):
         self,
         simulator: Simulator,
         agent_class: Type[BaseAgent] = BaseAgent,
-        spawn_schedule: Callable[[int], int] = lambda tick: 1
+        spawn_schedule: Callable[[int], int] = lambda tick: 1,
+        spawn_array: Optional[Sequence[int]] = None,
+        precompute: bool = False,
+        pool: Optional[AgentPool] = None
     ):
         """
-        :param agent_class: Class to instantiate for each spawned agent.
+        :param agent_class: Class to instantiate for each spawned agent. If it provides a
+                            `_bulk_spawn(n) -> list` classmethod, that builds each tick's agents in one call.
         :param spawn_schedule: Function that takes current_tick and returns number of agents to spawn this tick.
-                               Default: spawns 1 agent per tick.
+                               Default: spawns 1 agent per tick. A SpawnSchedule (OneShot, Periodic, Burst)
+                               also tells the simulator which ticks spawn nothing, so it can skip them.
+        :param spawn_array: Precomputed spawn counts indexed by tick (list, tuple or NumPy array).
+                            Replaces spawn_schedule; ticks past its end spawn nothing.
+        :param precompute: Evaluate spawn_schedule once for every tick of the run and use the result as
+                           spawn_array. Only valid for schedules that depend on nothing but the tick.
+        :param pool: AgentPool to draw agents from — recycled ones first. Its agent_class replaces agent_class.
         """
         super().__init__(simulator)
         self.simulator = simulator
+        if pool is not None:
+            agent_class = pool.agent_class
         self.agent_class = agent_class
+        self.pool = pool
         self.spawn_schedule = spawn_schedule
+        if precompute:
+            if spawn_array is not None:
+                raise ValueError("SourceBlock: precompute replaces spawn_array, pass only one of them.")
+            spawn_array = np.fromiter(
+                (spawn_schedule(tick) for tick in range(simulator.max_ticks)),
+                dtype=np.int32, count=simulator.max_ticks
+            )
+        self.spawn_array = spawn_array
+        # Ticks with a non-zero count in spawn_array, ascending — built on first use
+        self._spawn_ticks: Optional[List[int]] = None
+        # Resolved once — a plain factory function has no _bulk_spawn
+        self._bulk_spawn: Callable[[int], List[BaseAgent]] = (
+            pool.acquire_many if pool is not None
+            else getattr(agent_class, "_bulk_spawn", None) or self._spawn_one_by_one
+        )
 
     def take(self, agent: BaseAgent) -> None:
         # SourceBlock doesn't accept incoming agents — ignore.
@@ -41,17 +74,51 @@ class SourceBlock(BaseBlock):
             return
 
         # Ask schedule how many agents to spawn THIS tick
-        count = self.spawn_schedule(self._simulator.current_tick)  # ← We need simulator reference
+        tick = self._simulator.current_tick  # ← We need simulator reference
+        if self.spawn_array is not None:
+            # Plain index into the precomputed counts — no Python call per tick
+            count = int(self.spawn_array[tick]) if tick < len(self.spawn_array) else 0
+        else:
+            count = self.spawn_schedule(tick)
 
-        for _ in range(count):
-            agent = self.agent_class()
-            self.simulator.add_agent(agent)
+        if not count:
+            return
+        agents = self._bulk_spawn(count)
+        self.simulator.add_agents(agents)
+        if count == 1:
+            agent = agents[0]
             agent._enter_block(self)
             self._eject(agent)
+            return
+        # Bursts go downstream as one batch — blocks with take_many() absorb it in bulk
+        on_exit = self.on_exit
+        for agent in agents:
+            agent._enter_block(self)
+            if on_exit is not None:
+                on_exit(agent)
+        target_block.take_many(agents)
+
+    def _next_active_tick(self, tick: int) -> int:
+        if self.spawn_array is not None:
+            # Next non-zero count, if any is left — a binary search, not a scan of the remaining ticks
+            spawn_ticks = self._spawn_ticks
+            if spawn_ticks is None:
+                spawn_ticks = self._spawn_ticks = np.flatnonzero(np.asarray(self.spawn_array)).tolist()
+            i = bisect_left(spawn_ticks, tick)
+            return spawn_ticks[i] if i < len(spawn_ticks) else self._simulator.max_ticks
+        if isinstance(self.spawn_schedule, SpawnSchedule):
+            next_tick = self.spawn_schedule.next_event_tick(tick)
+            return self._simulator.max_ticks if next_tick is None else next_tick
+        # An arbitrary function of the tick — ask it every tick
+        return tick
+
+    def _spawn_one_by_one(self, count: int) -> List[BaseAgent]:
+        agent_class = self.agent_class
+        return [agent_class() for _ in range(count)]
 
     @staticmethod
     def every_n_ticks(n: int, count: int = 1) -> Callable[[int], int]:
-        return lambda tick: count if tick % n == 0 else 0
+        return Periodic(n, count)
 
     @staticmethod
     def random_burst(p: float, burst_size: int) -> Callable[[int], int]:
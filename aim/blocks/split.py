@@ -26,6 +26,9 @@ class SplitBlock(BaseBlock):
         """Connect the second output (for children)."""
         self._second_output = block
 
+    def downstream_blocks(self) -> List[BaseBlock]:
+        return [block for block in (self._first_output, self._second_output) if block is not None]
+
     def take(self, agent: BaseAgent) -> None:
         """Split container into itself and its children."""
         agent._enter_block(self)
@@ -33,21 +36,23 @@ class SplitBlock(BaseBlock):
             self.on_enter(agent)
 
         if not hasattr(agent, 'children_agents') or not isinstance(agent.children_agents, list):
-            raise RuntimeError(f"Agent {id(agent)} has no children_agents list. Not a valid container.")
+            raise RuntimeError(f"Agent {agent.id} has no children_agents list. Not a valid container.")
 
         if self._second_output is None:
             raise RuntimeError("SplitBlock second output is not connected.")
         if self._first_output is None:
             raise RuntimeError("SplitBlock first output is not connected.")
 
-        # Eject children to second output
-        for child in agent.children_agents:
+        # Detach the children in one swap — the container is empty from here on
+        children = agent.children_agents
+        agent.children_agents = []
+        for child in children:
             if not hasattr(child, 'parent_agents'):
                 child.parent_agents = []
             if agent not in child.parent_agents:
                 child.parent_agents.append(agent)
-            self._second_output.take(child)
 
-        # Eject container (now empty) to first output
-        agent.children_agents.clear()
+        # Eject children to second output as one batch, then the container to first output
+        if children:
+            self._second_output.take_many(children)
         self._first_output.take(agent)
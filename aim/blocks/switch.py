@@ -1,8 +1,11 @@
-from typing import Any, Callable, Hashable, Dict, Optional
+from typing import Any, Callable, Hashable, Dict, List, Optional
 from aim.core.block import BaseBlock
 from aim.core.agent import BaseAgent
 from aim.core.simulator import Simulator
 
+_NOT_CONNECTED = object()
+
+
 class SwitchBlock(BaseBlock):
     """
     Routes agents to different output blocks based on a key function.
@@ -32,6 +35,9 @@ class SwitchBlock(BaseBlock):
         """
         self._output_map[key] = block
 
+    def downstream_blocks(self) -> List[BaseBlock]:
+        return [block for block in self._output_map.values() if block is not None]
+
     def take(self, agent: BaseAgent) -> None:
         """
         Route agent to output block based on key_func(agent).
@@ -44,13 +50,13 @@ class SwitchBlock(BaseBlock):
         try:
             key = self.key_func(agent)
         except Exception as e:
-            raise RuntimeError(f"SwitchBlock: key_func failed for agent {id(agent)}: {e}")
+            raise RuntimeError(f"SwitchBlock: key_func failed for agent {agent.id}: {e}")
 
-        if key not in self._output_map:
+        # One hash lookup — a missing key and a None output are told apart by the sentinel
+        target_block = self._output_map.get(key, _NOT_CONNECTED)
+        if target_block is _NOT_CONNECTED:
             print(f"SwitchBlock: no output connected for key: {key}")
             raise RuntimeError(f"SwitchBlock: no output connected for key: {key}")
-
-        target_block = self._output_map[key]
         if target_block is None:
             raise RuntimeError(f"SwitchBlock: output for key {key} is None")
 
@@ -2,10 +2,17 @@
 
 from .agent import BaseAgent
 from .block import BaseBlock
+from .pool import AgentPool
 from .simulator import Simulator
+from .schedules import SpawnSchedule, OneShot, Periodic, Burst
 
 __all__ = [
     'BaseAgent',
     'BaseBlock',
+    'AgentPool',
     'Simulator',
+    'SpawnSchedule',
+    'OneShot',
+    'Periodic',
+    'Burst',
 ]
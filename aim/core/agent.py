@@ -1,10 +1,15 @@
 # core/agent.py
 
+import itertools
 from typing import Dict, Any, Optional, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .block import BaseBlock
 
+# Burst size from which BaseAgent._bulk_spawn fills slots inline instead of calling __init__
+_INLINE_SPAWN_MIN = 64
+
+
 class BaseAgent:
     """
     Base class for all agents in the simulation.
@@ -12,7 +17,25 @@ class BaseAgent:
     Spatial state is managed by SpaceManager — stored in .space_state.
     """
 
+    # Fixed attribute layout for the core state __init__ sets. State that blocks attach to
+    # agents in flight (parent_agents, _acquired_resources, ...) and custom subclass fields
+    # live in __dict__, which is only allocated once something is stored there.
+    __slots__ = (
+        'id', 'width', 'length', 'space_state',
+        '_pending_events', '_emitted_events_this_tick', '_current_block',
+        '__dict__', '__weakref__',
+    )
+
+    # Shared by all agent classes — ids are unique across the whole run and never reused
+    _id_counter = itertools.count()
+
     def __init__(self):
+        # _bulk_spawn fills the same fields inline — keep the two in step
+        # (test_base_agent_bulk_spawn_matches_init checks every slot)
+
+        # Small monotonic id — unlike id(self), not recycled after garbage collection
+        self.id: int = next(BaseAgent._id_counter)
+
         # Spatial dimensions — default to 0.0 for non-spatial agents
         self.width: float = 0.0
         self.length: float = 0.0
@@ -28,6 +51,30 @@ class BaseAgent:
         # Current block — set by simulator
         self._current_block: Optional['BaseBlock'] = None
 
+    @classmethod
+    def _bulk_spawn(cls, n: int) -> List['BaseAgent']:
+        """
+        Internal: build n fresh agents for SourceBlock in one call.
+        Plain BaseAgent bursts skip the per-agent __init__ call and fill the slots inline;
+        subclasses may extend __init__, so they are still constructed one by one.
+        """
+        if cls is not BaseAgent or n < _INLINE_SPAWN_MIN:
+            return [cls() for _ in range(n)]
+        new = object.__new__
+        agents = []
+        append = agents.append
+        for agent_id in itertools.islice(BaseAgent._id_counter, n):
+            agent = new(cls)
+            agent.id = agent_id
+            agent.width = 0.0
+            agent.length = 0.0
+            agent.space_state = {}
+            agent._pending_events = []
+            agent._emitted_events_this_tick = []
+            agent._current_block = None
+            append(agent)
+        return agents
+
     def on_enter_block(self, block: 'BaseBlock') -> None:
         """Called when agent enters a block. Override to react."""
         pass
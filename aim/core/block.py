@@ -1,7 +1,7 @@
 # core/block.py
 
 from .agent import BaseAgent
-from typing import Optional, List, Callable, Tuple, TYPE_CHECKING
+from typing import Optional, List, Callable, Dict, Tuple, Type, TYPE_CHECKING
 from abc import ABC, abstractmethod
 
 if TYPE_CHECKING:
@@ -14,12 +14,20 @@ class BaseBlock(ABC):
     and route them to connected blocks based on internal logic or agent state.
     """
 
+    # False for blocks whose _tick has nothing to do while _is_idle() — the simulator then
+    # ticks them only after they call simulator._wake(self) on receiving work
+    _polled_while_idle = True
+
     def __init__(self, simulator: 'Simulator'):
         self._agents: List[BaseAgent] = []
         self.output_connections: List[Optional['BaseBlock']] = []
+        # Bound take() of output_connections[0], kept in step by connect() — one call per ejection
+        self._forward: Optional[Callable[[BaseAgent], None]] = None
         self._simulator = simulator
         self.on_enter: Optional[Callable[[BaseAgent], None]] = None
         self.on_exit: Optional[Callable[[BaseAgent], None]] = None
+        # Exact agent class -> on_enter callback, installed by on_enter_for()
+        self._on_enter_by_type: Optional[Dict[Type[BaseAgent], Callable[[BaseAgent], None]]] = None
 
         if simulator is not None:
             self._simulator = simulator
@@ -37,6 +45,32 @@ class BaseBlock(ABC):
         if self.on_enter is not None:
             self.on_enter(agent)
 
+    def take_many(self, agents: List[BaseAgent]) -> None:
+        """
+        Accept several agents at once, in order. Default: take() each one.
+        Blocks that can absorb a batch cheaper than agent by agent override this.
+        """
+        take = self.take
+        for agent in agents:
+            take(agent)
+
+    def on_enter_for(self, agent_type: Type[BaseAgent], callback: Callable[[BaseAgent], None]) -> None:
+        """
+        Register an on_enter callback for one exact agent class (subclasses are not matched).
+        Installs a dispatcher as on_enter: agents of other classes cost one dict lookup on
+        type(agent) instead of an isinstance() check inside the callback.
+        """
+        if self._on_enter_by_type is None:
+            callbacks = self._on_enter_by_type = {}
+
+            def dispatch(agent: BaseAgent) -> None:
+                handler = callbacks.get(type(agent))
+                if handler is not None:
+                    handler(agent)
+
+            self.on_enter = dispatch
+        self._on_enter_by_type[agent_type] = callback
+
     def connect(self, *blocks: 'BaseBlock') -> tuple['BaseBlock', ...]:
         """
         Connect this block to one or more output blocks.
@@ -44,8 +78,17 @@ class BaseBlock(ABC):
         Subclasses may override or add semantic meaning (e.g., IfBlock.connect_first/second).
         """
         self.output_connections.extend(blocks)
+        first = self.output_connections[0] if self.output_connections else None
+        self._forward = first.take if first is not None else None
         return blocks
 
+    def downstream_blocks(self) -> List['BaseBlock']:
+        """
+        Blocks this block can pass agents to — used by the simulator to order ticks upstream-first.
+        Default: the non-empty output_connections. Blocks that route through other attributes override this.
+        """
+        return [block for block in self.output_connections if block is not None]
+
     def _tick(self) -> None:
         """
         Internal method called by simulator each tick.
@@ -54,6 +97,17 @@ class BaseBlock(ABC):
         """
         pass
 
+    def _next_active_tick(self, tick: int) -> int:
+        """
+        First tick >= tick on which _tick may do something. The simulator skips the ticks in between
+        when no other component needs them. Default: tick itself — polled every tick.
+        """
+        return tick
+
+    def _is_idle(self) -> bool:
+        """Whether _tick would do nothing now. Only consulted when _polled_while_idle is False."""
+        return False
+
     def _eject(self, agent: BaseAgent) -> None:
         """
         Internal: call on_exit and push to next block.
@@ -62,8 +116,9 @@ class BaseBlock(ABC):
         if self.on_exit is not None:
             self.on_exit(agent)
 
-        if self.output_connections and self.output_connections[0]:
-            self.output_connections[0].take(agent)
+        forward = self._forward
+        if forward is not None:
+            forward(agent)
 
     def _eject_all(self) -> List['BaseAgent']:
         """
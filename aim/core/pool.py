@@ -0,0 +1,90 @@
+# core/pool.py
+
+from typing import Any, List, Optional, Type
+
+from .agent import BaseAgent
+
+
+def _slot_descriptors(agent_class: Type[BaseAgent]) -> List[Any]:
+    """
+    Slot descriptors declared anywhere along agent_class's MRO (BaseAgent's and subclasses' alike).
+    Cleared directly, so class attributes of subclasses that shadow a slot name cannot get in the way.
+    """
+    descriptors = []
+    for cls in agent_class.__mro__:
+        slots = cls.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name in ('__dict__', '__weakref__'):
+                continue
+            if name.startswith('__') and not name.endswith('__'):
+                name = f"_{cls.__name__.lstrip('_')}{name}"  # private names are stored mangled
+            descriptors.append(cls.__dict__[name])
+    return descriptors
+
+
+class AgentPool:
+    """
+    Free list of finished agents of one class, for reuse by a SourceBlock.
+    A SinkBlock given the same pool hands absorbed agents back instead of keeping them.
+    Released agents are rebuilt in place by re-running __init__, so an acquired agent
+    looks freshly constructed — including a new id.
+    """
+
+    def __init__(self, agent_class: Type[BaseAgent] = BaseAgent, max_size: Optional[int] = 4096):
+        """
+        :param agent_class: Class of pooled agents. Must be constructible without arguments.
+        :param max_size: Most agents kept for reuse; agents released beyond it are left to the
+                         garbage collector, so one large burst cannot pin its memory for the whole run.
+                         None keeps every released agent.
+        """
+        self.agent_class = agent_class
+        self.max_size = max_size
+        self._free: List[BaseAgent] = []
+        self._slots = _slot_descriptors(agent_class)
+
+    def acquire(self) -> BaseAgent:
+        """Return a recycled agent, or a new one if the free list is empty."""
+        if self._free:
+            return self._free.pop()
+        return self.agent_class()
+
+    def acquire_many(self, n: int) -> List[BaseAgent]:
+        """Return n agents — recycled first, the rest newly constructed."""
+        free = self._free
+        reused = min(n, len(free))
+        agents = free[len(free) - reused:]
+        del free[len(free) - reused:]
+        agent_class = self.agent_class
+        agents.extend(agent_class() for _ in range(n - reused))
+        return agents
+
+    def release(self, agent: BaseAgent) -> None:
+        """
+        Reset agent and put it on the free list.
+        The caller must drop every other reference to it — it will come back as a new agent.
+        """
+        if type(agent) is not self.agent_class:
+            raise ValueError(
+                f"AgentPool of {self.agent_class.__name__} cannot take a {type(agent).__name__}."
+            )
+        if self.max_size is not None and len(self._free) >= self.max_size:
+            return
+        # Forget everything the previous journey attached — every slot along the MRO, then __dict__
+        # with the fields blocks and subclasses stored there
+        for slot in self._slots:
+            try:
+                slot.__delete__(agent)
+            except AttributeError:
+                pass
+        instance_dict = getattr(agent, '__dict__', None)
+        if instance_dict is not None:
+            instance_dict.clear()
+        agent.__init__()
+        self._free.append(agent)
+
+    @property
+    def size(self) -> int:
+        """Number of agents waiting for reuse."""
+        return len(self._free)
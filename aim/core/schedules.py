@@ -0,0 +1,86 @@
+# core/schedules.py
+
+from typing import Optional
+
+
+class SpawnSchedule:
+    """
+    Spawn schedule with a closed form — usable anywhere a spawn_schedule callable is.
+    Besides the count for a tick it knows the next tick that spawns anything, so the
+    simulator can jump over the idle ticks in between.
+    """
+
+    __slots__ = ()
+
+    def count_at(self, tick: int) -> int:
+        """Number of agents to spawn at tick."""
+        raise NotImplementedError
+
+    def next_event_tick(self, tick: int) -> Optional[int]:
+        """First tick >= tick that spawns agents, or None if no tick does."""
+        raise NotImplementedError
+
+    def __call__(self, tick: int) -> int:
+        return self.count_at(tick)
+
+
+class OneShot(SpawnSchedule):
+    """Spawn count agents at a single tick."""
+
+    __slots__ = ('tick', 'count')
+
+    def __init__(self, tick: int, count: int = 1):
+        self.tick = tick
+        self.count = count
+
+    def count_at(self, tick: int) -> int:
+        return self.count if tick == self.tick else 0
+
+    def next_event_tick(self, tick: int) -> Optional[int]:
+        return self.tick if tick <= self.tick and self.count else None
+
+
+class Periodic(SpawnSchedule):
+    """Spawn count agents every period ticks, starting at offset."""
+
+    __slots__ = ('period', 'count', 'offset')
+
+    def __init__(self, period: int, count: int = 1, offset: int = 0):
+        if period <= 0:
+            raise ValueError("Periodic: period must be positive.")
+        self.period = period
+        self.count = count
+        self.offset = offset
+
+    def count_at(self, tick: int) -> int:
+        if tick < self.offset or (tick - self.offset) % self.period:
+            return 0
+        return self.count
+
+    def next_event_tick(self, tick: int) -> Optional[int]:
+        if not self.count:
+            return None
+        if tick <= self.offset:
+            return self.offset
+        # Round up to the next multiple of period past offset
+        return tick + (-(tick - self.offset)) % self.period
+
+
+class Burst(SpawnSchedule):
+    """Spawn count agents on every tick in [start, end)."""
+
+    __slots__ = ('start', 'end', 'count')
+
+    def __init__(self, start: int, end: int, count: int = 1):
+        self.start = start
+        self.end = end
+        self.count = count
+
+    def count_at(self, tick: int) -> int:
+        return self.count if self.start <= tick < self.end else 0
+
+    def next_event_tick(self, tick: int) -> Optional[int]:
+        if not self.count:
+            return None
+        tick = max(tick, self.start)
+        return tick if tick < self.end else None
@@ -2,6 +2,10 @@
 
 from typing import List, Dict, Callable, Any, Set, Optional
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import itertools
+import inspect
 import random
 
 from .agent import BaseAgent
@@ -19,15 +23,36 @@ class Simulator:
     def __init__(self,
                  max_ticks: int = 1000,
                  random_seed: int = 42,
-                 spaces: Optional[Dict[str, SpaceManager]] = {},
-                 viewer = None):
+                 spaces: Optional[Dict[str, SpaceManager]] = None,
+                 viewer = None,
+                 parallel: bool = False):
+        """
+        :param parallel: Update spaces concurrently, one worker thread per space.
+                         Only pays off when space updates release the GIL (NumPy kernels), and
+                         requires that no two spaces touch the same agents during update().
+        """
         self.max_ticks = max_ticks
         self.current_tick = 0
         self.random_seed = random_seed
         random.seed(self.random_seed)
-        self.spaces = spaces
+        # Own dict per simulator — a shared default would leak add_space() into every later one
+        self.spaces = spaces if spaces is not None else {}
+        self.parallel = parallel
+        # Created on first parallel tick — spaces may still be added after construction
+        self._space_pool: Optional[ThreadPoolExecutor] = None
+        self._space_pool_size = 0
 
         self.blocks: List[BaseBlock] = []
+        # Blocks that override _tick — purely event-driven blocks (e.g. DelayBlock) are never polled
+        self._ticking_blocks: List[BaseBlock] = []
+        # Tick schedule derived from _ticking_blocks — rebuilt when blocks are added or a run starts
+        self._schedule_stale = True
+        self._block_rank: Dict[BaseBlock, int] = {}
+        self._polled_ranks: List[int] = []
+        # Blocks that sleep while idle (e.g. an empty QueueBlock) are only ticked while in this set
+        self._awake: Set[BaseBlock] = set()
+        self._dispatch_heap: Optional[List[int]] = None
+        self._dispatch_rank = -1
         self.agents: List[BaseAgent] = []
         self.viewer = viewer
         self.event_processors: List[Any] = []
@@ -37,12 +62,24 @@ class Simulator:
         self._events_this_tick: List[str] = []
         self._scheduled_events: Dict[int, List[Any]] = defaultdict(list)
         self._event_scheduling_locked = False
+        # Ids of events still due to fire, and of cancelled ones whose bucket entries are not yet
+        # popped — cancelling marks an id instead of searching its bucket
+        self._event_ids = itertools.count()
+        self._live_events: Set[int] = set()
+        self._cancelled_events: Set[int] = set()
+        # Internal timer wheel for blocks (e.g. DelayBlock): tick -> callbacks in scheduling order.
+        # Unlike scheduled events, timers may be added while timers or events run
+        self._timers: Dict[int, List[Callable[[], None]]] = defaultdict(list)
+        self._timers_fired_tick = -1
 
 
     def add_block(self, block: BaseBlock) -> None:
         """Register a block and inject simulator reference."""
         block._simulator = self
         self.blocks.append(block)
+        if type(block)._tick is not BaseBlock._tick:
+            self._ticking_blocks.append(block)
+            self._schedule_stale = True
 
     def subscribe(self, agent: BaseAgent, event: str) -> None:
         """Subscribe agent to receive an event (exact match)."""
@@ -50,49 +87,118 @@ class Simulator:
 
     def schedule_event(
         self,
-        callback: Callable[[int], None],
+        callback: Callable[..., None],
         delay_ticks: int = 0,
         recurring: bool = False
-    ) -> None:
+    ) -> int:
         """
         Schedule a callback to be executed at `current_tick + delay_ticks`.
-        Callback receives `current_tick` as argument.
+        Callback receives `current_tick` as argument, unless it takes no parameters.
         If `recurring=True`, event will auto-reschedule itself every `delay_ticks`.
         Events cannot schedule new events during execution (runtime error if attempted).
+        Returns an id to pass to cancel_event().
         """
         if self._event_scheduling_locked:
             raise RuntimeError("Cannot schedule new events during event execution.")
 
+        # Decide call form once — recurring reschedules reuse it
+        try:
+            wants_tick = len(inspect.signature(callback).parameters) > 0
+        except (TypeError, ValueError):  # builtins without introspectable signature
+            wants_tick = True
+        return self._enqueue_event(callback, recurring, delay_ticks, wants_tick)
+
+    def cancel_event(self, event_id: int) -> bool:
+        """
+        Cancel a scheduled event — a recurring one stops for good. May be called from event callbacks.
+        Returns False if the event already fired or was cancelled before.
+        """
+        if event_id not in self._live_events:
+            return False
+        self._live_events.remove(event_id)
+        self._cancelled_events.add(event_id)
+        return True
+
+    def _enqueue_event(self, callback: Callable[..., None], recurring: bool,
+                       delay_ticks: int, wants_tick: bool) -> int:
+        event_id = next(self._event_ids)
+        self._live_events.add(event_id)
+        # Recurring events repeat at least one tick apart, even with delay_ticks=0
+        interval = max(delay_ticks, 1) if recurring else delay_ticks
         target_tick = self.current_tick + delay_ticks
-        self._scheduled_events[target_tick].append((callback, recurring, delay_ticks))
+        self._scheduled_events[target_tick].append((event_id, callback, recurring, interval, wants_tick))
+        return event_id
 
     def run(self) -> None:
         """Run simulation until max_ticks reached or manually stopped."""
-        for self.current_tick in (range(0, self.max_ticks)):
-            self.tick()
-            if self.max_ticks == 0:  # manual stop
-                break
+        self._run(self.tick)
+
+    def run_fast(self) -> None:
+        """
+        Like run(), but each tick does only the core work: scheduled events, timers, spaces and blocks.
+        No viewer rendering, event processors or agent-event collection — events agents emit are
+        never delivered. For batch runs that use none of them; raises RuntimeError if any is set up.
+        """
+        if self.viewer is not None or self.event_processors or self._event_subscriptions:
+            raise RuntimeError("run_fast() skips viewers, event processors and agent events — use run().")
+        self._run(self._tick_core)
+
+    def _run(self, step: Callable[[], None]) -> None:
+        """Drive step() over the ticks until max_ticks reached or manually stopped."""
+        # Connections are made after blocks register — order ticks by them now
+        self._schedule_stale = True
+        try:
+            tick = 0
+            while tick < self.max_ticks:
+                self.current_tick = tick
+                step()
+                if self.max_ticks == 0:  # manual stop
+                    break
+                tick = self._next_tick(tick + 1)
+            else:
+                # Skipped idle ticks still count as run
+                self.current_tick = max(self.current_tick, self.max_ticks - 1)
+        finally:
+            self._shutdown_space_pool()
+
+    def _next_tick(self, tick: int) -> int:
+        """
+        The next tick that can change anything, from tick on. Jumps past idle ticks only when nothing
+        needs every tick: no viewer, spaces or event processors, no awake blocks or undelivered agent
+        events, and every polled block can say when it next has work (e.g. a SourceBlock on a SpawnSchedule).
+        """
+        if (self.viewer is not None or self.spaces or self.event_processors
+                or self._awake or self._pending_events):
+            return tick
+        next_tick = self.max_ticks
+        ticking_blocks = self._ticking_blocks
+        for rank in self._polled_ranks:
+            block_tick = ticking_blocks[rank]._next_active_tick(tick)
+            if block_tick <= tick:
+                return tick
+            next_tick = min(next_tick, block_tick)
+        for pending in (self._scheduled_events, self._timers):
+            for due_tick, entries in pending.items():
+                if entries and tick <= due_tick < next_tick:
+                    next_tick = due_tick
+        return next_tick
 
     def tick(self) -> None:
         """
         Execute one simulation tick in this order:
-        1. Execute scheduled events (callbacks).
+        1. Execute scheduled events (callbacks), then due block timers.
         2. Update all spaces (move agents, check collisions).
         3. Deliver pending agent events (from last tick).
-        4. Advance all blocks (call ._tick()).
+        4. Advance all blocks that poll (call ._tick()); the rest act only on take() and scheduled events.
         5. Collect new agent-emitted events (for delivery next tick).
         """
         self._process_scheduled_events()
-
-        # Update all spaces — move agents, check collisions
-        if self.spaces:
-            for space_name, space in self.spaces.items():
-                space.update(delta_time=1.0)
+        self._fire_timers()
+        self._update_spaces()
 
         self._deliver_pending_events()
 
-        for block in self.blocks:
-            block._tick()
+        self._tick_blocks()
         for processor in self.event_processors:
             if hasattr(processor, '_tick'):
                 processor._tick()
@@ -104,28 +210,191 @@ class Simulator:
                 self.viewer.render_tick(self.current_tick)
 
 
+    def _tick_core(self) -> None:
+        """One tick for run_fast(): tick() without agent events, event processors and viewer."""
+        self._process_scheduled_events()
+        self._fire_timers()
+        self._update_spaces()
+        self._tick_blocks()
+
+    def _update_spaces(self) -> None:
+        """Update all spaces — move agents, check collisions."""
+        if self.spaces:
+            if self.parallel and len(self.spaces) > 1:
+                self._update_spaces_parallel()
+            else:
+                for space_name, space in self.spaces.items():
+                    space.update(delta_time=1.0)
+
+    def _prepare_schedule(self) -> None:
+        """Sort ticking blocks topologically and split them into always-polled and sleeping ones."""
+        self._ticking_blocks = self._topological_order(self._ticking_blocks)
+        self._block_rank = {block: rank for rank, block in enumerate(self._ticking_blocks)}
+        self._polled_ranks = [
+            rank for rank, block in enumerate(self._ticking_blocks) if block._polled_while_idle
+        ]
+        self._schedule_stale = False
+
+    def _tick_blocks(self) -> None:
+        """
+        Tick the always-polled blocks plus the awake ones, upstream-first.
+        A block woken mid-pass that sits downstream of the current one is still ticked this pass.
+        """
+        if self._schedule_stale:
+            self._prepare_schedule()
+        ticking_blocks = self._ticking_blocks
+        awake = self._awake
+        if awake:
+            rank = self._block_rank
+            heap = self._polled_ranks + [rank[block] for block in awake]
+            heapq.heapify(heap)
+        else:
+            heap = self._polled_ranks[:]  # already sorted — a valid heap
+        self._dispatch_heap = heap
+        try:
+            while heap:
+                self._dispatch_rank = heapq.heappop(heap)
+                block = ticking_blocks[self._dispatch_rank]
+                block._tick()
+                if not block._polled_while_idle and block._is_idle():
+                    awake.discard(block)
+        finally:
+            self._dispatch_heap = None
+            self._dispatch_rank = -1
+
+    def _wake(self, block: BaseBlock) -> None:
+        """Called by sleeping blocks when they receive work — ticked from now until idle again."""
+        if block in self._awake:
+            return
+        self._awake.add(block)
+        heap = self._dispatch_heap
+        if heap is not None:
+            rank = self._block_rank.get(block)
+            # Upstream of the block ticking now — its turn this tick has passed
+            if rank is not None and rank > self._dispatch_rank:
+                heapq.heappush(heap, rank)
+
+    def _topological_order(self, ticking_blocks: List[BaseBlock]) -> List[BaseBlock]:
+        """
+        Order ticking_blocks upstream-first along block connections (Kahn's algorithm), so an agent
+        a block ejects this tick reaches downstream blocks before they tick.
+        Ties keep registration order; blocks on a cycle follow in registration order.
+        """
+        index = {block: i for i, block in enumerate(self.blocks)}
+        successors: List[List[int]] = [[] for _ in self.blocks]
+        in_degree = [0] * len(self.blocks)
+        for i, block in enumerate(self.blocks):
+            for target in block.downstream_blocks():
+                # Input ports (e.g. CombineBlock.container) stand for the block they feed
+                j = index.get(getattr(target, 'parent', target))
+                if j is not None and j != i:
+                    successors[i].append(j)
+                    in_degree[j] += 1
+
+        # Heap of registration indices — among ready blocks the earliest registered goes first
+        ready = [i for i, degree in enumerate(in_degree) if degree == 0]
+        rank = {}
+        while ready:
+            i = heapq.heappop(ready)
+            rank[self.blocks[i]] = len(rank)
+            for j in successors[i]:
+                in_degree[j] -= 1
+                if in_degree[j] == 0:
+                    heapq.heappush(ready, j)
+        unranked = len(rank)
+        return sorted(ticking_blocks, key=lambda block: rank.get(block, unranked + index[block]))
+
+    def _update_spaces_parallel(self) -> None:
+        """Run every space's update() on its own worker thread and wait for all of them."""
+        spaces = list(self.spaces.values())
+        pool = self._space_pool
+        if pool is None or self._space_pool_size < len(spaces):
+            self._shutdown_space_pool()
+            pool = self._space_pool = ThreadPoolExecutor(
+                max_workers=len(spaces), thread_name_prefix="aim-space")
+            self._space_pool_size = len(spaces)
+        # list() drains the iterator so that a worker's exception is raised here
+        list(pool.map(lambda space: space.update(delta_time=1.0), spaces))
+
+    def _shutdown_space_pool(self) -> None:
+        if self._space_pool is not None:
+            self._space_pool.shutdown(wait=True)
+            self._space_pool = None
+
     def _process_scheduled_events(self) -> None:
+        # Events live in per-tick buckets — this tick's are one dict pop, no scan or heap needed
         events = self._scheduled_events.pop(self.current_tick, [])
         if not events:
             return
 
-        shuffled_events = events[:]
-        random.shuffle(shuffled_events)
-
+        # The popped list belongs to this tick alone — shuffle it in place
+        random.shuffle(events)
+
+        current_tick = self.current_tick
+        cancelled = self._cancelled_events
+        discard_live = self._live_events.discard
+        # Recurring events are compacted to the front of the popped list as they run,
+        # so the list itself can become a later bucket instead of being rebuilt one append at a time.
+        # Everything the loop touches is a local; cancellation costs one truth test while none is pending
+        kept = 0
+        common_interval = 0  # shared by all kept events, until mixed_intervals
+        mixed_intervals = False
         self._event_scheduling_locked = True
-        reschedule_queue = []
         try:
-            for callback, recurring, interval in shuffled_events:
-                callback(self.current_tick)
-                if recurring:
-                    # If interval is 0, use 1 to avoid scheduling in same tick
-                    delay = interval if interval > 0 else 1
-                    reschedule_queue.append((callback, delay))
+            for event in events:
+                event_id, callback, recurring, interval, wants_tick = event
+                if cancelled and event_id in cancelled:
+                    cancelled.remove(event_id)
+                    continue
+                if wants_tick:
+                    callback(current_tick)
+                else:
+                    callback()
+                if not recurring:
+                    discard_live(event_id)
+                elif cancelled and event_id in cancelled:  # cancelled by its own callback
+                    cancelled.remove(event_id)
+                else:
+                    events[kept] = event
+                    kept += 1
+                    if interval != common_interval:
+                        mixed_intervals = common_interval != 0
+                        common_interval = interval
         finally:
             self._event_scheduling_locked = False
+        del events[kept:]
+        if not events:
+            return
 
-        for callback, delay in reschedule_queue:
-            self.schedule_event(callback, delay_ticks=delay, recurring=True)
+        buckets = self._scheduled_events
+        if not mixed_intervals:
+            target_tick = current_tick + common_interval
+            if buckets.get(target_tick):
+                buckets[target_tick].extend(events)
+            else:
+                buckets[target_tick] = events
+            return
+        for event in events:
+            buckets[current_tick + event[3]].append(event)
+
+    def _add_timer(self, delay_ticks: int, callback: Callable[[], None]) -> None:
+        """
+        Internal: call callback() delay_ticks from now, without the signature check and shuffle of
+        schedule_event. A timer due in a tick whose timers already fired runs next tick.
+        """
+        target_tick = max(self.current_tick + delay_ticks, self._timers_fired_tick + 1)
+        self._timers[target_tick].append(callback)
+
+    def _fire_timers(self) -> None:
+        """Run the timers due this tick — including zero-delay ones they add — in scheduling order."""
+        timers = self._timers
+        tick = self.current_tick
+        due = timers.pop(tick, None)
+        while due:
+            for callback in due:
+                callback()
+            due = timers.pop(tick, None)
+        self._timers_fired_tick = tick
 
     def _deliver_pending_events(self) -> None:
         """Deliver staged events to agents and trigger on_event."""
@@ -178,10 +447,26 @@ class Simulator:
         """Manually add an agent to simulation."""
         self.agents.append(agent)
 
+    def add_agents(self, agents: List[BaseAgent]) -> None:
+        """Manually add several agents to simulation at once."""
+        self.agents.extend(agents)
+
     def remove_agent(self, agent: BaseAgent) -> None:
         """Manually remove an agent from simulation."""
         self.agents.remove(agent)
 
+    def remove_agents(self, agents: List[BaseAgent]) -> None:
+        """Remove several agents from simulation in one pass. Agents not in the simulation are ignored."""
+        if not agents:
+            return
+        if len(agents) == 1:
+            if agents[0] in self.agents:
+                self.agents.remove(agents[0])
+            return
+        gone = set(agents)
+        # In place — holders of self.agents keep seeing the live list
+        self.agents[:] = [agent for agent in self.agents if agent not in gone]
+
     def add_space(self, name: str, space: SpaceManager) -> None:
         """
         Register a named space.
@@ -8,7 +8,8 @@ class SpatialEntity(Protocol):
     Protocol for any object that can exist in a SpaceManager.
     Not a base class — just a duck-typed interface.
     """
-    pass
+    # Empty so that slotted entities (e.g. Conveyor) stay free of a per-instance __dict__
+    __slots__ = ()
 
 class SpaceManager:
     """
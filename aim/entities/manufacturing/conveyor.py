@@ -1,6 +1,8 @@
 # entities/manufacturing/conveyor.py
 
+from bisect import bisect_left
 from typing import List, Tuple, Any
+import numpy as np
 from aim.core.space import SpatialEntity
 
 Point3D = Tuple[float, float, float]
@@ -11,29 +13,44 @@ class Conveyor(SpatialEntity):
     Agents move along it at a fixed speed.
     """
 
+    __slots__ = (
+        'points', 'speed', 'name', 'connections',
+        '_segment_lengths', '_cumulative', '_total_length',
+        '_points_array', '_segment_deltas', '_cumulative_lengths',
+        '__weakref__',
+    )
+
     def __init__(self, points: List[Point3D], speed: float = 1.0, name: str = ""):
         if len(points) < 2:
             raise ValueError("Conveyor must have at least 2 points.")
-        self.points = points
+        # Tuples, so positions handed out from the path never alias a caller's mutable list
+        self.points = [tuple(point) for point in points]
+        points = self.points
         self.speed = speed
         self.name = name
         self.connections: List['SpatialEntity'] = []  # Connected entities (conveyors, turntables, etc.)
-        self._total_length = None
+
+        # Path geometry is fixed — segment lengths and arc-length prefix sums are computed once.
+        # Python floats for scalar lookups, accumulated in path order so results match a running sum
+        self._segment_lengths: List[float] = []
+        self._cumulative: List[float] = [0.0]
+        for p1, p2 in zip(points, points[1:]):
+            seg_len = (
+                (p2[0] - p1[0])**2 +
+                (p2[1] - p1[1])**2 +
+                (p2[2] - p1[2])**2
+            ) ** 0.5
+            self._segment_lengths.append(seg_len)
+            self._cumulative.append(self._cumulative[-1] + seg_len)
+        self._total_length: float = self._cumulative[-1]
+
+        # Array copies for batched position queries
+        self._points_array = np.asarray(points, dtype=np.float64)
+        self._segment_deltas = np.diff(self._points_array, axis=0)
+        self._cumulative_lengths = np.asarray(self._cumulative)
 
     def get_total_length(self) -> float:
-        """Calculate total length of the conveyor path."""
-        if self._total_length is None:
-            total = 0.0
-            for i in range(len(self.points) - 1):
-                p1 = self.points[i]
-                p2 = self.points[i + 1]
-                seg_len = (
-                    (p2[0] - p1[0])**2 +
-                    (p2[1] - p1[1])**2 +
-                    (p2[2] - p1[2])**2
-                ) ** 0.5
-                total += seg_len
-                self._total_length = total
+        """Total length of the conveyor path."""
         return self._total_length
 
     def get_position_at_progress(self, progress: float) -> Point3D:
@@ -43,32 +60,43 @@ class Conveyor(SpatialEntity):
         if progress >= 1.0:
             return self.points[-1]
 
-        total_length = self.get_total_length()
+        total_length = self._total_length
         if total_length == 0:
             return self.points[0]
 
+        # First segment whose end reaches the target distance — binary search over the prefix sums
         target_distance = progress * total_length
-        accumulated = 0.0
+        end = bisect_left(self._cumulative, target_distance, 1)
+        if end == len(self._cumulative):
+            return self.points[-1]
 
-        for i in range(len(self.points) - 1):
-            p1 = self.points[i]
-            p2 = self.points[i + 1]
-            seg_len = (
-                (p2[0] - p1[0])**2 +
-                (p2[1] - p1[1])**2 +
-                (p2[2] - p1[2])**2
-            ) ** 0.5
+        i = end - 1
+        p1 = self.points[i]
+        p2 = self.points[end]
+        local_progress = (target_distance - self._cumulative[i]) / self._segment_lengths[i]
+        return (
+            p1[0] + local_progress * (p2[0] - p1[0]),
+            p1[1] + local_progress * (p2[1] - p1[1]),
+            p1[2] + local_progress * (p2[2] - p1[2]),
+        )
 
-            if accumulated + seg_len >= target_distance:
-                local_progress = (target_distance - accumulated) / seg_len
-                return (
-                    p1[0] + local_progress * (p2[0] - p1[0]),
-                    p1[1] + local_progress * (p2[1] - p1[1]),
-                    p1[2] + local_progress * (p2[2] - p1[2]),
-                )
-            accumulated += seg_len
+    def get_positions_at_progress(self, progress: np.ndarray) -> np.ndarray:
+        """
+        Batched get_position_at_progress: map an (N,) array of progress values
+        to an (N, 3) array of positions using one interpolation pass.
+        """
+        points = self._points_array
+        cumulative = self._cumulative_lengths
+        total_length = self._total_length
+        progress = np.asarray(progress, dtype=np.float64)
+        if total_length == 0:
+            return np.repeat(points[:1], len(progress), axis=0)
 
-        return self.points[-1]
+        target = np.clip(progress, 0.0, 1.0) * total_length
+        seg = np.clip(np.searchsorted(cumulative, target, side='left') - 1, 0, len(points) - 2)
+        seg_len = cumulative[seg + 1] - cumulative[seg]
+        local = np.divide(target - cumulative[seg], seg_len, out=np.zeros_like(target), where=seg_len > 0)
+        return points[seg] + local[:, None] * self._segment_deltas[seg]
 
     def __lt__(self, other: Any) -> bool:
         """
@@ -5,6 +5,13 @@ class ResourceAgent(BaseAgent):
     """
     Agent representing a resource that can be seized or released by other agents.
     """
+
+    # Resource fields in slots like BaseAgent's core state — the inherited __dict__ stays unallocated
+    __slots__ = (
+        'resource_id', 'resource_type', 'properties', 'is_available',
+        'occupied_by', 'occupied_since_tick', 'moving_to_task', 'task_location',
+    )
+
     def __init__(self, resource_id: str, resource_type: str = "default", properties: Optional[Dict[str, Any]] = None):
         super().__init__()
         self.resource_id = resource_id
@@ -1,4 +1,8 @@
-from typing import List, Optional, Callable, Dict, Any
+from collections import deque
+from typing import Deque, List, Optional, Callable, Dict, Any, Sequence
+
+import numpy as np
+
 from aim.core.simulator import Simulator
 from .resource_agent import ResourceAgent
 
@@ -26,9 +30,12 @@ class ResourcePool:
         self.on_acquire = on_acquire
         self.on_release = on_release
 
-        # Lists of available and occupied resources
-        self.available_resources: List[ResourceAgent] = []
-        self.occupied_resources: List[ResourceAgent] = []
+        # Available resources in FIFO order, and occupied ones as an insertion-ordered set —
+        # seizing pops from the left and releasing drops a key, both O(1)
+        self.available_resources: Deque[ResourceAgent] = deque()
+        self.occupied_resources: Dict[ResourceAgent, None] = {}
+        # Blocks stalled until a resource frees up — woken instead of retrying every tick
+        self._waiters: Dict[Any, None] = {}
 
         # Add initial resources if provided
         if initial_resources:
@@ -37,7 +44,7 @@ class ResourcePool:
                     self.available_resources.append(resource)
                     simulator.add_agent(resource)
                 else:
-                    self.occupied_resources.append(resource)
+                    self.occupied_resources[resource] = None
                     simulator.add_agent(resource)
 
     def add_resource(self, resource: ResourceAgent) -> None:
@@ -46,10 +53,27 @@ class ResourcePool:
         """
         if resource.is_available:
             self.available_resources.append(resource)
+            self._notify_waiters()
         else:
-            self.occupied_resources.append(resource)
+            self.occupied_resources[resource] = None
         self.simulator.add_agent(resource)
 
+    def bulk_set_positions(self, positions: np.ndarray, keys: Sequence[str] = ("position",)) -> None:
+        """
+        Place all available resources at once — row i goes to available_resources[i].
+        :param positions: (N, 3) array, N equal to the number of available resources.
+        :param keys: space_state keys that receive each position.
+        """
+        positions = np.asarray(positions, dtype=float)
+        if positions.shape != (len(self.available_resources), 3):
+            raise ValueError(
+                f"Expected positions of shape ({len(self.available_resources)}, 3), got {positions.shape}"
+            )
+        # One conversion to Python floats for the whole array
+        for resource, position in zip(self.available_resources, map(tuple, positions.tolist())):
+            for key in keys:
+                resource.space_state[key] = position
+
     def seize_resources(self, count: int = 1) -> List[ResourceAgent]:
         """
         Attempt to seize resources.
@@ -61,14 +85,11 @@ class ResourcePool:
         if len(self.available_resources) < count:
             return []
 
-        # Take first available resources
-        selected_resources = self.available_resources[:count]
-
-        # Move selected resources from available to occupied
+        # Move the first available resources from available to occupied
         seized_resources = []
-        for resource in selected_resources:
-            self.available_resources.remove(resource)
-            self.occupied_resources.append(resource)
+        for _ in range(count):
+            resource = self.available_resources.popleft()
+            self.occupied_resources[resource] = None
 
             # Execute on_acquire callback if provided
             if self.on_acquire:
@@ -97,13 +118,33 @@ class ResourcePool:
                 resource.occupied_by = None
                 resource.occupied_since_tick = None
 
-                self.occupied_resources.remove(resource)
+                del self.occupied_resources[resource]
                 self.available_resources.append(resource)
 
                 released_count += 1
 
+        if released_count:
+            self._notify_waiters()
         return released_count
 
+    def _add_waiter(self, block: Any) -> None:
+        """
+        Internal: stall block (a QueueBlock whose agent could not seize) until resources are freed.
+        """
+        block._stall()
+        self._waiters[block] = None
+
+    def _notify_waiters(self) -> None:
+        """
+        Internal: wake every stalled block so it retries. Blocks that still come up short stall again.
+        """
+        if not self._waiters:
+            return
+        waiters = list(self._waiters)
+        self._waiters.clear()
+        for block in waiters:
+            block._unstall()
+
     def get_available_count(self) -> int:
         """
         Get the number of available resources.
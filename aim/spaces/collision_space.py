@@ -1,4 +1,7 @@
 from typing import Dict, Any, List, Optional, Set, Tuple
+
+import numpy as np
+
 from aim.core.space import SpaceManager
 from aim.core.agent import BaseAgent
 
@@ -16,6 +19,12 @@ class CollisionSpace(SpaceManager):
     Supports agent paths.
     """
 
+    # From this many obstacles on, segment queries first cull obstacles by XY bounding box in one
+    # NumPy pass; below it the plain loop is cheaper than the array setup
+    _BROADPHASE_MIN_OBSTACLES = 4
+    # Bounding boxes are widened by this much so rounding in the exact test never loses a touching hit
+    _BROADPHASE_MARGIN = 1e-6
+
     def __init__(self, obstacles: Optional[List[Prism]] = None, strict_collision_checking: bool = False):
         # Agent -> current position
         self._agent_position: Dict[BaseAgent, Point3D] = {}
@@ -27,8 +36,15 @@ class CollisionSpace(SpaceManager):
         self._agent_path: Dict[BaseAgent, Path] = {}
         # List of obstacles in the space
         self._obstacles: List[Prism] = obstacles or []
+        # Bumped on every _obstacles mutation — lets viewers cache the obstacle list
+        self._obstacles_version = 0
         # Whether to throw an error when a path intersects an obstacle
         self._strict_collision_checking = strict_collision_checking
+        # Obstacles packed into padded arrays for the batched queries, rebuilt when the version moves
+        self._packed_obstacles = None
+        self._packed_obstacles_version = -1
+        # Per-obstacle XY bounding box (min_x, min_y, max_x, max_y), rebuilt with the packed arrays
+        self._obstacle_bounds: Optional[Tuple[np.ndarray, ...]] = None
 
     def register(self, agent: BaseAgent, initial_state: Dict[str, Any]) -> bool:
         """
@@ -85,6 +101,7 @@ class CollisionSpace(SpaceManager):
         Add an obstacle to the space.
         """
         self._obstacles.append(obstacle)
+        self._obstacles_version += 1
 
     def remove_obstacle(self, obstacle: Prism) -> bool:
         """
@@ -92,6 +109,7 @@ class CollisionSpace(SpaceManager):
         """
         if obstacle in self._obstacles:
             self._obstacles.remove(obstacle)
+            self._obstacles_version += 1
             return True
         return False
 
@@ -115,7 +133,20 @@ class CollisionSpace(SpaceManager):
         Advance all agents by delta_time.
         Move agents toward target at constant speed avoiding obstacles.
         """
-        for agent in list(self._agent_position.keys()):
+        agents = list(self._agent_position.keys())
+        if self._strict_collision_checking and agents:
+            # One batched intersection test for every agent's next segment — each agent's segment
+            # depends only on its own state, so testing before anyone moves gives the same answers
+            next_points = []
+            for agent in agents:
+                path = self._agent_path[agent]
+                next_points.append(path[0] if path else self._agent_target[agent])
+            blocked = self.segments_intersect_batch(
+                [self._agent_position[agent] for agent in agents], next_points).tolist()
+        else:
+            blocked = [False] * len(agents)
+
+        for agent, is_blocked in zip(agents, blocked):
             state = agent.space_state
             if not state:
                 continue
@@ -131,9 +162,8 @@ class CollisionSpace(SpaceManager):
                 next_waypoint = path[0]
 
                 # If strict collision checking is enabled, check if the path to the next waypoint intersects an obstacle
-                if self._strict_collision_checking:
-                    if self._line_intersects_obstacle(current_pos, next_waypoint):
-                        raise RuntimeError(f"Agent path intersects obstacle between {current_pos} and {next_waypoint}")
+                if is_blocked:
+                    raise RuntimeError(f"Agent path intersects obstacle between {current_pos} and {next_waypoint}")
 
                 # Compute direction to next waypoint
                 dx = next_waypoint[0] - current_pos[0]
@@ -163,9 +193,8 @@ class CollisionSpace(SpaceManager):
                     )
             else:
                 # If strict collision checking is enabled for direct movement, check if the direct path intersects an obstacle
-                if self._strict_collision_checking:
-                    if self._line_intersects_obstacle(current_pos, target_pos):
-                        raise RuntimeError(f"Direct agent path intersects obstacle between {current_pos} and {target_pos}")
+                if is_blocked:
+                    raise RuntimeError(f"Direct agent path intersects obstacle between {current_pos} and {target_pos}")
 
                 # Move directly toward target
                 dx = target_pos[0] - current_pos[0]
@@ -233,6 +262,106 @@ class CollisionSpace(SpaceManager):
                 return True
         return False
 
+    def contains_point_batch(self, points: np.ndarray) -> np.ndarray:
+        """
+        Vectorized _is_inside_obstacle — tests every point against every obstacle at once.
+        :param points: (M, 3) array of points.
+        :return: (M,) boolean array, True where the point lies inside any obstacle.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        if not self._obstacles:
+            return np.zeros(len(points), dtype=bool)
+        starts, ends, valid, min_z, heights = self._get_packed_obstacles()
+
+        # (M, 1, 1) against (n_obstacles, max_vertices) edges
+        x = points[:, 0, None, None]
+        y = points[:, 1, None, None]
+        p1x, p1y = starts[..., 0], starts[..., 1]
+        p2x, p2y = ends[..., 0], ends[..., 1]
+
+        # Same ray casting as _point_in_prism; horizontal edges never pass the y tests
+        with np.errstate(divide='ignore', invalid='ignore'):
+            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+        crossings = (valid
+                     & (y > np.minimum(p1y, p2y))
+                     & (y <= np.maximum(p1y, p2y))
+                     & (x <= np.maximum(p1x, p2x))
+                     & ((p1x == p2x) | (x <= xinters)))
+        inside_base = np.logical_xor.reduce(crossings, axis=2)
+
+        pz = points[:, 2, None]
+        within_height = (min_z <= pz) & (pz <= min_z + heights)
+        return (inside_base & within_height).any(axis=1)
+
+    def segments_intersect_batch(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        Vectorized _line_intersects_obstacle — tests N segments against every obstacle edge at once.
+        :param starts: (N, 3) segment start points.
+        :param ends: (N, 3) segment end points.
+        :return: (N,) boolean array, True where the segment intersects any obstacle.
+        """
+        p1 = np.asarray(starts, dtype=float).reshape(-1, 3)
+        p2 = np.asarray(ends, dtype=float).reshape(-1, 3)
+        if not self._obstacles:
+            return np.zeros(len(p1), dtype=bool)
+        edge_starts, edge_ends, valid, min_z, heights = self._get_packed_obstacles()
+        max_z = min_z + heights
+
+        # Same tests as _line_intersects_prism: segment spans the prism's Z range, and its midpoint lies in it
+        z1 = p1[:, 2, None]
+        z2 = p2[:, 2, None]
+        avg_z = (z1 + z2) / 2
+        within_height = ((((z1 <= max_z) & (z2 >= min_z)) | ((z2 <= max_z) & (z1 >= min_z)))
+                         & (min_z <= avg_z) & (avg_z <= max_z))
+
+        # Same arithmetic as _lines_intersect, broadcast (N, 1, 1) against (n_obstacles, max_vertices) edges
+        x1, y1 = p1[:, 0, None, None], p1[:, 1, None, None]
+        x2, y2 = p2[:, 0, None, None], p2[:, 1, None, None]
+        x3, y3 = edge_starts[..., 0], edge_starts[..., 1]
+        x4, y4 = edge_ends[..., 0], edge_ends[..., 1]
+        den = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
+        t_num = (x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)
+        u_num = -((x1 - x2) * (y1 - y3) - (y1 - y2) * (x1 - x3))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = t_num / den
+            u = u_num / den
+        crossings = valid & (np.abs(den) >= 1e-9) & (0 <= t) & (t <= 1) & (0 <= u) & (u <= 1)
+
+        return (crossings.any(axis=2) & within_height).any(axis=1)
+
+    def _get_packed_obstacles(self) -> Tuple[np.ndarray, ...]:
+        """
+        Obstacles as padded arrays: edge starts and ends (n, max_vertices, 2), edge mask (n, max_vertices),
+        base z and height (n,).
+        """
+        if self._packed_obstacles_version != self._obstacles_version or self._packed_obstacles is None:
+            n = len(self._obstacles)
+            max_vertices = max(len(base_points) for base_points, _ in self._obstacles)
+            starts = np.zeros((n, max_vertices, 2))
+            ends = np.zeros((n, max_vertices, 2))
+            valid = np.zeros((n, max_vertices), dtype=bool)
+            min_z = np.full(n, np.inf)
+            heights = np.zeros(n)
+            # Empty bases get an inverted box that overlaps nothing
+            bounds_min = np.full((n, 2), np.inf)
+            bounds_max = np.full((n, 2), -np.inf)
+            for i, (base_points, height) in enumerate(self._obstacles):
+                k = len(base_points)
+                heights[i] = height
+                if not k:
+                    continue
+                base = np.asarray(base_points, dtype=float)
+                starts[i, :k] = base[:, :2]
+                ends[i, :k] = np.roll(base[:, :2], -1, axis=0)
+                valid[i, :k] = True
+                min_z[i] = base[:, 2].min()
+                bounds_min[i] = base[:, :2].min(axis=0)
+                bounds_max[i] = base[:, :2].max(axis=0)
+            self._packed_obstacles = (starts, ends, valid, min_z, heights)
+            self._obstacle_bounds = (bounds_min[:, 0], bounds_min[:, 1], bounds_max[:, 0], bounds_max[:, 1])
+            self._packed_obstacles_version = self._obstacles_version
+        return self._packed_obstacles
+
     def _point_in_prism(self, point: Point3D, base_points: List[Point3D], height: float) -> bool:
         """
         Check if a 3D point is inside a prism defined by base points and height.
@@ -335,7 +464,7 @@ class CollisionSpace(SpaceManager):
         Return the first obstacle that intersects the line between start and end points.
         """
         obstacles = []
-        for obstacle in self._obstacles:
+        for obstacle in self._candidate_obstacles(start, end):
             if self._line_intersects_prism(start, end, obstacle[0], obstacle[1]):
                 obstacles.append(obstacle)
         if len(obstacles) == 0:
@@ -466,27 +595,7 @@ class CollisionSpace(SpaceManager):
             (step_size, -step_size, 0)   # Northeast
         ]
 
-        start_x, start_y, start_z = start
-        best_detour = None
-        min_distance_to_target = float('inf')
-
-        # Check each direction
-        for dx, dy, dz in directions:
-            candidate_point = (start_x + dx, start_y + dy, start_z + dz)
-
-            # Check if the candidate point is not inside the obstacle
-            if not self._is_inside_obstacle(candidate_point):
-                # Check if the path from start to this candidate doesn't intersect the same obstacle
-                if not self._line_intersects_obstacle(start, candidate_point):
-                    # Calculate distance to target
-                    dist_to_target = ((candidate_point[0] - target[0])**2 +
-                                    (candidate_point[1] - target[1])**2 +
-                                    (candidate_point[2] - target[2])**2)**0.5
-
-                    # If this is closer to the target, update the best detour
-                    if dist_to_target < min_distance_to_target:
-                        min_distance_to_target = dist_to_target
-                        best_detour = candidate_point
+        best_detour = self._closest_clear_candidate(start, directions, target)
 
         # If none of the immediate 8 directions work, try with a larger step size
         if best_detour is None:
@@ -501,19 +610,7 @@ class CollisionSpace(SpaceManager):
                 (0, -larger_step, 0),
                 (larger_step, -larger_step, 0)
             ]
-
-            for dx, dy, dz in larger_directions:
-                candidate_point = (start_x + dx, start_y + dy, start_z + dz)
-
-                if not self._is_inside_obstacle(candidate_point):
-                    if not self._line_intersects_obstacle(start, candidate_point):
-                        dist_to_target = ((candidate_point[0] - target[0])**2 +
-                                        (candidate_point[1] - target[1])**2 +
-                                        (candidate_point[2] - target[2])**2)**0.5
-
-                        if dist_to_target < min_distance_to_target:
-                            min_distance_to_target = dist_to_target
-                            best_detour = candidate_point
+            best_detour = self._closest_clear_candidate(start, larger_directions, target)
 
         # Fallback: if still no valid detour found, just return a point in the direction of the target
         if best_detour is None:
@@ -535,16 +632,56 @@ class CollisionSpace(SpaceManager):
 
         return best_detour
 
+    def _closest_clear_candidate(self, start: Point3D, directions: List[Point3D], target: Point3D) -> Optional[Point3D]:
+        """
+        Of the points start + direction, the one closest to target that is outside every obstacle and
+        reachable from start without crossing one — or None. Earlier directions win ties.
+        All candidates are checked against the obstacles in one contains_point_batch and one
+        segments_intersect_batch call instead of a scalar check each.
+        """
+        start_x, start_y, start_z = start
+        candidates = [(start_x + dx, start_y + dy, start_z + dz) for dx, dy, dz in directions]
+        blocked = self.contains_point_batch(candidates)
+        blocked |= self.segments_intersect_batch([start] * len(candidates), candidates)
+
+        best_detour = None
+        min_distance_to_target = float('inf')
+        for candidate_point, is_blocked in zip(candidates, blocked.tolist()):
+            if is_blocked:
+                continue
+            dist_to_target = ((candidate_point[0] - target[0])**2 +
+                              (candidate_point[1] - target[1])**2 +
+                              (candidate_point[2] - target[2])**2)**0.5
+            if dist_to_target < min_distance_to_target:
+                min_distance_to_target = dist_to_target
+                best_detour = candidate_point
+        return best_detour
+
     def _line_intersects_obstacle(self, p1: Point3D, p2: Point3D) -> bool:
         """
         Check if a line between two points intersects any obstacle.
         """
-        for obstacle in self._obstacles:
+        for obstacle in self._candidate_obstacles(p1, p2):
             base_points, height = obstacle
             if self._line_intersects_prism(p1, p2, base_points, height):
                 return True
         return False
 
+    def _candidate_obstacles(self, p1: Point3D, p2: Point3D) -> List[Prism]:
+        """
+        Broad phase for segment queries: obstacles, in list order, whose XY bounding box overlaps
+        the segment's. Only these can pass _line_intersects_prism.
+        """
+        if len(self._obstacles) < self._BROADPHASE_MIN_OBSTACLES:
+            return self._obstacles
+        self._get_packed_obstacles()
+        min_x, min_y, max_x, max_y = self._obstacle_bounds
+        margin = self._BROADPHASE_MARGIN
+        overlap = ((min_x <= max(p1[0], p2[0]) + margin) & (max_x >= min(p1[0], p2[0]) - margin)
+                   & (min_y <= max(p1[1], p2[1]) + margin) & (max_y >= min(p1[1], p2[1]) - margin))
+        obstacles = self._obstacles
+        return [obstacles[i] for i in np.flatnonzero(overlap).tolist()]
+
     def _line_intersects_prism(self, p1: Point3D, p2: Point3D, base_points: List[Point3D], height: float) -> bool:
         """
         Check if a line intersects a prism (3D polygon extruded along Z-axis).
@@ -81,6 +81,8 @@ class ColoredSpace(SpaceManager):
         self._obstacles: List[ColoredPrism] = []
         self._agent_visuals: Dict[BaseAgent, str] = {}
         self._rect_ids: Dict[str, int] = {}  # rect_id -> index in _obstacles
+        # Bumped on every _obstacles mutation — lets viewers cache the obstacle list
+        self._obstacles_version = 0
 
         # Add static obstacles from constructor
         if obstacles:
@@ -110,6 +112,7 @@ class ColoredSpace(SpaceManager):
         prism: ColoredPrism = (base_points, height, rect.color, rect.alpha)
 
         self._obstacles.append(prism)
+        self._obstacles_version += 1
         self._rect_ids[rect.id] = len(self._obstacles) - 1
         self._agent_visuals[agent] = rect.id
         return True
@@ -126,6 +129,7 @@ class ColoredSpace(SpaceManager):
         if rect_id in self._rect_ids:
             idx = self._rect_ids[rect_id]
             self._obstacles[idx] = None  # Mark for removal
+            self._obstacles_version += 1
             del self._rect_ids[rect_id]
 
         del self._agent_visuals[agent]
@@ -177,4 +181,5 @@ class ColoredSpace(SpaceManager):
         prism: ColoredPrism = (base_points, height, rect.color, rect.alpha)
 
         self._obstacles.append(prism)
+        self._obstacles_version += 1
         self._rect_ids[rect.id] = len(self._obstacles) - 1
@@ -1,7 +1,10 @@
 import heapq
+import itertools
 import sys
 from typing import Dict, Any, List, Optional, Set, Tuple
 
+import numpy as np
+
 from aim.core.space import SpaceManager
 from aim.core.agent import BaseAgent
 from aim.entities.manufacturing.conveyor import Conveyor
@@ -12,6 +15,8 @@ class ConveyorSpace(SpaceManager):
     """
     Manages agents moving on a graph of conveyors, turntables, and other spatial entities.
     Handles movement, collision detection, and path progression.
+    Timing state is kept as structure-of-arrays — one row per registered agent — so update()
+    advances every agent with a few NumPy operations; only entity hand-overs run per agent.
     """
 
     def __init__(self):
@@ -19,14 +24,79 @@ class ConveyorSpace(SpaceManager):
         self._agent_entity: Dict[BaseAgent, Any] = {}
         # Entity -> set of agents on it (for collision detection)
         self._entity_agents: Dict[Any, Set[BaseAgent]] = {}
+        # Typed index of registered conveyors (for viewers — avoids isinstance scans)
+        self._conveyors: List[Conveyor] = []
+        # (start, end) -> shortest path (None if unreachable); cleared when entities are registered
+        self._path_cache: Dict[Tuple[Any, Any], Optional[List[Any]]] = {}
+        # Agent -> row in the arrays below; freed rows are reused by later registrations
+        self._agent_slot: Dict[BaseAgent, int] = {}
+        self._slot_agent: List[Optional[BaseAgent]] = []
+        self._free_slots: List[int] = []
+        # (capacity,) elapsed time on path and on current entity, traversal time of current entity and path
+        self._elapsed = np.zeros(0)
+        self._elapsed_on_entity = np.zeros(0)
+        self._entity_time = np.zeros(0)
+        self._total_time = np.zeros(0)
+        # Rows holding a registered agent, and rows whose agent has reached the end of its path
+        self._active = np.zeros(0, dtype=bool)
+        self._arrived_rows = np.zeros(0, dtype=bool)
+        # Agents at the end of their path as of the last update() — grown in the same pass
+        self._arrived: Set[BaseAgent] = set()
+        # Entity -> traversal time, computed once per entity; cleared with the path cache
+        self._entity_times: Dict[Any, float] = {}
+
+    def _allocate_slot(self, agent: BaseAgent) -> int:
+        """Row for agent — its existing one, a freed one, or a new one (arrays grow geometrically)."""
+        slot = self._agent_slot.get(agent)
+        if slot is not None:
+            return slot
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = len(self._slot_agent)
+            self._slot_agent.append(None)
+            if slot >= len(self._active):
+                capacity = max(16, 2 * len(self._active))
+                self._elapsed = np.resize(self._elapsed, capacity)
+                self._elapsed_on_entity = np.resize(self._elapsed_on_entity, capacity)
+                self._entity_time = np.resize(self._entity_time, capacity)
+                self._total_time = np.resize(self._total_time, capacity)
+                active = np.zeros(capacity, dtype=bool)
+                active[:slot] = self._active[:slot]
+                self._active = active
+                arrived_rows = np.zeros(capacity, dtype=bool)
+                arrived_rows[:slot] = self._arrived_rows[:slot]
+                self._arrived_rows = arrived_rows
+        self._agent_slot[agent] = slot
+        self._slot_agent[slot] = agent
+        return slot
 
     def register_entity(self, entity: Any) -> None:
         if entity not in self._entity_agents:
             self._entity_agents[entity] = set()
+            self._path_cache.clear()
+            self._entity_times.clear()
+            if isinstance(entity, Conveyor):
+                self._conveyors.append(entity)
+
+    def invalidate_path_cache(self) -> None:
+        """
+        Forget cached shortest paths and traversal times.
+        Call after changing connections or speeds of registered entities.
+        """
+        self._path_cache.clear()
+        self._entity_times.clear()
 
     def is_entity_registered(self, entity: Any) -> bool:
         return entity in self._entity_agents
 
+    def _entity_time_of(self, entity: Any) -> float:
+        """Traversal time of entity — a dict hit after the first call per entity."""
+        entity_time = self._entity_times.get(entity)
+        if entity_time is None:
+            entity_time = self._entity_times[entity] = self._compute_entity_time(entity)
+        return entity_time
+
     def _compute_entity_time(self, entity: Any) -> float:
         """Compute time to traverse entity. Returns inf if invalid."""
         if isinstance(entity, Conveyor):
@@ -48,16 +118,21 @@ class ConveyorSpace(SpaceManager):
         """
         Find shortest-time path from start to end using Dijkstra's algorithm.
         Returns list of entities from start to end, or None if no path.
+        Heap entries link to their predecessor instead of carrying a copy of the path, and each
+        entity's traversal time is computed once per search.
         """
         if start == end:
             return [start]
 
-        # Priority queue: (time, entity, path)
-        pq = [(0.0, start, [start])]
+        inf = float('inf')
+        entity_time_of = self._entity_time_of
+        # Priority queue: (time, entity, push order, (entity, predecessor link))
+        push_order = itertools.count()
+        pq = [(0.0, start, next(push_order), (start, None))]
         visited = set()
 
         while pq:
-            current_time, current_entity, path = heapq.heappop(pq)
+            current_time, current_entity, _, link = heapq.heappop(pq)
 
             if current_entity in visited:
                 continue
@@ -70,17 +145,21 @@ class ConveyorSpace(SpaceManager):
                 if neighbor in visited:
                     continue
 
-                edge_time = self._compute_entity_time(neighbor)
-                if edge_time == float('inf'):
+                edge_time = entity_time_of(neighbor)
+                if edge_time == inf:
                     continue
 
-                new_time = current_time + edge_time
-                new_path = path + [neighbor]
+                new_link = (neighbor, link)
 
                 if neighbor == end:
-                    return new_path
+                    path = []
+                    while new_link is not None:
+                        entity, new_link = new_link
+                        path.append(entity)
+                    path.reverse()
+                    return path
 
-                heapq.heappush(pq, (new_time, neighbor, new_path))
+                heapq.heappush(pq, (current_time + edge_time, neighbor, next(push_order), new_link))
 
         return None
 
@@ -97,7 +176,11 @@ class ConveyorSpace(SpaceManager):
             print("[SPACE] Entity not registered")
             return False
 
-        path = self._find_shortest_path(start_entity, end_entity)
+        # Topology is static during a run — every agent between the same entities shares one search
+        key = (start_entity, end_entity)
+        if key not in self._path_cache:
+            self._path_cache[key] = self._find_shortest_path(start_entity, end_entity)
+        path = self._path_cache[key]
         if path is None:
             print(f"[SPACE] NO PATH FOUND from {start_entity.name} to {end_entity.name}")
             sys.exit(1)  # You should see this if no path
@@ -106,7 +189,7 @@ class ConveyorSpace(SpaceManager):
         # Compute total time for path
         total_time = 0.0
         for entity in path:
-            total_time += self._compute_entity_time(entity)
+            total_time += self._entity_time_of(entity)
 
         if total_time <= 0:
             total_time = 1.0  # Avoid division by zero
@@ -114,7 +197,7 @@ class ConveyorSpace(SpaceManager):
         # Initialize space_state
         agent.space_state = {
             "entity": start_entity,
-            "path": path,
+            "path": list(path),
             "progress_on_entity": 0.0,
             "progress_on_path": 0.0,
             "target_entity": end_entity,
@@ -132,6 +215,16 @@ class ConveyorSpace(SpaceManager):
         self._agent_entity[agent] = start_entity
         self._entity_agents[start_entity].add(agent)
 
+        # A re-registered agent starts a new path — it has not arrived anywhere yet
+        self._arrived.discard(agent)
+        slot = self._allocate_slot(agent)
+        self._elapsed[slot] = 0.0
+        self._elapsed_on_entity[slot] = 0.0
+        self._entity_time[slot] = self._entity_time_of(start_entity)
+        self._total_time[slot] = total_time
+        self._active[slot] = True
+        self._arrived_rows[slot] = False
+
         return True
 
     def unregister(self, agent: BaseAgent) -> bool:
@@ -145,55 +238,96 @@ class ConveyorSpace(SpaceManager):
         agent.space_state = {}
 
         del self._agent_entity[agent]
+        self._arrived.discard(agent)
+
+        slot = self._agent_slot.pop(agent)
+        self._slot_agent[slot] = None
+        self._active[slot] = False
+        self._arrived_rows[slot] = False
+        self._free_slots.append(slot)
 
         return True
 
     def update(self, delta_time: float) -> None:
-        for agent in list(self._agent_entity.keys()):
-            state = agent.space_state
-            if not state:
-                continue
-
-            current_entity = state["entity"]
-            entity_time = self._compute_entity_time(current_entity)
-
-            # Update time on current entity
-            state["elapsed_time_on_entity"] += delta_time
-            state["elapsed_time"] += delta_time
-
-            # Update progress on current entity
-            if entity_time > 0:
-                progress_on_entity = state["elapsed_time_on_entity"] / entity_time
-                state["progress_on_entity"] = min(1.0, progress_on_entity)
-            else:
-                state["progress_on_entity"] = 1.0
-
-            # Update progress on path
-            if state["total_time"] > 0:
-                state["progress_on_path"] = min(1.0, state["elapsed_time"] / state["total_time"])
-            else:
-                state["progress_on_path"] = 1.0
-
-            # Check if need to move to next entity
-            if state["progress_on_entity"] >= 1.0:
-                path = state["path"]
-                if len(path) > 1:
-                    # Move to next entity
-                    next_entity = path[1]
-                    state["entity"] = next_entity
-                    state["path"] = path[1:]
-                    state["elapsed_time_on_entity"] = 0.0  # Reset for new entity
-                    state["progress_on_entity"] = 0.0  # Reset for new entity
-                    # Reassign in space
-                    old_entity = self._agent_entity[agent]
-                    self._entity_agents[old_entity].discard(agent)
-                    self._agent_entity[agent] = next_entity
-                    if next_entity not in self._entity_agents:
-                        self._entity_agents[next_entity] = set()
-                    self._entity_agents[next_entity].add(agent)
-                else:
-                    # End of path — do nothing, agent will be ejected when progress_on_path=1.0
-                    pass
+        slots = np.flatnonzero(self._active)
+        if not len(slots):
+            return
+        # Agents whose space_state was cleared behind our back are left where they are
+        states = [self._slot_agent[slot].space_state for slot in slots.tolist()]
+        if not all(states):
+            keep = [i for i, state in enumerate(states) if state]
+            # ...and no longer count as arrived
+            for i, state in enumerate(states):
+                if not state:
+                    self._arrived.discard(self._slot_agent[slots[i]])
+                    self._arrived_rows[slots[i]] = False
+            slots = slots[keep]
+            states = [states[i] for i in keep]
+            if not states:
+                return
+
+        # Update time on current entity
+        elapsed = self._elapsed[slots] + delta_time
+        elapsed_on_entity = self._elapsed_on_entity[slots] + delta_time
+        self._elapsed[slots] = elapsed
+        self._elapsed_on_entity[slots] = elapsed_on_entity
+
+        # Update progress on current entity and on path — non-positive times count as done
+        entity_time = self._entity_time[slots]
+        total_time = self._total_time[slots]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            progress_on_entity = np.where(
+                entity_time > 0, np.minimum(1.0, elapsed_on_entity / entity_time), 1.0)
+            progress_on_path = np.where(
+                total_time > 0, np.minimum(1.0, elapsed / total_time), 1.0)
+
+        # Mirror into each agent's space_state
+        for state, elapsed_value, on_entity_value, progress_value, path_value in zip(
+                states, elapsed.tolist(), elapsed_on_entity.tolist(),
+                progress_on_entity.tolist(), progress_on_path.tolist()):
+            state["elapsed_time"] = elapsed_value
+            state["elapsed_time_on_entity"] = on_entity_value
+            state["progress_on_entity"] = progress_value
+            state["progress_on_path"] = path_value
+
+        # Check if need to move to next entity — only the few agents finishing an entity
+        for i in np.flatnonzero(progress_on_entity >= 1.0).tolist():
+            state = states[i]
+            path = state["path"]
+            if len(path) > 1:
+                # Move to next entity
+                next_entity = path[1]
+                state["entity"] = next_entity
+                state["path"] = path[1:]
+                state["elapsed_time_on_entity"] = 0.0  # Reset for new entity
+                state["progress_on_entity"] = 0.0  # Reset for new entity
+                slot = slots[i]
+                self._elapsed_on_entity[slot] = 0.0
+                self._entity_time[slot] = self._entity_time_of(next_entity)
+                # Reassign in space
+                agent = self._slot_agent[slot]
+                old_entity = self._agent_entity[agent]
+                self._entity_agents[old_entity].discard(agent)
+                self._agent_entity[agent] = next_entity
+                self.register_entity(next_entity)
+                self._entity_agents[next_entity].add(agent)
+            # End of path — do nothing, agent will be ejected when progress_on_path=1.0
+
+        # Record arrivals while the progress is at hand — ConveyorBlock ejects from this set.
+        # Progress never decreases, so only rows arriving this update need a Python touch
+        arrived_now = slots[progress_on_path >= 1.0]
+        new_rows = arrived_now[~self._arrived_rows[arrived_now]]
+        if len(new_rows):
+            self._arrived_rows[new_rows] = True
+            slot_agent = self._slot_agent
+            self._arrived.update(slot_agent[slot] for slot in new_rows.tolist())
+
+    def arrived_agents(self) -> Set[BaseAgent]:
+        """
+        Agents whose movement was complete after the last update() — the agents for which
+        is_movement_complete() holds, without a per-agent state lookup.
+        """
+        return self._arrived
 
     def get_state(self, agent: BaseAgent) -> Dict[str, Any]:
         return agent.space_state.copy()
@@ -1,4 +1,7 @@
 from typing import Dict, Any, List, Optional, Set, Tuple
+
+import numpy as np
+
 from aim.core.space import SpaceManager
 from aim.core.agent import BaseAgent
 
@@ -8,15 +11,48 @@ class NoCollisionSpace(SpaceManager):
     """
     Manages agents moving in 3D space without collisions.
     Agents move at constant speed toward target position.
+    Movement state is kept as structure-of-arrays — one row per registered agent — so update()
+    advances every moving agent with a handful of NumPy operations.
     """
 
     def __init__(self):
-        # Agent -> current position
-        self._agent_position: Dict[BaseAgent, Point3D] = {}
-        # Agent -> target position
-        self._agent_target: Dict[BaseAgent, Point3D] = {}
-        # Agent -> speed
-        self._agent_speed: Dict[BaseAgent, float] = {}
+        # Agent -> row in the arrays below; freed rows are reused by later registrations
+        self._agent_slot: Dict[BaseAgent, int] = {}
+        self._slot_agent: List[Optional[BaseAgent]] = []
+        self._free_slots: List[int] = []
+        # Target tuples as registered — written back verbatim on arrival
+        self._slot_target: List[Optional[Point3D]] = []
+        # (capacity, 3) current and target positions, (capacity,) speed and progress
+        self._positions = np.zeros((0, 3))
+        self._targets = np.zeros((0, 3))
+        self._speeds = np.zeros(0)
+        self._progress = np.zeros(0)
+        # Rows that have not reached their target yet — settled agents cost nothing per tick
+        self._moving = np.zeros(0, dtype=bool)
+
+    def _allocate_slot(self, agent: BaseAgent) -> int:
+        """Row for agent — its existing one, a freed one, or a new one (arrays grow geometrically)."""
+        slot = self._agent_slot.get(agent)
+        if slot is not None:
+            return slot
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = len(self._slot_agent)
+            self._slot_agent.append(None)
+            self._slot_target.append(None)
+            if slot >= len(self._moving):
+                capacity = max(16, 2 * len(self._moving))
+                self._positions = np.resize(self._positions, (capacity, 3))
+                self._targets = np.resize(self._targets, (capacity, 3))
+                self._speeds = np.resize(self._speeds, capacity)
+                self._progress = np.resize(self._progress, capacity)
+                moving = np.zeros(capacity, dtype=bool)
+                moving[:slot] = self._moving[:slot]
+                self._moving = moving
+        self._agent_slot[agent] = slot
+        self._slot_agent[slot] = agent
+        return slot
 
     def register(self, agent: BaseAgent, initial_state: Dict[str, Any]) -> bool:
         """
@@ -52,9 +88,13 @@ class NoCollisionSpace(SpaceManager):
         }
 
         # Track internally
-        self._agent_position[agent] = start_position
-        self._agent_target[agent] = target_position
-        self._agent_speed[agent] = speed
+        slot = self._allocate_slot(agent)
+        self._positions[slot] = start_position
+        self._targets[slot] = target_position
+        self._speeds[slot] = speed
+        self._progress[slot] = 0.0
+        self._moving[slot] = True
+        self._slot_target[slot] = target_position
 
         return True
 
@@ -62,12 +102,14 @@ class NoCollisionSpace(SpaceManager):
         """
         Unregister agent from space.
         """
-        if agent not in self._agent_position:
+        slot = self._agent_slot.pop(agent, None)
+        if slot is None:
             return False
 
-        del self._agent_position[agent]
-        del self._agent_target[agent]
-        del self._agent_speed[agent]
+        self._slot_agent[slot] = None
+        self._slot_target[slot] = None
+        self._moving[slot] = False
+        self._free_slots.append(slot)
 
         agent.space_state = {}
         return True
@@ -77,62 +119,69 @@ class NoCollisionSpace(SpaceManager):
         Advance all agents by delta_time.
         Move agents toward target at constant speed.
         """
-        for agent in list(self._agent_position.keys()):
-            state = agent.space_state
-            if not state:
-                continue
-
-            current_pos = self._agent_position[agent]
-            target_pos = self._agent_target[agent]
-            speed = self._agent_speed[agent]
-
-            # Compute direction vector
-            dx = target_pos[0] - current_pos[0]
-            dy = target_pos[1] - current_pos[1]
-            dz = target_pos[2] - current_pos[2]
-
-            distance_to_target = (dx**2 + dy**2 + dz**2)**0.5
-            if distance_to_target <= 0:
-                state["progress"] = 1.0
-                continue
-
-            # Distance to move this tick
-            distance_to_move = speed * delta_time
-
-            if distance_to_move >= distance_to_target:
-                # Reach target
-                new_pos = target_pos
+        slots = np.flatnonzero(self._moving)
+        if not len(slots):
+            return
+        # Agents whose space_state was cleared behind our back are left where they are
+        states = [self._slot_agent[slot].space_state for slot in slots.tolist()]
+        if not all(states):
+            keep = [i for i, state in enumerate(states) if state]
+            slots = slots[keep]
+            states = [states[i] for i in keep]
+            if not states:
+                return
+
+        current = self._positions[slots]
+        target = self._targets[slots]
+
+        # Compute direction vector
+        delta = target - current
+        dx, dy, dz = delta[:, 0], delta[:, 1], delta[:, 2]
+        distance_to_target = np.sqrt(dx * dx + dy * dy + dz * dz)
+
+        # Distance to move this tick
+        distance_to_move = self._speeds[slots] * delta_time
+
+        # Reach target (or already there); everyone else moves partway
+        arrived = distance_to_move >= distance_to_target
+        partial = ~arrived
+        ratio = distance_to_move[partial] / distance_to_target[partial]
+        new_pos = current[partial] + delta[partial] * ratio[:, None]
+
+        # Update progress by the fraction of the remaining distance covered this tick
+        step = new_pos - current[partial]
+        sx, sy, sz = step[:, 0], step[:, 1], step[:, 2]
+        traveled = np.sqrt(sx * sx + sy * sy + sz * sz)
+        progress = np.minimum(1.0, self._progress[slots[partial]] + traveled / distance_to_target[partial])
+
+        # Commit rows
+        done = slots[arrived]
+        self._positions[done] = self._targets[done]
+        self._progress[done] = 1.0
+        self._moving[done] = False
+        moved = slots[partial]
+        self._positions[moved] = new_pos
+        self._progress[moved] = progress
+
+        # Mirror into each agent's space_state
+        partial_iter = zip(new_pos.tolist(), progress.tolist())
+        for slot, state, reached, distance in zip(slots.tolist(), states, arrived.tolist(),
+                                                   distance_to_target.tolist()):
+            if reached:
+                if distance > 0:
+                    state["position"] = self._slot_target[slot]
                 state["progress"] = 1.0
             else:
-                # Move partway
-                ratio = distance_to_move / distance_to_target
-                new_pos = (
-                    current_pos[0] + dx * ratio,
-                    current_pos[1] + dy * ratio,
-                    current_pos[2] + dz * ratio
-                )
-                # Update progress
-                total_distance = ((target_pos[0] - state["position"][0])**2 +
-                                (target_pos[1] - state["position"][1])**2 +
-                                (target_pos[2] - state["position"][2])**2)**0.5
-                if total_distance > 0:
-                    traveled = ((new_pos[0] - state["position"][0])**2 +
-                              (new_pos[1] - state["position"][1])**2 +
-                              (new_pos[2] - state["position"][2])**2)**0.5
-                    state["progress"] = min(1.0, state.get("progress", 0.0) + traveled / total_distance)
-
-            # Update position
-            self._agent_position[agent] = new_pos
-            state["position"] = new_pos
+                position, state["progress"] = next(partial_iter)
+                state["position"] = tuple(position)
 
     def get_state(self, agent: BaseAgent) -> Dict[str, Any]:
         """
         Get current space-specific state of agent.
         """
-        if agent not in self._agent_position:
+        if agent not in self._agent_slot:
             return {}
         return agent.space_state.copy()
-
     def is_movement_complete(self, agent: BaseAgent) -> bool:
         """
         Check if agent has reached target.
@@ -0,0 +1,48 @@
+# aim/util.py
+
+import sys
+from typing import List, Optional, TextIO
+
+import numpy as np
+
+
+def ring_positions(n: int, radius: float, y: float = 0.5) -> np.ndarray:
+    """
+    Evenly spaced points on a horizontal circle around the origin, starting on the +X axis.
+    :param n: Number of points.
+    :param radius: Circle radius in the XZ plane.
+    :param y: Height of every point.
+    :return: (n, 3) array of (x, y, z) positions.
+    """
+    angles = np.linspace(0.0, 2 * np.pi, n, endpoint=False)
+    positions = np.empty((n, 3))
+    positions[:, 0] = radius * np.cos(angles)
+    positions[:, 1] = y
+    positions[:, 2] = radius * np.sin(angles)
+    return positions
+
+
+class TickLogger:
+    """
+    Buffers tick-stamped log lines in memory and writes them out in one call.
+    Keeps per-agent hook logging off the tick path.
+    """
+
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def log(self, tick: int, msg: str) -> None:
+        """
+        Record one line.
+        :param tick: Simulation tick the message belongs to.
+        :param msg: Message text.
+        """
+        self.lines.append(f"[{tick}] {msg}\n")
+
+    def flush(self, stream: Optional[TextIO] = None) -> None:
+        """
+        Write all buffered lines and clear the buffer.
+        :param stream: Destination, defaults to sys.stdout.
+        """
+        (stream or sys.stdout).writelines(self.lines)
+        self.lines.clear()
@@ -1,13 +1,36 @@
-from .pygame_3d_viewer import Pygame3DViewer
-from .pygame_2d_viewer import Pygame2DViewer
-from .console_viewer import ConsoleViewer
-from .isometric_viewer import IsometricMatplotlibViewer
-from .matplotlib_viewer import Matplotlib2DViewer
+# aim/visualization/__init__.py
+
+# Viewers pull in pygame or matplotlib — import each only when it is first asked for (PEP 562)
+import importlib
+
+_LAZY_ATTRS = {
+    'Pygame3DViewer': '.pygame_3d_viewer',
+    'Pygame2DViewer': '.pygame_2d_viewer',
+    'ConsoleViewer': '.console_viewer',
+    'IsometricMatplotlibViewer': '.isometric_viewer',
+    'Matplotlib2DViewer': '.matplotlib_viewer',
+    'make_viewer': '.factory',
+}
 
 __all__ = [
     'Pygame3DViewer',
     'Pygame2DViewer',
     'ConsoleViewer',
     'IsometricMatplotlibViewer',
-    'Matplotlib2DViewer'
-]
\ No newline at end of file
+    'Matplotlib2DViewer',
+    'make_viewer'
+]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package — later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
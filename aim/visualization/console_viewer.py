@@ -4,10 +4,19 @@ from aim.entities.manufacturing.conveyor import Conveyor
 class ConsoleViewer:
     """Simple text-based viewer for debugging."""
 
-    def __init__(self, simulator):
+    def __init__(self, simulator, render_every: int = 1):
+        """
+        :param simulator: Simulator to observe.
+        :param render_every: Print only every N-th tick.
+        """
+        if render_every < 1:
+            raise ValueError("render_every must be >= 1")
         self.simulator = simulator
+        self.render_every = render_every
 
     def render_tick(self, tick: int):
+        if tick % self.render_every:
+            return
         print(f"\n=== TICK {tick} ===")
         for agent in self.simulator.agents:
             state = agent.space_state
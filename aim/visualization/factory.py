@@ -0,0 +1,21 @@
+# visualization/factory.py
+
+import os
+from typing import Any, Optional, Type
+
+
+def make_viewer(simulator, viewer_class: Optional[Type] = None, **kwargs) -> Optional[Any]:
+    """
+    Create a viewer, or None when the AIM_HEADLESS environment variable is set (and not "0").
+    Headless runs skip window creation and per-tick rendering entirely — for profiling and CI.
+    :param simulator: Simulator to visualize.
+    :param viewer_class: Viewer to instantiate. Default: Pygame3DViewer.
+    :param kwargs: Passed to the viewer constructor.
+    """
+    if os.getenv("AIM_HEADLESS", "0") not in ("", "0"):
+        return None
+    if viewer_class is None:
+        # Imported here — headless runs and other viewers never load pygame
+        from .pygame_3d_viewer import Pygame3DViewer
+        viewer_class = Pygame3DViewer
+    return viewer_class(simulator, **kwargs)
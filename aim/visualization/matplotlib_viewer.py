@@ -1,26 +1,108 @@
+import matplotlib
 import matplotlib.pyplot as plt
-from matplotlib.cm import get_cmap
+from matplotlib.collections import LineCollection
 from matplotlib.colors import to_hex
+from matplotlib.lines import Line2D
+from itertools import chain
+import numpy as np
 import sys
-from aim.entities.manufacturing.conveyor import Conveyor
+import time
+
+# tab20 resolved to hex once — conveyor colors are indexed by name hash
+_TAB20 = [to_hex(matplotlib.colormaps['tab20'](i)) for i in range(20)]
 
 class Matplotlib2DViewer:
-    def __init__(self, simulator):
+    """
+    2D viewer for conveyor systems — top-down projection by default.
+    Subclasses change the view by overriding _project() and the style attributes below.
+    """
+
+    # Figure / axes
+    figsize = (12, 8)
+    title = "Conveyor System"
+    tick_title = "Simulation - Tick {tick}"
+    xlabel = "X"
+    ylabel = "Y"
+    grid_alpha = None
+    legend_fontsize = None
+    log_prefix = "[MatplotlibViewer]"
+
+    # Artists
+    agent_style = dict(c='orange', s=100, zorder=10, edgecolors='black', linewidth=1)
+    annotation_style = dict(xytext=(0, 10), ha='center', fontsize=9, zorder=11)
+    waypoint_style = dict(s=30, zorder=4, marker='x', alpha=0.7)
+    start_style = dict(c='green', s=50, zorder=5, marker='o')
+    end_style = dict(c='red', s=50, zorder=5, marker='s')
+
+    def __init__(self, simulator, tick_delay: float = 1.0, render_every: int = 1):
+        """
+        :param simulator: Simulator to observe.
+        :param tick_delay: Seconds to sleep after each rendered tick (0 = no pacing).
+        :param render_every: Render only every N-th tick — other ticks return immediately.
+        """
+        if render_every < 1:
+            raise ValueError("render_every must be >= 1")
         self.simulator = simulator
-        self.fig, self.ax = plt.subplots(figsize=(12, 8))
-        self.ax.set_title("Conveyor System")
-        self.ax.set_xlabel("X")
-        self.ax.set_ylabel("Y")
-        self.ax.grid(True)
+        self._tick_delay = tick_delay
+        self.render_every = render_every
+        self.fig, self.ax = plt.subplots(figsize=self.figsize)
+        self.ax.set_title(self.title)
+        self.ax.set_xlabel(self.xlabel)
+        self.ax.set_ylabel(self.ylabel)
+        if self.grid_alpha is None:
+            self.ax.grid(True)
+        else:
+            self.ax.grid(True, alpha=self.grid_alpha)
         plt.ion()
+        plt.show(block=False)
 
-        # Placeholder for agent scatter
-        self.agent_scatter = None
+        # Agent scatter — created once, offsets updated every tick
+        self.agent_scatter = self.ax.scatter([], [], label='Agents', **self.agent_style)
+        # Annotation pool — grows to max agents seen, unused entries are hidden
         self.agent_annotations = []
+        # (capacity, 3) agent position buffer — filled in place each tick
+        self._positions_buf = np.empty((0, 3))
+
+        # Conveyor name -> color
+        self.color_cache = {}
 
         # Flag to draw conveyors once
         self._conveyors_drawn = False
 
+        # Blitting — static geometry is snapshotted after every full draw, each tick only
+        # restores it and redraws the animated artists (agents, labels, title) on top
+        self._background = None
+        # Agent labels and plot offsets of the last drawn frame — unchanged ticks are not redrawn
+        self._last_labels = None
+        self._last_offsets = np.empty((0, 2))
+        self._blit = self.fig.canvas.supports_blit
+        self.agent_scatter.set_animated(self._blit)
+        self.ax.title.set_animated(self._blit)
+        if self._blit:
+            self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event):
+        """Snapshot the static background — animated artists are skipped by full draws."""
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        # A full draw wiped the animated artists — the next tick must redraw them
+        self._last_labels = None
+
+    def _animated_artists(self):
+        """Artists redrawn every tick on top of the cached background."""
+        yield self.agent_scatter
+        for ann in self.agent_annotations:
+            if ann.get_visible():
+                yield ann
+        yield self.ax.title
+
+    def _project(self, points: np.ndarray) -> np.ndarray:
+        """Map an (N, 3) array of world points to (N, 2) plot coordinates."""
+        return points[:, :2]
+
+    def _conveyor_label(self, label: str, space_name: str, points: np.ndarray) -> str:
+        """Legend text for a conveyor."""
+        return f"{label} ({space_name})"
+
     def _draw_conveyors(self):
         """Draw all conveyors from all spaces — called once, lazily."""
         if self._conveyors_drawn:
@@ -28,116 +110,162 @@ class Matplotlib2DViewer:
 
         spaces = getattr(self.simulator, 'spaces', {})
         if not spaces:
-            print("[DEBUG] No spaces found")
             return
 
-        # Create a color map — assign color based on conveyor name
-
-        # Use tab20 for up to 20 distinct colors, then cycle
-        cmap = get_cmap('tab20')
-        color_cache = {}
+        # Accumulate geometry for all conveyors — drawn as a handful of collections
+        segments = []
+        colors = []
+        legend_handles = {}
 
         for space_name, space in spaces.items():
-            entities = getattr(space, '_entity_agents', {})
-            for entity in entities.keys():
-                if isinstance(entity, Conveyor) and hasattr(entity, 'points') and len(entity.points) >= 2:
-                    x = [p[0] for p in entity.points]
-                    y = [p[1] for p in entity.points]
+            if space is None:
+                continue
+            for entity in getattr(space, '_conveyors', ()):
+                if len(entity.points) >= 2:
+                    pts = np.asarray(entity.points, dtype=np.float64)
                     label = getattr(entity, 'name', 'Conveyor')
 
                     # Generate consistent color based on name
-                    if label not in color_cache:
-                        # Hash name to index, mod 20 for tab20
-                        hash_val = hash(label) % 20
-                        color = to_hex(cmap(hash_val))
-                        color_cache[label] = color
-                    color = color_cache[label]
+                    color = self.color_cache.get(label)
+                    if color is None:
+                        color = self.color_cache[label] = _TAB20[hash(label) % 20]
+
+                    segments.append(self._project(pts))
+                    colors.append(color)
+                    # Proxy artist — one legend entry per label
+                    legend_handles.setdefault(
+                        self._conveyor_label(label, space_name, pts),
+                        Line2D([], [], color=color, linewidth=2)
+                    )
 
-                    # Draw full path line with unique color
-                    self.ax.plot(x, y, color=color, linewidth=2, label=f"{label} ({space_name})")
+        if segments:
+            # Draw full path lines with unique colors
+            self.ax.add_collection(LineCollection(segments, colors=colors, linewidths=2))
 
-                    # Mark EVERY point in the path
-                    self.ax.scatter(x, y, c=color, s=30, zorder=4, marker='x', alpha=0.7)
+            # Mark EVERY point in the path
+            all_points = np.vstack(segments)
+            point_colors = np.repeat(colors, [len(seg) for seg in segments])
+            self.ax.scatter(all_points[:, 0], all_points[:, 1], c=point_colors, **self.waypoint_style)
 
-                    # Highlight start and end
-                    self.ax.scatter(x[0], y[0], c='green', s=50, zorder=5, marker='o')
-                    self.ax.scatter(x[-1], y[-1], c='red', s=50, zorder=5, marker='s')
+            # Highlight start and end
+            starts = np.array([seg[0] for seg in segments])
+            ends = np.array([seg[-1] for seg in segments])
+            self.ax.scatter(starts[:, 0], starts[:, 1], **self.start_style)
+            self.ax.scatter(ends[:, 0], ends[:, 1], **self.end_style)
+            self.ax.autoscale_view()
 
-        # Avoid duplicate labels
-        handles, labels = self.ax.get_legend_handles_labels()
-        by_label = dict(zip(labels, handles))
-        self.ax.legend(by_label.values(), by_label.keys())
+        self.ax.legend(legend_handles.values(), legend_handles.keys(), fontsize=self.legend_fontsize)
 
         self._conveyors_drawn = True
 
     def render_tick(self, tick: int):
         """Update visualization — draw conveyors once, then update agents."""
+        if tick % self.render_every:
+            return
         try:
             if not self._conveyors_drawn:
                 self._draw_conveyors()
-
-            # Clear only agent-related elements — safely
-            if self.agent_scatter:
-                try:
-                    self.agent_scatter.remove()
-                except ValueError:
-                    # Artist already removed — ignore
-                    pass
-                self.agent_scatter = None
-
-            for ann in self.agent_annotations:
-                try:
-                    ann.remove()
-                except ValueError:
-                    pass
-            self.agent_annotations.clear()
+                if self._conveyors_drawn:
+                    # Static geometry changed — the next blit needs a fresh background
+                    self._background = None
+                    self._last_labels = None
 
             # Draw agents
-            agent_x = []
-            agent_y = []
-            agent_labels = []
-
-            for agent in getattr(self.simulator, 'agents', []):
-                state = agent.space_state
-                if state and "position" in state:
-                    pos = state["position"]
-                    agent_x.append(pos[0])
-                    agent_y.append(pos[1])
-                    agent_labels.append(f"A{id(agent) % 1000}")
-                elif state and "entity" in state and "progress_on_entity" in state:
-                    entity = state["entity"]
-                    if hasattr(entity, 'get_position_at_progress'):
-                        progress = state["progress_on_entity"]
-                        pos = entity.get_position_at_progress(progress)
-                        agent_x.append(pos[0])
-                        agent_y.append(pos[1])
-                        agent_labels.append(f"A{id(agent) % 1000}")
-
-            if agent_x:
-                self.agent_scatter = self.ax.scatter(
-                    agent_x, agent_y,
-                    c='orange', s=100, zorder=10,
-                    edgecolors='black', linewidth=1,
-                    label='Agents'
-                )
-                for i, label in enumerate(agent_labels):
-                    ann = self.ax.annotate(
-                        label,
-                        (agent_x[i], agent_y[i]),
-                        textcoords="offset points",
-                        xytext=(0, 10),
-                        ha='center',
-                        fontsize=9,
-                        zorder=11
-                    )
-                    self.agent_annotations.append(ann)
+            positions, agent_labels = self._collect_agent_positions()
+            offsets = self._project(positions)
+            canvas = self.fig.canvas
+            if agent_labels == self._last_labels and np.array_equal(offsets, self._last_offsets):
+                # Nothing moved since the last frame — keep it on screen, skip the redraw
+                canvas.flush_events()
+                if self._tick_delay > 0:
+                    time.sleep(self._tick_delay)
+                return
+
+            self.agent_scatter.set_offsets(offsets)
+            self._update_annotations(offsets, agent_labels)
 
-            self.ax.set_title(f"Simulation - Tick {tick}")
-            plt.pause(1)
+            self.ax.set_title(self.tick_title.format(tick=tick))
+            if self._blit:
+                if self._background is None:
+                    # Full draw — fires draw_event, which caches the background
+                    canvas.draw()
+                canvas.restore_region(self._background)
+                for artist in self._animated_artists():
+                    self.ax.draw_artist(artist)
+                canvas.blit(self.fig.bbox)
+            else:
+                canvas.draw_idle()
+            self._last_labels = agent_labels
+            self._last_offsets = offsets.copy()
+            # Pump GUI events — no forced event loop like plt.pause
+            canvas.flush_events()
+            if self._tick_delay > 0:
+                time.sleep(self._tick_delay)
 
         except Exception as e:
-            print(f"[MatplotlibViewer] Error at tick {tick}: {e}", file=sys.stderr)
+            print(f"{self.log_prefix} Error at tick {tick}: {e}", file=sys.stderr)
+
+    def _collect_agent_positions(self):
+        """
+        Gather agent positions into an (N, 3) array plus matching labels.
+        Rows are written in place into a reused buffer — conveyor agents are
+        grouped by entity and interpolated in one batch per entity.
+        """
+        positioned = []
+        labels = []
+        by_entity = {}
+
+        for agent in getattr(self.simulator, 'agents', []):
+            state = agent.space_state
+            if state and "position" in state:
+                positioned.append(state["position"])
+                labels.append(f"A{agent.id % 1000}")
+            elif state and "entity" in state and "progress_on_entity" in state:
+                entity = state["entity"]
+                if hasattr(entity, 'get_positions_at_progress'):
+                    by_entity.setdefault(entity, []).append(agent)
+
+        n = len(positioned) + sum(len(group) for group in by_entity.values())
+        if n > len(self._positions_buf):
+            # Grow geometrically so steady-state ticks never reallocate
+            self._positions_buf = np.empty((max(n, 2 * len(self._positions_buf)), 3))
+        buf = self._positions_buf
+
+        k = len(positioned)
+        if k:
+            buf[:k] = np.fromiter(
+                chain.from_iterable(positioned), dtype=np.float64, count=3 * k
+            ).reshape(k, 3)
+        for entity, group in by_entity.items():
+            m = len(group)
+            progress = np.fromiter(
+                (a.space_state["progress_on_entity"] for a in group),
+                dtype=np.float64, count=m
+            )
+            buf[k:k + m] = entity.get_positions_at_progress(progress)
+            labels.extend(f"A{a.id % 1000}" for a in group)
+            k += m
+
+        return buf[:n], labels
+
+    def _update_annotations(self, offsets, agent_labels):
+        """Reuse pooled annotations — grow the pool on demand, hide the surplus."""
+        while len(self.agent_annotations) < len(agent_labels):
+            ann = self.ax.annotate("", (0, 0), textcoords="offset points", **self.annotation_style)
+            ann.set_animated(self._blit)
+            self.agent_annotations.append(ann)
+
+        for i, ann in enumerate(self.agent_annotations):
+            if i < len(agent_labels):
+                ann.set_text(agent_labels[i])
+                ann.xy = (offsets[i, 0], offsets[i, 1])
+                ann.set_visible(True)
+            else:
+                ann.set_visible(False)
 
     def show_final(self):
+        # Hand the animated artists back to regular draws so the final frame survives redraws
+        for artist in (self.agent_scatter, self.ax.title, *self.agent_annotations):
+            artist.set_animated(False)
         plt.ioff()
         plt.show()
@@ -3,6 +3,7 @@ Simple Pygame 2D top-down viewer for warehouse simulation.
 Much faster than 3D viewer - no projection math, just 2D transforms.
 """
 
+import numpy as np
 import pygame
 import sys
 from typing import Dict, Tuple, List, Optional
@@ -39,6 +40,13 @@ class Pygame2DViewer:
         pygame.display.set_caption("Warehouse 2D Viewer")
         self.clock = pygame.time.Clock()
 
+        # Overlay font — constructed once, reused every frame
+        pygame.font.init()
+        self._font = pygame.font.Font(None, 24)
+        # Last rendered overlay and the (tick, zoom, camera) values it shows
+        self._info_key: Optional[tuple] = None
+        self._info_surface: Optional[pygame.Surface] = None
+
         # Camera for 2D pan/zoom (world coordinates)
         self.camera_x = 0.0
         self.camera_y = 0.0
@@ -56,9 +64,20 @@ class Pygame2DViewer:
         # Cached obstacle surface (for performance)
         self._obstacle_surface: Optional[pygame.Surface] = None
         self._obstacles_dirty = True
+        # Camera position the cached surface was rendered at, and whether a drag moved it since
+        self._obstacle_surface_camera = (self.camera_x, self.camera_y)
+        self._pan_pending = False
+        # Shared scratch surface for translucent obstacles
+        self._scratch_surface: Optional[pygame.Surface] = None
 
         self._obstacles_length = 0
 
+        # Obstacles normalized to (world_pts, color, alpha), world_pts a (K, 2) array —
+        # rebuilt only when the obstacle set changes
+        self._obstacles: Optional[List[Tuple[np.ndarray, Tuple[int, int, int], int]]] = None
+        # World-space AABB per obstacle: (N, 4) rows of (xmin, ymin, xmax, ymax)
+        self._obstacle_aabbs = np.empty((0, 4))
+
         # Viewport bounds (world coordinates)
         self._viewport_left = 0.0
         self._viewport_right = 0.0
@@ -68,18 +87,21 @@ class Pygame2DViewer:
 
     def world_to_screen(self, x: float, y: float) -> Tuple[int, int]:
         """Convert world coordinates to screen coordinates."""
-        screen_x = (x - self.camera_x) * self.zoom + self.width // 2
-        screen_y = (y - self.camera_y) * self.zoom + self.height // 2
+        screen_x = (x - self.camera_x) * self.zoom + self._half_w
+        screen_y = (y - self.camera_y) * self.zoom + self._half_h
         return int(screen_x), int(screen_y)
 
     def screen_to_world(self, screen_x: int, screen_y: int) -> Tuple[float, float]:
         """Convert screen coordinates to world coordinates."""
-        world_x = (screen_x - self.width // 2) / self.zoom + self.camera_x
-        world_y = (screen_y - self.height // 2) / self.zoom + self.camera_y
+        world_x = (screen_x - self._half_w) / self.zoom + self.camera_x
+        world_y = (screen_y - self._half_h) / self.zoom + self.camera_y
         return world_x, world_y
 
     def _update_viewport_bounds(self):
         """Calculate world coordinate bounds of visible viewport."""
+        # Integer screen center — shared by the scalar and batched transforms
+        self._half_w = self.width // 2
+        self._half_h = self.height // 2
         half_width = (self.width / 2) / self.zoom
         half_height = (self.height / 2) / self.zoom
         self._viewport_left = self.camera_x - half_width
@@ -104,52 +126,140 @@ class Pygame2DViewer:
         self._obstacle_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         self._obstacle_surface.fill((255, 255, 255, 0))  # Transparent
 
-        # Collect all obstacles
-        obstacles_to_draw = []
-        if hasattr(self.simulator, 'spaces'):
-            for space in self.simulator.spaces.values():
-                if hasattr(space, '_obstacles') and space._obstacles:
-                    for obstacle in space._obstacles:
-                        if obstacle is not None:
-                            obstacles_to_draw.append(obstacle)
-        self._obstacles_length = len(obstacles_to_draw)
-
-        # Draw all obstacles to surface
-        for obstacle in obstacles_to_draw:
-            # Parse obstacle format
-            if len(obstacle) == 4:
-                # ColoredSpace format: (points, height, color, alpha)
-                points, _, color, alpha = obstacle
-            else:
-                # CollisionSpace format: (points, height)
-                points, _ = obstacle
-                color = self.default_obstacle_color
-                alpha = 200
+        if self._obstacles is None:
+            self._collect_obstacles()
+
+        # Transform each polygon to screen space in one vectorized op
+        offset = np.array((self.camera_x, self.camera_y))
+        center = np.array((self._half_w, self._half_h))
+
+        # Cull obstacles whose AABB misses the viewport (1px margin for rounding)
+        margin = 1.0 / self.zoom
+        aabbs = self._obstacle_aabbs
+        visible = np.flatnonzero(
+            (aabbs[:, 2] >= self._viewport_left - margin) &
+            (aabbs[:, 0] <= self._viewport_right + margin) &
+            (aabbs[:, 3] >= self._viewport_top - margin) &
+            (aabbs[:, 1] <= self._viewport_bottom + margin)
+        )
+
+        # Reusable transparent surface for translucent polygons — allocated once, not per polygon
+        if self._scratch_surface is None or self._scratch_surface.get_size() != (self.width, self.height):
+            self._scratch_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            self._scratch_surface.fill((0, 0, 0, 0))
+        scratch = self._scratch_surface
+
+        # Draw visible obstacles to surface
+        for i in visible.tolist():
+            world_pts, color, alpha = self._obstacles[i]
 
             # Convert to screen coordinates
-            screen_points = [self.world_to_screen(p[0], p[1]) for p in points]
+            screen_points = ((world_pts - offset) * self.zoom + center).astype(np.int64).tolist()
 
             if len(screen_points) >= 3:
-                # Create surface for alpha blending
                 if alpha < 255:
-                    # Calculate bounding box
-                    min_x = min(p[0] for p in screen_points)
-                    max_x = max(p[0] for p in screen_points)
-                    min_y = min(p[1] for p in screen_points)
-                    max_y = max(p[1] for p in screen_points)
-
-                    surf_width = max(1, max_x - min_x + 2)
-                    surf_height = max(1, max_y - min_y + 2)
-
-                    poly_surface = pygame.Surface((surf_width, surf_height), pygame.SRCALPHA)
-                    local_points = [(p[0] - min_x, p[1] - min_y) for p in screen_points]
-                    pygame.draw.polygon(poly_surface, (*color, alpha), local_points)
-                    self._obstacle_surface.blit(poly_surface, (min_x, min_y))
+                    # Draw into the shared scratch surface, alpha-blend just the polygon's bbox, then clear it
+                    bbox = pygame.draw.polygon(scratch, (*color, alpha), screen_points)
+                    self._obstacle_surface.blit(scratch, bbox, bbox)
+                    scratch.fill((0, 0, 0, 0), bbox)
                 else:
                     pygame.draw.polygon(self._obstacle_surface, color, screen_points)
 
+        self._obstacle_surface_camera = (self.camera_x, self.camera_y)
         self._obstacles_dirty = False
 
+    def _blit_obstacles(self):
+        """Blit cached obstacles — shifted by the pan offset while a drag is in progress."""
+        self._ensure_obstacle_surface()
+        if self._obstacle_surface:
+            surface_x, surface_y = self._obstacle_surface_camera
+            offset_x = int(round((surface_x - self.camera_x) * self.zoom))
+            offset_y = int(round((surface_y - self.camera_y) * self.zoom))
+            self.screen.blit(self._obstacle_surface, (offset_x, offset_y))
+
+    def _finish_pan(self):
+        """Drag released — re-render obstacles once at the final camera position."""
+        if self._pan_pending:
+            self._pan_pending = False
+            self._obstacles_dirty = True
+
+    def _collect_obstacles(self):
+        """Gather obstacles from all spaces and cache their base polygons in world space."""
+        self._obstacles = []
+        obstacles_len = 0
+        if hasattr(self.simulator, 'spaces'):
+            for space in self.simulator.spaces.values():
+                if hasattr(space, '_obstacles') and space._obstacles:
+                    obstacles_len += len(space._obstacles)
+                    for obstacle in space._obstacles:
+                        if obstacle is None:
+                            continue
+                        if len(obstacle) == 4:
+                            # ColoredSpace format: (points, height, color, alpha)
+                            _, _, color, alpha = obstacle
+                        else:
+                            # CollisionSpace format: (points, height)
+                            color = self.default_obstacle_color
+                            alpha = 200
+                        world_pts = np.asarray(obstacle[0], dtype=np.float64)[:, :2]
+                        self._obstacles.append((world_pts, color, alpha))
+        self._obstacles_length = obstacles_len
+
+        if self._obstacles:
+            # One segmented reduction over all vertices instead of two per polygon
+            all_pts = np.concatenate([pts for pts, _, _ in self._obstacles])
+            starts = np.cumsum([0] + [len(pts) for pts, _, _ in self._obstacles[:-1]])
+            self._obstacle_aabbs = np.hstack((
+                np.minimum.reduceat(all_pts, starts, axis=0),
+                np.maximum.reduceat(all_pts, starts, axis=0),
+            ))
+        else:
+            self._obstacle_aabbs = np.empty((0, 4))
+
+    def _zoom(self, factor: float, mx: int, my: int):
+        """Scale zoom by factor, keeping the world point under the cursor fixed."""
+        half_w = self._half_w
+        half_h = self._half_h
+        wx = (mx - half_w) / self.zoom + self.camera_x
+        wy = (my - half_h) / self.zoom + self.camera_y
+        self.zoom *= factor
+        self.camera_x = wx - (mx - half_w) / self.zoom
+        self.camera_y = wy - (my - half_h) / self.zoom
+        self._update_viewport_bounds()
+        self._obstacles_dirty = True
+
+    def _handle_event(self, event) -> bool:
+        """Apply one input event to the camera. Returns False when the window should close."""
+        if event.type == pygame.QUIT:
+            return False
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button in [1, 3]:  # Left or right mouse button
+                self.dragging = True
+                self.last_mouse_pos = event.pos
+            elif event.button == 4:  # Mouse wheel up
+                self._zoom(1.1, event.pos[0], event.pos[1])
+            elif event.button == 5:  # Mouse wheel down
+                self._zoom(0.9, event.pos[0], event.pos[1])
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if event.button in [1, 3]:
+                self.dragging = False
+                self._finish_pan()
+        elif event.type == pygame.MOUSEMOTION:
+            if self.dragging:
+                dx = event.pos[0] - self.last_mouse_pos[0]
+                dy = event.pos[1] - self.last_mouse_pos[1]
+                # Pan camera (inverted - drag moves opposite direction)
+                self.camera_x -= dx / self.zoom
+                self.camera_y -= dy / self.zoom
+                self.last_mouse_pos = event.pos
+                self._update_viewport_bounds()
+                # Cached surface is shifted while dragging — full rebuild on release
+                self._pan_pending = True
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                return False
+        return True
+
     def render_tick(self, tick: int):
         """Render the current simulation state."""
 
@@ -160,74 +270,23 @@ class Pygame2DViewer:
                     obstacles_len += len(space._obstacles)
         if obstacles_len != self._obstacles_length:
             self._obstacles_length = obstacles_len
+            self._obstacles = None
             self._obstacles_dirty = True
 
         # Handle events
-
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            if not self._handle_event(event):
                 pygame.quit()
                 sys.exit()
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button in [1, 3]:  # Left or right mouse button
-                    self.dragging = True
-                    self.last_mouse_pos = event.pos
-                elif event.button == 4:  # Mouse wheel up
-                    old_zoom = self.zoom
-                    self.zoom *= 1.1
-                    # Zoom toward mouse position
-                    mouse_world = self.screen_to_world(event.pos[0], event.pos[1])
-                    self.camera_x = mouse_world[0] - (event.pos[0] - self.width // 2) / self.zoom
-                    self.camera_y = mouse_world[1] - (event.pos[1] - self.height // 2) / self.zoom
-                    self._update_viewport_bounds()
-                    self._obstacles_dirty = True
-                elif event.button == 5:  # Mouse wheel down
-                    old_zoom = self.zoom
-                    self.zoom *= 0.9
-                    # Zoom toward mouse position
-                    mouse_world = self.screen_to_world(event.pos[0], event.pos[1])
-                    self.camera_x = mouse_world[0] - (event.pos[0] - self.width // 2) / self.zoom
-                    self.camera_y = mouse_world[1] - (event.pos[1] - self.height // 2) / self.zoom
-                    self._update_viewport_bounds()
-                    self._obstacles_dirty = True
-            elif event.type == pygame.MOUSEBUTTONUP:
-                if event.button in [1, 3]:
-                    self.dragging = False
-            elif event.type == pygame.MOUSEMOTION:
-                if self.dragging:
-                    dx = event.pos[0] - self.last_mouse_pos[0]
-                    dy = event.pos[1] - self.last_mouse_pos[1]
-                    # Pan camera (inverted - drag moves opposite direction)
-                    self.camera_x -= dx / self.zoom
-                    self.camera_y -= dy / self.zoom
-                    self.last_mouse_pos = event.pos
-                    self._update_viewport_bounds()
-                    self._obstacles_dirty = True
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    pygame.quit()
-                    sys.exit()
 
         # Clear screen
         self.screen.fill(self.background_color)
 
         # Draw pre-rendered obstacles
-        self._ensure_obstacle_surface()
-        if self._obstacle_surface:
-            self.screen.blit(self._obstacle_surface, (0, 0))
+        self._blit_obstacles()
 
         # Draw agents (dynamic - redrawn every frame)
-        for agent in self.simulator.agents:
-            if hasattr(agent, 'space_state') and agent.space_state:
-                pos = agent.space_state.get("position")
-                if pos and len(pos) >= 2:
-                    screen_x, screen_y = self.world_to_screen(pos[0], pos[1])
-
-                    # Check if agent is visible
-                    if (0 <= screen_x < self.width and 0 <= screen_y < self.height):
-                        # Use agent's color if available
-                        agent_color = getattr(agent, 'color', self.agent_color)
-                        pygame.draw.circle(self.screen, agent_color, (screen_x, screen_y), 5)
+        self._draw_agents()
 
         # Draw viewport info (optional - can remove for performance)
         self._draw_info(tick)
@@ -236,70 +295,57 @@ class Pygame2DViewer:
         pygame.display.flip()
         self.clock.tick(60)  # 60 FPS
 
+    def _draw_agents(self):
+        """Draw agents — positions are transformed to screen space in one batch."""
+        agents = []
+        positions = []
+        for agent in self.simulator.agents:
+            if hasattr(agent, 'space_state') and agent.space_state:
+                pos = agent.space_state.get("position")
+                if pos and len(pos) >= 2:
+                    agents.append(agent)
+                    positions.append((pos[0], pos[1]))
+
+        if not positions:
+            return
+
+        world = np.asarray(positions, dtype=np.float64)
+        screen = (world - (self.camera_x, self.camera_y)) * self.zoom + (self._half_w, self._half_h)
+        screen = screen.astype(np.int64)
+
+        # Only agents inside the window are drawn
+        visible = (
+            (screen[:, 0] >= 0) & (screen[:, 0] < self.width) &
+            (screen[:, 1] >= 0) & (screen[:, 1] < self.height)
+        )
+        for i in np.flatnonzero(visible).tolist():
+            # Use agent's color if available
+            agent_color = getattr(agents[i], 'color', self.agent_color)
+            pygame.draw.circle(self.screen, agent_color, screen[i].tolist(), 5)
+
     def _draw_info(self, tick: int):
-        """Draw debug info overlay."""
-        font = pygame.font.Font(None, 24)
-        info_text = f"Tick: {tick} | Zoom: {self.zoom:.2f}x | Camera: ({self.camera_x:.1f}, {self.camera_y:.1f})"
-        text_surface = font.render(info_text, True, (0, 0, 0))
-        self.screen.blit(text_surface, (10, 10))
+        """Draw debug info overlay — re-rendered only when the displayed values change."""
+        # Rounded to display precision so sub-pixel float noise doesn't invalidate the cache
+        info_key = (tick, round(self.zoom, 2), round(self.camera_x, 1), round(self.camera_y, 1))
+        if info_key != self._info_key:
+            info_text = f"Tick: {tick} | Zoom: {self.zoom:.2f}x | Camera: ({self.camera_x:.1f}, {self.camera_y:.1f})"
+            self._info_surface = self._font.render(info_text, True, (0, 0, 0))
+            self._info_key = info_key
+        self.screen.blit(self._info_surface, (10, 10))
 
     def show_final(self):
         """Keep window open after simulation with navigation."""
         running = True
         while running:
             for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+                if not self._handle_event(event):
                     running = False
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button in [1, 3]:
-                        self.dragging = True
-                        self.last_mouse_pos = event.pos
-                    elif event.button == 4:
-                        old_zoom = self.zoom
-                        self.zoom *= 1.1
-                        mouse_world = self.screen_to_world(event.pos[0], event.pos[1])
-                        self.camera_x = mouse_world[0] - (event.pos[0] - self.width // 2) / self.zoom
-                        self.camera_y = mouse_world[1] - (event.pos[1] - self.height // 2) / self.zoom
-                        self._update_viewport_bounds()
-                        self._obstacles_dirty = True
-                    elif event.button == 5:
-                        old_zoom = self.zoom
-                        self.zoom *= 0.9
-                        mouse_world = self.screen_to_world(event.pos[0], event.pos[1])
-                        self.camera_x = mouse_world[0] - (event.pos[0] - self.width // 2) / self.zoom
-                        self.camera_y = mouse_world[1] - (event.pos[1] - self.height // 2) / self.zoom
-                        self._update_viewport_bounds()
-                        self._obstacles_dirty = True
-                elif event.type == pygame.MOUSEBUTTONUP:
-                    if event.button in [1, 3]:
-                        self.dragging = False
-                elif event.type == pygame.MOUSEMOTION:
-                    if self.dragging:
-                        dx = event.pos[0] - self.last_mouse_pos[0]
-                        dy = event.pos[1] - self.last_mouse_pos[1]
-                        self.camera_x -= dx / self.zoom
-                        self.camera_y -= dy / self.zoom
-                        self.last_mouse_pos = event.pos
-                        self._update_viewport_bounds()
-                        self._obstacles_dirty = True
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        running = False
 
             self.screen.fill(self.background_color)
-            self._ensure_obstacle_surface()
-            if self._obstacle_surface:
-                self.screen.blit(self._obstacle_surface, (0, 0))
+            self._blit_obstacles()
 
             # Draw agents
-            for agent in self.simulator.agents:
-                if hasattr(agent, 'space_state') and agent.space_state:
-                    pos = agent.space_state.get("position")
-                    if pos and len(pos) >= 2:
-                        screen_x, screen_y = self.world_to_screen(pos[0], pos[1])
-                        if 0 <= screen_x < self.width and 0 <= screen_y < self.height:
-                            agent_color = getattr(agent, 'color', self.agent_color)
-                            pygame.draw.circle(self.screen, agent_color, (screen_x, screen_y), 5)
+            self._draw_agents()
 
             self._draw_info(0)
             pygame.display.flip()
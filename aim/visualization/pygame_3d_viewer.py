@@ -5,13 +5,37 @@ Draws obstacles from CollisionSpace as prisms
 Supports ColoredSpace rectangles as prisms with alpha transparency
 """
 
+import numpy as np
 import pygame
 import sys
 import math
-from typing import Dict, Tuple
+from itertools import chain
+from typing import Dict, List, Optional, Tuple
 from aim.core.agent import BaseAgent
 
+
+def _project_batch(pts: np.ndarray, a: np.ndarray, b: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Orthographic projection kernel: world (N, 3) -> screen (N, 2), written into out.
+    :param a: 2x3 screen transform — view rotation scaled by zoom, with pygame's Y flip
+    :param b: screen-space translation — screen center minus the projected camera offset
+    """
+    np.matmul(pts, a.T, out=out)
+    out += b
+    return out
+
+
 class Pygame3DViewer:
+    # Origin and 5-unit X/Y/Z axis endpoints in world space
+    _AXIS_PTS = np.array([[0.0, 0.0, 0.0], [5.0, 0.0, 0.0], [0.0, 5.0, 0.0], [0.0, 0.0, 5.0]])
+    # Event types consumed by _handle_event; everything else is blocked at the queue
+    _HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                       pygame.MOUSEMOTION, pygame.WINDOWEXPOSED]
+    # Zoom factor per mouse button: wheel up/down (4/5), touchpad scroll left/right (6/7)
+    _ZOOM_FACTORS = {4: 1.1, 5: 0.9, 6: 0.95, 7: 1.05}
+    # Up to this many agents, a frame where only agents moved is presented as dirty rects instead of a flip
+    _DIRTY_RECT_LIMIT = 50
+
     def __init__(self, simulator, width: int = 0, height: int = 0):
         self.simulator = simulator
 
@@ -21,16 +45,28 @@ class Pygame3DViewer:
             info = pygame.display.Info()
             self.width = info.current_w
             self.height = info.current_h
-            self.screen = pygame.display.set_mode((self.width, self.height), pygame.FULLSCREEN)
+            self.screen = pygame.display.set_mode((self.width, self.height), pygame.FULLSCREEN | pygame.DOUBLEBUF)
         else:
             self.width = width
             self.height = height
             pygame.init()
-            self.screen = pygame.display.set_mode((width, height))
+            self.screen = pygame.display.set_mode((width, height), pygame.DOUBLEBUF)
 
         pygame.display.set_caption("3D Agent Viewer")
+        # Queue only the event types _handle_event reacts to — a high-rate mouse or touchpad
+        # otherwise floods the queue with MOUSEWHEEL/window/text events between 10 FPS frames
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self._HANDLED_EVENTS)
         self.clock = pygame.time.Clock()
 
+        # Cached view matrix — rebuilt lazily after a camera angle changes
+        self._view_matrix = None
+        # Fused world-to-screen affine map per dtype and the view version it was built for
+        self._screen_transform: Dict[np.dtype, Tuple[np.ndarray, np.ndarray]] = {}
+        self._screen_transform_version = -1
+        self._screen_coeffs = None
+        self._view_dirty = True
+
         # Camera settings - start from top-left corner
         self.camera_distance = 0
         self.camera_angle_x = 0  # Rotation around X-axis (vertical rotation)
@@ -46,267 +82,544 @@ class Pygame3DViewer:
         self.agent_color = (255, 0, 0)     # Red agents
         self.obstacle_color = (150, 150, 150) # Gray obstacles
 
+        # Agent color -> pre-rendered circle sprite (radius 5)
+        self.agent_radius = 5
+        self._agent_sprites: Dict[Tuple[int, int, int], pygame.Surface] = {}
+
+        # id(prism) -> (prism, stacked (2V, 3) world vertices) — obstacle geometry is static
+        self._obstacle_cache: Dict[int, tuple] = {}
+        # Flat list of live obstacles across spaces, re-collected only when the signature changes
+        self._static_prisms: List[tuple] = []
+        # Vertices of every static prism in one array, and each prism's (start row, vertex count)
+        self._prism_vertices = np.empty((0, 3))
+        self._prism_spans: List[Tuple[int, int]] = []
+        # Screen (base, top) polygons per static prism (None when off-screen) and their view version
+        self._prism_screen: List[Optional[tuple]] = []
+        self._prism_screen_version = -1
+        self._obstacles_signature = None
+        # Pre-rendered fill + axes + obstacles and the (view version, obstacle signature) it shows
+        self._background: Optional[pygame.Surface] = None
+        self._background_key = None
+        # Shared scratch surface for translucent prism faces — allocated once, not per face
+        self._scratch_surface: Optional[pygame.Surface] = None
+        self._view_version = 0
+        self._last_view_state = None
+        # Projected axis endpoints (unrounded) and the view version they belong to
+        self._cached_axes = None
+        self._cached_axes_version = -1
+
+        # Agent snapshot (SoA) — refreshed once per tick, reused by show_final
+        # float32 — half the memory traffic for the per-tick projection; sub-pixel error at screen scale
+        self._agent_positions = np.empty((0, 3), dtype=np.float32)
+        self._agent_sprite_refs: List[pygame.Surface] = []
+        self._agent_count = 0
+        # Top-left corners of the sprites drawn last frame, and their rects if the frame was small
+        # enough to be presented with display.update (None forces the next frame to be a full flip)
+        self._agent_dests: List[List[int]] = []
+        self._agent_rects: Optional[List[pygame.Rect]] = None
+        # dtype -> reused (capacity, 2) projection output, see _projection_buffer
+        self._projection_buffers: Dict[np.dtype, np.ndarray] = {}
+
         # For handling pygame events
         self.dragging = False
         self.drag_button = 0  # 1 for left button, 3 for right button
         self.last_mouse_pos = (0, 0)
         self.pan_speed = 0.5   # Speed of panning (increased)
+        # Drag button -> handler(dx, dy): left button pans, right button rotates
+        self._drag_handlers = {1: self._pan, 3: self._rotate}
+        # Set when the camera changes or the window is exposed — forces the next frame to be drawn
+        self._dirty = True
+        # _frame_state() of the last frame render_tick drew
+        self._last_frame_state = None
+
+    @property
+    def camera_angle_x(self) -> float:
+        """Rotation around X-axis (vertical rotation)."""
+        return self._camera_angle_x
+
+    @camera_angle_x.setter
+    def camera_angle_x(self, value: float):
+        self._camera_angle_x = value
+        self._view_dirty = True
+
+    @property
+    def camera_angle_y(self) -> float:
+        """Rotation around Y-axis (horizontal rotation)."""
+        return self._camera_angle_y
+
+    @camera_angle_y.setter
+    def camera_angle_y(self, value: float):
+        self._camera_angle_y = value
+        self._view_dirty = True
 
     def project_3d_to_2d(self, x: float, y: float, z: float) -> Tuple[float, float]:
         """
         Project 3D coordinates to 2D screen coordinates
         This is a simple orthographic projection with camera transformations
         """
-        # Apply camera offset (translation)
-        x -= self.camera_offset_x
-        y -= self.camera_offset_y
-        z -= self.camera_offset_z
-
-        # Apply camera rotation
-        # Rotate around Y-axis
-        x_rot = x * math.cos(self.camera_angle_y) - z * math.sin(self.camera_angle_y)
-        z_rot = x * math.sin(self.camera_angle_y) + z * math.cos(self.camera_angle_y)
-
-        # Rotate around X-axis
-        y_rot = y * math.cos(self.camera_angle_x) - z_rot * math.sin(self.camera_angle_x)
-        z_rot_final = y * math.sin(self.camera_angle_x) + z_rot * math.cos(self.camera_angle_x)
+        # Fused offset + rotation + zoom + centering, as float locals — depth is never needed for orthographic
+        self._get_screen_transform()
+        a00, a01, a02, a10, a11, a12, b0, b1 = self._screen_coeffs
+        return a00 * x + a01 * y + a02 * z + b0, a10 * x + a11 * y + a12 * z + b1
 
-        # Apply zoom
-        x_screen = x_rot * self.zoom
-        y_screen = y_rot * self.zoom
+    def _build_view_matrix(self) -> np.ndarray:
+        """
+        Rotation applied by project_3d_to_2d as a 2x3 matrix (Y-axis rotation, then X-axis).
+        Rows give the rotated x and y of a camera-relative point; the depth row is dropped.
+        """
+        cos_x, sin_x = math.cos(self.camera_angle_x), math.sin(self.camera_angle_x)
+        cos_y, sin_y = math.cos(self.camera_angle_y), math.sin(self.camera_angle_y)
+        return np.array([
+            [cos_y, 0.0, -sin_y],
+            [-sin_x * sin_y, cos_x, -sin_x * cos_y],
+        ])
+
+    def _get_view_matrix(self) -> np.ndarray:
+        """Return the view matrix, rebuilding it only if a camera angle changed since the last call."""
+        if self._view_dirty:
+            self._view_matrix = self._build_view_matrix()
+            self._view_dirty = False
+        return self._view_matrix
+
+    def _get_screen_transform(self, dtype=np.float64) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (a, b) such that screen = world @ a.T + b — offset, rotation, zoom, Y flip and screen
+        center folded into one affine map, rebuilt once per view version.
+        :param dtype: np.float64, or np.float32 for the single-precision agent path
+        """
+        self._sync_view_version()
+        if self._screen_transform_version != self._view_version:
+            a = self._get_view_matrix() * [[self.zoom], [-self.zoom]]
+            offset = (self.camera_offset_x, self.camera_offset_y, self.camera_offset_z)
+            b = np.array([self.width // 2, self.height // 2], dtype=np.float64) - a @ offset
+            self._screen_transform = {
+                np.dtype(np.float64): (a, b),
+                np.dtype(np.float32): (a.astype(np.float32), b.astype(np.float32)),
+            }
+            # Python floats for the scalar project_3d_to_2d path — NumPy scalar access is several times slower
+            self._screen_coeffs = (*a.ravel().tolist(), *b.tolist())
+            self._screen_transform_version = self._view_version
+        return self._screen_transform[np.dtype(dtype)]
+
+    def _project_points(self, points) -> np.ndarray:
+        """
+        Batched project_3d_to_2d: map an (N, 3) array of world points to (N, 2) integer screen coordinates.
+        float32 input is projected in single precision end to end; anything else as float64.
+        The result lives in a reused buffer — consume it before projecting again.
+        """
+        pts = np.asarray(points)
+        if pts.dtype != np.float32:
+            pts = pts.astype(np.float64, copy=False)
+        pts = pts.reshape(-1, 3)
+        n = len(pts)
+        a, b = self._get_screen_transform(pts.dtype)
+        screen = _project_batch(pts, a, b, self._projection_buffer(pts.dtype, n))
+        result = self._projection_buffer(np.int64, n)
+        np.copyto(result, screen, casting='unsafe')  # truncates like astype(np.int64)
+        return result
+
+    def _projection_buffer(self, dtype, n: int) -> np.ndarray:
+        """
+        (n, 2) view of a reused per-dtype output buffer, grown geometrically and never shrunk.
+        Its contents are only valid until the next _project_points call.
+        """
+        dtype = np.dtype(dtype)
+        buffer = self._projection_buffers.get(dtype)
+        if buffer is None or len(buffer) < n:
+            buffer = np.empty((max(n, 2 * len(buffer) if buffer is not None else 0), 2), dtype=dtype)
+            self._projection_buffers[dtype] = buffer
+        return buffer[:n]
+
+    def _agent_sprite(self, color) -> pygame.Surface:
+        """Circle sprite for an agent color — rendered once per distinct color."""
+        sprite = self._agent_sprites.get(color)
+        if sprite is None:
+            r = self.agent_radius
+            sprite = pygame.Surface((2 * r, 2 * r), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (r, r), r)
+            # Match the display pixel format so blits take SDL's fast path
+            sprite = sprite.convert_alpha()
+            self._agent_sprites[color] = sprite
+        return sprite
+
+    def _refresh_agent_arrays(self):
+        """
+        Snapshot positioned agents into the SoA buffers — one pass over simulator.agents per tick.
+        Positions are written in place into a reused (capacity, 3) array.
+        """
+        positions = []
+        sprites = self._agent_sprite_refs
+        sprites.clear()
+        # Agents can enter a space or change color on any tick, so both are re-read every frame;
+        # the sprite cache is probed directly and _agent_sprite is called only for a new color
+        cached_sprite = self._agent_sprites.get
+        default_color = self.agent_color
+        for agent in self.simulator.agents:
+            pos = agent.space_state.get("position")
+            if pos and len(pos) == 3:
+                positions.append(pos)
+                # Use agent's color if available, otherwise default color
+                color = getattr(agent, 'color', default_color)
+                sprites.append(cached_sprite(color) or self._agent_sprite(color))
+
+        n = len(positions)
+        if n > len(self._agent_positions):
+            # Grow geometrically so steady-state ticks never reallocate
+            self._agent_positions = np.empty((max(n, 2 * len(self._agent_positions)), 3), dtype=np.float32)
+        if n:
+            self._agent_positions[:n] = np.fromiter(
+                chain.from_iterable(positions), dtype=np.float32, count=3 * n
+            ).reshape(n, 3)
+        self._agent_count = n
+
+    def _draw_agents(self):
+        """Draw agents as points — positions projected in one batch, sprites blitted in one call."""
+        n = self._agent_count
+        if not n:
+            self._agent_dests = []
+            return
+
+        sprites = self._agent_sprite_refs
+        r = self.agent_radius
+        # Sprite top-left corners, offset once for the whole array
+        screen = self._project_points(self._agent_positions[:n]) - r
+        # Cull agents whose sprite lies entirely off-screen
+        xs, ys = screen[:, 0], screen[:, 1]
+        visible = (xs > -2 * r) & (xs < self.width) & (ys > -2 * r) & (ys < self.height)
+
+        # Stream (sprite, dest) pairs straight into one batched blit — no per-agent tuples or int() calls
+        if visible.all():
+            self._agent_dests = screen.tolist()
+            self._blit_sprites(zip(sprites, self._agent_dests))
+        else:
+            index = np.flatnonzero(visible)
+            self._agent_dests = screen[index].tolist()
+            self._blit_sprites(zip(map(sprites.__getitem__, index.tolist()), self._agent_dests))
 
-        # Center on screen
-        x_screen = self.width // 2 + x_screen
-        y_screen = self.height // 2 - y_screen  # Invert Y-axis for pygame
+    def _blit_sprites(self, pairs):
+        """
+        Blit (sprite, dest) pairs in a single call.
+        Uses pygame-ce's fblits when available (no per-blit Rect results), blits(doreturn=0) otherwise.
+        """
+        fblits = getattr(self.screen, 'fblits', None)
+        if fblits is not None:
+            fblits(pairs)
+        else:
+            self.screen.blits(pairs, doreturn=0)
 
-        return x_screen, y_screen
+    def _handle_event(self, event) -> bool:
+        """
+        Apply one input event to the camera, marking the frame dirty when the view changes.
+        Returns False when the window should close.
+        """
+        if event.type == pygame.QUIT:
+            return False
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button in self._drag_handlers:  # Left or right mouse button
+                self.dragging = True
+                self.drag_button = event.button
+                self.last_mouse_pos = event.pos
+            elif event.button in self._ZOOM_FACTORS:  # Mouse wheel / touchpad scroll
+                self.zoom *= self._ZOOM_FACTORS[event.button]
+                self._dirty = True
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if event.button in self._drag_handlers:  # Left or right mouse button
+                self.dragging = False
+                self.drag_button = 0
+        elif event.type == pygame.MOUSEMOTION:
+            if self.dragging:
+                dx = event.pos[0] - self.last_mouse_pos[0]
+                dy = event.pos[1] - self.last_mouse_pos[1]
+                self._drag_handlers[self.drag_button](dx, dy)
+                self.last_mouse_pos = event.pos
+                self._dirty = True
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                return False
+        elif event.type == pygame.WINDOWEXPOSED:
+            self._dirty = True
+            self._agent_rects = None  # The whole window needs repainting
+        return True
+
+    def _pan(self, dx: int, dy: int):
+        """Left-button drag — move the camera, scaled so panning speed is constant on screen."""
+        pan_factor = self.pan_speed / self.zoom
+        self.camera_offset_x -= dx * pan_factor
+        self.camera_offset_y += dy * pan_factor
+
+    def _rotate(self, dx: int, dy: int):
+        """Right-button drag — rotate the camera."""
+        self.camera_angle_y += dx * 0.01
+        self.camera_angle_x += dy * 0.01
+
+    def _pump_events(self) -> bool:
+        """Drain the event queue through _handle_event. Returns False when the window should close."""
+        running = True
+        for event in pygame.event.get():
+            if not self._handle_event(event):
+                running = False
+        return running
 
     def render_tick(self, tick: int):
         """Render the current simulation state"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button in [1, 3]:  # Left or right mouse button
-                    self.dragging = True
-                    self.drag_button = event.button
-                    self.last_mouse_pos = event.pos
-                elif event.button == 4:  # Mouse wheel up / touchpad scroll up
-                    self.zoom *= 1.1
-                elif event.button == 5:  # Mouse wheel down / touchpad scroll down
-                    self.zoom *= 0.9
-                elif event.button == 6:  # Touchpad scroll left
-                    self.zoom *= 0.95
-                elif event.button == 7:  # Touchpad scroll right
-                    self.zoom *= 1.05
-            elif event.type == pygame.MOUSEBUTTONUP:
-                if event.button in [1, 3]:  # Left or right mouse button
-                    self.dragging = False
-                    self.drag_button = 0
-            elif event.type == pygame.MOUSEMOTION:
-                if self.dragging:
-                    dx = event.pos[0] - self.last_mouse_pos[0]
-                    dy = event.pos[1] - self.last_mouse_pos[1]
-
-                    if self.drag_button == 1:  # Left mouse button - pan
-                        # Adjust panning speed based on zoom level
-                        pan_factor = self.pan_speed / self.zoom
-                        self.camera_offset_x -= dx * pan_factor
-                        self.camera_offset_y += dy * pan_factor
-                    elif self.drag_button == 3:  # Right mouse button - rotate
-                        # Adjust rotation speed
-                        self.camera_angle_y += dx * 0.01
-                        self.camera_angle_x += dy * 0.01
-
-                    self.last_mouse_pos = event.pos
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    pygame.quit()
-                    sys.exit()
-
-        # Clear screen
-        self.screen.fill(self.background_color)
-
-        # Draw coordinate axes for reference
-        self.draw_axes()
+        if not self._pump_events():
+            pygame.quit()
+            sys.exit()
+
+        self._refresh_agent_arrays()
+        # Skip the redraw when nothing visible changed since the last frame (e.g. all agents in a delay)
+        frame_state = self._frame_state()
+        if self._dirty or frame_state != self._last_frame_state:
+            self._draw_scene()
+            self._last_frame_state = frame_state
+            self._dirty = False
+        self.clock.tick(10) # Cap at 10 FPS
 
-        # Draw obstacles from CollisionSpace if available
-        self._draw_obstacles()
+    def _frame_state(self) -> tuple:
+        """Camera, obstacles and agent snapshot — equal states render identical frames."""
+        return (self._view_state(), self._obstacle_signature(),
+                self._agent_positions[:self._agent_count].tobytes(), tuple(self._agent_sprite_refs))
+
+    def _draw_scene(self):
+        """Draw and present one frame from the current camera and agent snapshot."""
+        previous_rects = self._agent_rects
+        small = self._agent_count <= self._DIRTY_RECT_LIMIT
+        if previous_rects is not None and small and self._background_current():
+            # Only agents moved — restore the background under last frame's sprites, redraw the agents
+            # and present just the old and new sprite rects
+            background = self._background
+            self.screen.blits(((background, rect, rect) for rect in previous_rects), doreturn=0)
+            self._draw_agents()
+            self._agent_rects = self._sprite_rects()
+            pygame.display.update(previous_rects + self._agent_rects)
+            return
+
+        # Clear screen, draw coordinate axes and obstacles (cached while the camera is still)
+        self._draw_background()
 
         # Draw agents
-        for agent in self.simulator.agents:
-            if hasattr(agent, 'space_state') and agent.space_state:
-                pos = agent.space_state.get("position")
-                if pos and len(pos) == 3:
-                    x, y, z = pos
-                    screen_x, screen_y = self.project_3d_to_2d(x, y, z)
-
-                    # Draw agent as a point
-                    # Use agent's color if available, otherwise default color
-                    agent_color = getattr(agent, 'color', self.agent_color)
-                    pygame.draw.circle(self.screen, agent_color, (int(screen_x), int(screen_y)), 5)
+        self._draw_agents()
 
         # Update display
         pygame.display.flip()
-        self.clock.tick(10) # Cap at 10 FPS
+        self._agent_rects = self._sprite_rects() if small else None
+
+    def _sprite_rects(self) -> List[pygame.Rect]:
+        """Screen rects covered by the agent sprites drawn this frame."""
+        size = 2 * self.agent_radius
+        return [pygame.Rect(x, y, size, size) for x, y in self._agent_dests]
+
+    def _obstacle_signature(self) -> tuple:
+        """
+        Identity, length and mutation counter of every space's obstacle list —
+        changes whenever an obstacle is added or removed.
+        """
+        signature = []
+        for space in getattr(self.simulator, 'spaces', {}).values():
+            obstacles = getattr(space, '_obstacles', None)
+            if obstacles:
+                signature.append((id(obstacles), len(obstacles), getattr(space, '_obstacles_version', 0)))
+        return tuple(signature)
+
+    def _refresh_obstacle_cache(self):
+        """Collect live obstacles from CollisionSpace and ColoredSpace into a flat list."""
+        self._static_prisms = []
+        for space in getattr(self.simulator, 'spaces', {}).values():
+            # Check if the space has obstacles (CollisionSpace or ColoredSpace)
+            obstacles = getattr(space, '_obstacles', None)
+            if obstacles:
+                # Skip removed obstacles and degenerate polygons
+                self._static_prisms.extend(
+                    obstacle for obstacle in obstacles if obstacle is not None and len(obstacle[0]) >= 3
+                )
+
+        # Reuse the stacked vertices of surviving prisms; obstacles that are gone drop out of the cache
+        cache = {}
+        vertices = []
+        self._prism_spans = []
+        start = 0
+        for prism in self._static_prisms:
+            entry = self._obstacle_cache.get(id(prism))
+            if entry is None or entry[0] is not prism:  # identity check guards against id() reuse
+                # Stacked (2V, 3) world vertices — base rows then top (base Z + height) rows
+                base = np.asarray(prism[0], dtype=np.float64)
+                top = base.copy()
+                top[:, 2] += prism[1]
+                entry = (prism, np.vstack((base, top)))
+            cache[id(prism)] = entry
+            vertices.append(entry[1])
+            self._prism_spans.append((start, len(prism[0])))
+            start += len(entry[1])
+        self._obstacle_cache = cache
+        self._prism_vertices = np.concatenate(vertices) if vertices else np.empty((0, 3))
+        self._prism_screen_version = -1
+        self._obstacles_signature = self._obstacle_signature()
+
+    def invalidate_obstacles(self):
+        """Force obstacles to be re-collected — for code that mutates a space's _obstacles directly."""
+        self._obstacles_signature = None
+        self._background_key = None
+
+    def _draw_background(self):
+        """
+        Fill, axes and obstacles — the static part of the frame.
+        Rendered once per camera or obstacle change, then reused as a single full-screen blit.
+        """
+        if self._background_current():
+            self.screen.blit(self._background, (0, 0))
+            return
+
+        self.screen.fill(self.background_color)
+        self.draw_axes()
+        self._draw_obstacles()
+        if self._background is None:
+            self._background = self.screen.copy()
+        else:
+            self._background.blit(self.screen, (0, 0))
+        self._background_key = (self._view_version, self._obstacles_signature)
+
+    def _background_current(self) -> bool:
+        """Sync camera and obstacle state, then report whether the cached background still matches it."""
+        self._sync_view_version()
+        if self._obstacle_signature() != self._obstacles_signature:
+            self._refresh_obstacle_cache()
+        return (self._view_version, self._obstacles_signature) == self._background_key
 
     def _draw_obstacles(self):
         """Draw obstacles from CollisionSpace and ColoredSpace if available"""
-        if hasattr(self.simulator, 'spaces'):
-            for space_name, space in self.simulator.spaces.items():
-                # Check if the space has obstacles (CollisionSpace or ColoredSpace)
-                if hasattr(space, '_obstacles') and space._obstacles:
-                    for obstacle in space._obstacles:
-                        if obstacle is not None:  # Skip removed obstacles
-                            self._draw_prism(obstacle)
-
-    def _draw_prism(self, prism):
+        self._sync_view_version()
+        if self._obstacle_signature() != self._obstacles_signature:
+            self._refresh_obstacle_cache()
+        for prism, screen_points in zip(self._static_prisms, self._project_prisms()):
+            if screen_points is not None:  # None — off-screen
+                self._draw_prism(prism, screen_points)
+
+    def _view_state(self) -> tuple:
+        """Everything the projection depends on."""
+        return (self.camera_angle_x, self.camera_angle_y,
+                self.camera_offset_x, self.camera_offset_y, self.camera_offset_z,
+                self.zoom, self.width, self.height)
+
+    def _sync_view_version(self):
+        """Bump _view_version if the camera moved since the last frame."""
+        state = self._view_state()
+        if state != self._last_view_state:
+            self._last_view_state = state
+            self._view_version += 1
+
+    def _project_prisms(self) -> List[Optional[tuple]]:
+        """
+        Screen-space (base, top) polygons of every static prism, or None for prisms that are off-screen.
+        All prism vertices are projected in a single batch, and only when _view_version changes.
+        """
+        if self._prism_screen_version != self._view_version:
+            projected = self._project_points(self._prism_vertices)
+            screen = []
+            if self._prism_spans:
+                # Screen bbox of every prism at once, then reject those that miss the viewport
+                # (2px margin for the borders) before any per-prism Python work
+                starts = [start for start, _ in self._prism_spans]
+                lo = np.minimum.reduceat(projected, starts, axis=0)
+                hi = np.maximum.reduceat(projected, starts, axis=0)
+                visible = ((hi[:, 0] >= -2) & (hi[:, 1] >= -2)
+                           & (lo[:, 0] < self.width + 2) & (lo[:, 1] < self.height + 2)).tolist()
+                for (start, n), shown in zip(self._prism_spans, visible):
+                    if shown:
+                        polygon = projected[start:start + 2 * n].tolist()
+                        screen.append((polygon[:n], polygon[n:]))
+                    else:
+                        screen.append(None)
+            self._prism_screen = screen
+            self._prism_screen_version = self._view_version
+        return self._prism_screen
+
+    def _draw_prism(self, prism, screen_points):
         """
         Draw a prism obstacle in 3D space.
         Supports both formats:
         - CollisionSpace: (points_3d, height)
         - ColoredSpace: (points_3d, height, color, alpha)
+        :param screen_points: (base, top) screen polygons from _project_prisms
         """
         # Check if prism has color/alpha (ColoredSpace) or just geometry (CollisionSpace)
         if len(prism) == 4:
-            points_3d, height, color, alpha = prism
+            color, alpha = prism[2], prism[3]
         else:
-            points_3d, height = prism
             color = self.obstacle_color
             alpha = 255
 
-        if len(points_3d) < 3:
-            return  # Not a valid polygon
-
-        # Draw the base polygon
-        base_screen_points = []
-        for point in points_3d:
-            x, y, z = point
-            screen_x, screen_y = self.project_3d_to_2d(x, y, z)
-            base_screen_points.append((int(screen_x), int(screen_y)))
+        base_screen_points, top_screen_points = screen_points
+        # Flat prisms (zero height, or seen from straight above) project both faces onto the same pixels
+        flat = base_screen_points == top_screen_points
 
+        # Draw the base polygon — on a flat prism only the translucent blend is not repainted by the top pass
         if len(base_screen_points) > 2:
-            # Create surface for alpha support
             if alpha < 255:
-                # Use pygame.Surface with SRCALPHA for transparency
-                base_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-                pygame.draw.polygon(base_surface, (*color, alpha), base_screen_points)
-                self.screen.blit(base_surface, (0, 0))
-            else:
+                self._draw_translucent_polygon((*color, alpha), base_screen_points)
+            elif not flat:
                 pygame.draw.polygon(self.screen, color, base_screen_points)
-            pygame.draw.polygon(self.screen, (200, 200, 200), base_screen_points, 2)  # Border
+            if not flat:
+                pygame.draw.polygon(self.screen, (200, 200, 200), base_screen_points, 2)  # Border
 
         # Draw the top polygon (at base Z + height)
-        top_screen_points = []
-        for point in points_3d:
-            x, y, z = point
-            # Assuming height is added to the Z coordinate
-            top_z = z + height
-            screen_x, screen_y = self.project_3d_to_2d(x, y, top_z)
-            top_screen_points.append((int(screen_x), int(screen_y)))
-
         if len(top_screen_points) > 2:
             if alpha < 255:
-                top_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-                pygame.draw.polygon(top_surface, (*color, alpha), top_screen_points)
-                self.screen.blit(top_surface, (0, 0))
+                self._draw_translucent_polygon((*color, alpha), top_screen_points)
             else:
                 pygame.draw.polygon(self.screen, color, top_screen_points)
             pygame.draw.polygon(self.screen, (200, 200, 200), top_screen_points, 2)  # Border
 
-        # Draw vertical lines connecting base and top
-        for i in range(len(points_3d)):
-            base_point = points_3d[i]
-            top_point = (points_3d[i][0], points_3d[i][1], points_3d[i][2] + height)
-
-            base_x, base_y = self.project_3d_to_2d(base_point[0], base_point[1], base_point[2])
-            top_x, top_y = self.project_3d_to_2d(top_point[0], top_point[1], top_point[2])
+        # Draw vertical lines connecting base and top — zero-length on a flat prism
+        if not flat:
+            for base_point, top_point in zip(base_screen_points, top_screen_points):
+                pygame.draw.line(self.screen, (200, 200, 200), base_point, top_point, 2)
 
-            pygame.draw.line(self.screen, (200, 200, 200), (int(base_x), int(base_y)), (int(top_x), int(top_y)), 2)
+    def _draw_translucent_polygon(self, rgba, points):
+        """
+        Alpha-blend a polygon onto the screen through a shared SRCALPHA scratch surface.
+        Only the polygon's bbox — already clipped to the window by pygame.draw — is blitted and cleared.
+        """
+        if self._scratch_surface is None or self._scratch_surface.get_size() != (self.width, self.height):
+            self._scratch_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            self._scratch_surface.fill((0, 0, 0, 0))
+        scratch = self._scratch_surface
+        bbox = pygame.draw.polygon(scratch, rgba, points)
+        self.screen.blit(scratch, bbox, bbox)
+        scratch.fill((0, 0, 0, 0), bbox)
 
     def draw_axes(self):
-        """Draw coordinate axes for reference"""
-        # Draw X-axis (red)
-        start_x, start_y = self.project_3d_to_2d(0, 0, 0)
-        end_x, end_y = self.project_3d_to_2d(5, 0, 0)  # 5 units in X direction
-        pygame.draw.line(self.screen, (255, 0, 0), (start_x, start_y), (end_x, end_y), 2)
-
-        # Draw Y-axis (green)
-        start_x, start_y = self.project_3d_to_2d(0, 0, 0)
-        end_x, end_y = self.project_3d_to_2d(0, 5, 0)  # 5 units in Y direction
-        pygame.draw.line(self.screen, (0, 255, 0), (start_x, start_y), (end_x, end_y), 2)
-
-        # Draw Z-axis (blue)
-        start_x, start_y = self.project_3d_to_2d(0, 0, 0)
-        end_x, end_y = self.project_3d_to_2d(0, 0, 5)  # 5 units in Z direction
-        pygame.draw.line(self.screen, (0, 0, 255), (start_x, start_y), (end_x, end_y), 2)
+        """Draw coordinate axes for reference — endpoints reprojected only when the camera moves"""
+        self._sync_view_version()
+        if self._cached_axes_version != self._view_version:
+            a, b = self._get_screen_transform()
+            self._cached_axes = _project_batch(self._AXIS_PTS, a, b, np.empty((4, 2))).tolist()
+            self._cached_axes_version = self._view_version
+
+        origin, x_end, y_end, z_end = self._cached_axes
+        pygame.draw.line(self.screen, (255, 0, 0), origin, x_end, 2)  # X-axis (red)
+        pygame.draw.line(self.screen, (0, 255, 0), origin, y_end, 2)  # Y-axis (green)
+        pygame.draw.line(self.screen, (0, 0, 255), origin, z_end, 2)  # Z-axis (blue)
 
     def show_final(self):
         """Keep the window open after simulation ends with full navigation support"""
         running = True
+        self._dirty = True
+        self._refresh_agent_arrays()
         while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button in [1, 3]:  # Left or right mouse button
-                        self.dragging = True
-                        self.drag_button = event.button
-                        self.last_mouse_pos = event.pos
-                    elif event.button == 4:  # Mouse wheel up / touchpad scroll up
-                        self.zoom *= 1.1
-                    elif event.button == 5:  # Mouse wheel down / touchpad scroll down
-                        self.zoom *= 0.9
-                    elif event.button == 6:  # Touchpad scroll left
-                        self.zoom *= 0.95
-                    elif event.button == 7:  # Touchpad scroll right
-                        self.zoom *= 1.05
-                elif event.type == pygame.MOUSEBUTTONUP:
-                    if event.button in [1, 3]:  # Left or right mouse button
-                        self.dragging = False
-                        self.drag_button = 0
-                elif event.type == pygame.MOUSEMOTION:
-                    if self.dragging:
-                        dx = event.pos[0] - self.last_mouse_pos[0]
-                        dy = event.pos[1] - self.last_mouse_pos[1]
-
-                        if self.drag_button == 1:  # Left mouse button - pan
-                            # Adjust panning speed based on zoom level
-                            pan_factor = self.pan_speed / self.zoom
-                            self.camera_offset_x -= dx * pan_factor
-                            self.camera_offset_y += dy * pan_factor
-                        elif self.drag_button == 3:  # Right mouse button - rotate
-                            # Adjust rotation speed
-                            self.camera_angle_y += dx * 0.01
-                            self.camera_angle_x += dy * 0.01
-
-                        self.last_mouse_pos = event.pos
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        running = False
-
-            # Continue rendering with current state
-            self.screen.fill(self.background_color)
-            self.draw_axes()
-
-            # Draw obstacles
-            self._draw_obstacles()
-
-            # Draw agents
-            for agent in self.simulator.agents:
-                if hasattr(agent, 'space_state') and agent.space_state:
-                    pos = agent.space_state.get("position")
-                    if pos and len(pos) == 3:
-                        x, y, z = pos
-                        screen_x, screen_y = self.project_3d_to_2d(x, y, z)
-
-                        # Draw agent as a point
-                        # Use agent's color if available, otherwise default color
-                        agent_color = getattr(agent, 'color', self.agent_color)
-                        pygame.draw.circle(self.screen, agent_color, (int(screen_x), int(screen_y)), 5)
-
-            pygame.display.flip()
-            self.clock.tick(60)  # Cap at 60 FPS
+            if self.dragging:
+                # Active drag — poll so every motion event lands in the next frame
+                running = self._pump_events()
+            else:
+                # Idle — block until input arrives (or one ~60 FPS frame elapses) instead of spinning
+                event = pygame.event.wait(16)
+                if event.type != pygame.NOEVENT:
+                    running = self._handle_event(event) and self._pump_events()
+
+            # Simulation is over — only the camera can change the frame, so redraw only when it moved
+            if self._dirty:
+                self._draw_scene()
+                self._dirty = False
+            if self.dragging:
+                self.clock.tick(60)  # Cap at 60 FPS while polling
 
         pygame.quit()
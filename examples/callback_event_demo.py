@@ -27,10 +27,10 @@ class WorkerAgent(BaseAgent):
     def __init__(self):
         super().__init__()
         self.alerted = False
-        self.agent_id = id(self)
+        self.agent_id = self.id
 
     def on_enter_block(self, block):
-        print(f"  [AGENT {self.agent_id}] Entered {block.__class__.__name__}")
+        print(f"  [AGENT {self.agent_id}] Entered {type(block).__name__}")
 
     def on_event(self, event):
         if event == "factory_alert":
@@ -54,10 +54,10 @@ def main():
 
     # Block callbacks
     def block_on_enter(agent):
-        print(f"[BLOCK] Agent {agent.agent_id} ENTERED {agent.current_block.__class__.__name__}")
+        print(f"[BLOCK] Agent {agent.agent_id} ENTERED {agent.current_type(block).__name__}")
 
     def block_on_exit(agent):
-        print(f"[BLOCK] Agent {agent.agent_id} EXITED {agent.current_block.__class__.__name__}")
+        print(f"[BLOCK] Agent {agent.agent_id} EXITED {agent.current_type(block).__name__}")
 
     source.on_enter = block_on_enter
     source.on_exit = block_on_exit
@@ -9,7 +9,7 @@ class HappyAgent(BaseAgent):
         # Become happy if entering the source block
         if isinstance(block, SourceBlock):
             self.is_happy = True
-            print(f"Agent became happy in {block.__class__.__name__}")
+            print(f"Agent became happy in {type(block).__name__}")
 
     def on_event(self, event):
         pass  # Not using events in this example
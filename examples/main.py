@@ -9,16 +9,57 @@ Modules must:
   - Define a `main()` function.
   - Not be this file (example.py).
 
-Runs in sorted filename order.
+Runs in sorted filename order. Pass --parallel to run examples concurrently
+in a process pool (output of different examples may interleave).
 """
 
 import os
 import sys
 import importlib.util
+import multiprocessing
 from pathlib import Path
+from typing import Optional, Tuple
 
-def discover_and_run_examples():
-    """Discover and run all example modules in this directory."""
+
+def _run_example(job: Tuple[int, Path]) -> Tuple[int, str, Optional[str]]:
+    """
+    Import one example module and run its main().
+    Module-level so a multiprocessing pool can pickle it.
+    Returns (index, module name, error message or None).
+    """
+    i, example_path = job
+    module_name = example_path.stem
+
+    print("=" * 80)
+    print(f"🚀 RUNNING EXAMPLE {i}: {module_name}")
+    print("=" * 80)
+
+    try:
+        # Dynamically import the module
+        spec = importlib.util.spec_from_file_location(module_name, example_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+
+        # Run main() if it exists
+        if hasattr(module, "main") and callable(module.main):
+            module.main()
+        else:
+            print(f"⚠️  Module {module_name} has no main() function — skipping.")
+
+        print(f"✅ EXAMPLE {i} COMPLETED: {module_name}\n")
+        return i, module_name, None
+
+    except Exception as e:
+        print(f"❌ FAILED EXAMPLE {i}: {module_name}")
+        print(f"   Error: {e}\n")
+        return i, module_name, str(e)
+
+def discover_and_run_examples(parallel: bool = False):
+    """
+    Discover and run all example modules in this directory.
+    :param parallel: Run examples concurrently, one process per CPU — they share no state.
+    """
     # Get directory of this file
     examples_dir = Path(__file__).parent.resolve()
     print(f"Scanning for examples in: {examples_dir}\n")
@@ -36,36 +77,17 @@ def discover_and_run_examples():
 
     print(f"Found {len(example_files)} example(s):\n")
 
-    for i, example_path in enumerate(example_files, 1):
-        module_name = example_path.stem
-
-        print("=" * 80)
-        print(f"🚀 RUNNING EXAMPLE {i}: {module_name}")
-        print("=" * 80)
-
-        try:
-            # Dynamically import the module
-            spec = importlib.util.spec_from_file_location(module_name, example_path)
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)
-
-            # Run main() if it exists
-            if hasattr(module, "main") and callable(module.main):
-                module.main()
-            else:
-                print(f"⚠️  Module {module_name} has no main() function — skipping.")
-
-            print(f"✅ EXAMPLE {i} COMPLETED: {module_name}\n")
-
-        except Exception as e:
-            print(f"❌ FAILED EXAMPLE {i}: {module_name}")
-            print(f"   Error: {e}\n")
-            continue
+    jobs = list(enumerate(example_files, 1))
+    if parallel:
+        with multiprocessing.Pool() as pool:
+            pool.map(_run_example, jobs)
+    else:
+        for job in jobs:
+            _run_example(job)
 
     print("=" * 80)
     print("🏁 ALL EXAMPLES COMPLETED")
     print("=" * 80)
 
 if __name__ == "__main__":
-    discover_and_run_examples()
+    discover_and_run_examples(parallel="--parallel" in sys.argv[1:])
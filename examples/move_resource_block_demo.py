@@ -11,22 +11,23 @@ from aim.blocks import move_resoure
 from aim.blocks.source import SourceBlock
 from aim.blocks.delay import DelayBlock
 from aim.core import simulator
-from aim.visualization import Pygame3DViewer
+from aim.visualization import make_viewer
 from aim.spaces.no_collision_space import NoCollisionSpace
+from aim.util import TickLogger
 
 class ProcessAgent(BaseAgent):
     """Agent that represents a process requiring resources."""
     def __init__(self):
         super().__init__()
-        self.agent_id = id(self)
+        self.agent_id = self.id
 
 def main():
     # Create simulator with 3D visualization
     sim = Simulator(max_ticks=110)
 
 
-    # Create a Pygame 3D viewer
-    viewer = Pygame3DViewer(sim, width = 1000, height=500)
+    # Create a Pygame 3D viewer (None when AIM_HEADLESS is set)
+    viewer = make_viewer(sim, width=1000, height=500)
     sim.viewer = viewer
 
     space = NoCollisionSpace()
@@ -63,19 +64,24 @@ def main():
     release_resource.connect(completed)
 
 
+    # Hook output is buffered and written once the run ends
+    logger = TickLogger()
+
     def acquire_resource_on_enter(agent: BaseAgent):
         agent.resource_agent = agent._acquired_resources[0]
-        print(agent.resource_agent)
+        logger.log(sim.current_tick, str(agent.resource_agent))
 
     # setup hooks
     acquire_resource.on_enter = acquire_resource_on_enter
-    queue2.on_enter = lambda _: print("entered quee")
-    send_resource.on_enter = lambda _: print("entered send_resource")
-    send_resource.on_exit = lambda _: print("exited send_resource")
+    queue2.on_enter = lambda _: logger.log(sim.current_tick, "entered quee")
+    send_resource.on_enter = lambda _: logger.log(sim.current_tick, "entered send_resource")
+    send_resource.on_exit = lambda _: logger.log(sim.current_tick, "exited send_resource")
 
     sim.run()
+    logger.flush()
 
-    viewer.show_final()
+    if viewer is not None:
+        viewer.show_final()
 
 if __name__ == "__main__":
     main()
@@ -2,12 +2,12 @@
 Example demonstrating an agent following a multi-angle path with obstacle avoidance
 """
 
-from aim import Simulator, BaseAgent
+from aim import Simulator, BaseAgent, BaseBlock
 from aim.blocks.source import SourceBlock
 from aim.blocks.sink import SinkBlock
 from aim.blocks.move import MoveBlock
 from aim.spaces.collision_space import CollisionSpace, Prism
-from aim.visualization import Pygame3DViewer
+from aim.visualization import make_viewer
 
 def main():
     # Create simulator with 3D visualization
@@ -39,8 +39,8 @@ def main():
 
     space = CollisionSpace(obstacles=obstacles)
 
-    # Create a Pygame 3D viewer
-    viewer = Pygame3DViewer(sim, width=1800, height=1200)
+    # Create a Pygame 3D viewer (None when AIM_HEADLESS is set)
+    viewer = make_viewer(sim, width=1800, height=1200)
     sim.viewer = viewer
 
     # Register the space with the simulator
@@ -65,18 +65,19 @@ def main():
             self.speed = 0.7
 
         def on_enter_block(self, block: BaseBlock) -> None:
-            tracked_agents.append(self)
+            tracked_agents.add(self)
 
 
         def spawn_track(self, space):
             trace: TraceAgent = TraceAgent(self.space_state['position'])
             space.register(trace, { 'start_position': trace.start_position, 'target_position': trace.target_position, 'speed': trace.speed })
-            sim.add_agent(trace)
+            return trace
 
 
 
 
-    tracked_agents = []
+    # Agents still moving — finished ones are dropped so each tick only visits active agents
+    tracked_agents = set()
 
     # Create blocks
     source = SourceBlock(
@@ -86,11 +87,15 @@ def main():
     )
 
     def callback_event():
-        for agent in tracked_agents:
-            if not space.is_movement_complete(agent):
-                agent.spawn_track(space)
-
-    sim.schedule_event(callback=lambda _: callback_event(),
+        traces = []
+        for agent in list(tracked_agents):
+            if space.is_movement_complete(agent):
+                tracked_agents.discard(agent)
+            else:
+                traces.append(agent.spawn_track(space))
+        sim.add_agents(traces)
+
+    sim.schedule_event(callback=callback_event,
             delay_ticks=0,
             recurring=True
     )
@@ -114,7 +119,8 @@ def main():
     print(f"Agents completed: {sink.count}")
 
     # Keep the window open for post-simulation navigation
-    viewer.show_final()
+    if viewer is not None:
+        viewer.show_final()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
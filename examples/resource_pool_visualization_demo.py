@@ -5,55 +5,46 @@ This example demonstrates a warehouse fulfillment center where orders must acqui
 workers, move to shelves to pick items, move to packing stations, and then release workers.
 """
 
-import math
 from aim import Simulator, BaseAgent, ResourcePool, ResourceAgent, SeizeBlock, ReleaseBlock, QueueBlock, SinkBlock
 from aim.blocks.source import SourceBlock
-from aim.blocks.delay import DelayBlock
-from aim.blocks.move import MoveBlock
+from aim.blocks.composite import MoveDelaySeq
 from aim.spaces.collision_space import CollisionSpace
-from aim.visualization import Pygame3DViewer
+from aim.util import ring_positions
+from aim.visualization import make_viewer
+# Warehouse layout
+DISPATCH_LOCATION = (0, 0, 0)      # Start at dispatch area
+SHELF_LOCATION = (8, 0, 5)         # Go to shelf to pick item
+PACKING_LOCATION = (-5, 0, -5)     # Go to packing station
 
 class OrderAgent(BaseAgent):
     """Agent representing an order that needs to be fulfilled."""
     def __init__(self):
         super().__init__()
-        self.order_id = id(self)
+        self.order_id = self.id
         # Define the path through the warehouse
-        self.dispatch_location = (0, 0, 0)      # Start at dispatch area
-        self.shelf_location = (8, 0, 5)         # Go to shelf to pick item
-        self.packing_location = (-5, 0, -5)     # Go to packing station
+        self.dispatch_location = DISPATCH_LOCATION
+        self.shelf_location = SHELF_LOCATION
+        self.packing_location = PACKING_LOCATION
         self.current_stage = "queue"            # Track current stage for visualization
         self.color = (0, 255, 0)
         self.speed = 1.0
 
     def on_enter_block(self, block):
-        print(block)
+        print(type(block).__name__)
         # Set position based on current stage for visualization
-        if "Queue" in str(type(block)):
+        if isinstance(block, QueueBlock):
             self.space_state["position"] = self.dispatch_location
             self.current_stage = "queue"
-        elif "Seize" in str(type(block)):
+        elif isinstance(block, SeizeBlock):
             self.space_state["position"] = self.dispatch_location
             self.current_stage = "acquiring_worker"
-        elif "MoveBlock" in str(type(block)):
-            # Position will be handled by the MoveBlock based on movement
-            # For fixed visualization during move actions, we can update positions
-            if hasattr(self, 'current_stage') and self.current_stage == "going_to_shelf":
-                # During move to shelf, update position as it moves
-                pass  # MoveBlock will handle this
-            elif hasattr(self, 'current_stage') and self.current_stage == "going_to_packing":
-                # During move to packing station, update position as it moves
-                pass  # MoveBlock will handle this
-        elif "Delay" in str(type(block)):
-            # Set position based on which delay (picking or packing)
-            if hasattr(self, 'current_stage') and self.current_stage == "picking":
-                self.space_state["position"] = self.shelf_location
-            elif hasattr(self, 'current_stage') and self.current_stage == "packing":
-                self.space_state["position"] = self.packing_location
-        elif "Release" in str(type(block)):
+        elif isinstance(block, MoveDelaySeq):
+            # Position is handled by the space while moving, stages by the block's on_arrival
+            pass
+        elif isinstance(block, ReleaseBlock):
             self.space_state["position"] = self.packing_location
             self.current_stage = "releasing_worker"
-        elif "Sink" in str(type(block)):
+        elif isinstance(block, SinkBlock):
             self.space_state["position"] = (0, -10, 0)  # Completed orders area
             self.current_stage = "completed"
 
@@ -64,8 +55,8 @@ def main():
     # Create a NoCollisionSpace for spatial movement
     warehouse_space = CollisionSpace(obstacles=[])
 
-    # Create a Pygame 3D viewer
-    viewer = Pygame3DViewer(sim, width=1000, height=700)
+    # Create a Pygame 3D viewer (None when AIM_HEADLESS is set)
+    viewer = make_viewer(sim, width=1000, height=700)
     sim.viewer = viewer
 
 
@@ -83,12 +74,11 @@ def main():
     )
 
     # Set initial positions for worker resources (in a circle around dispatch area)
-    for i, resource in enumerate(worker_pool.available_resources):
-        angle = 2 * math.pi * i / 3
-        x = 3 * math.cos(angle)
-        z = 0
-        resource.space_state["position"] = (x, 0.5, z)  # Y=0.5 to make them visible above floor
-        resource.space_state["start_position"] = (x, 0.5, z)  # Y=0.5 to make them visible above floor
+    # Y=0.5 to make them visible above floor
+    worker_pool.bulk_set_positions(
+        ring_positions(len(worker_pool.available_resources), radius=3, y=0.5),
+        keys=("position", "start_position"),
+    )
 
     # Register the space with the simulator
     sim.add_space("warehouse", warehouse_space)
@@ -108,17 +98,13 @@ def main():
     # 3. Seize: Acquire worker
     acquire_worker = SeizeBlock(simulator=sim, resource_pool=worker_pool, resource_count=1)
 
-    # 4. Move: Go from dispatch to shelf
-    go_to_shelf = MoveBlock(simulator=sim, space_name="warehouse", speed=1.0)
-
-    # 5. Delay: Pick item
-    picking_time = DelayBlock(simulator=sim, delay_ticks=5)
-
-    # 6. Move: Go from shelf to packing station
-    go_to_packing = MoveBlock(simulator=sim, space_name="warehouse", speed=1.0)
-
-    # 7. Delay: Pack order
-    packing_time = DelayBlock(simulator=sim, delay_ticks=3)
+    # 4-7. Go to shelf, pick item (5 ticks), go to packing station, pack order (3 ticks)
+    pick_and_pack = MoveDelaySeq(
+        simulator=sim,
+        space_name="warehouse",
+        stages=[(SHELF_LOCATION, 5), (PACKING_LOCATION, 3)],
+        speed=1.0
+    )
 
     # 8. Release: Release worker back to pool
     release_worker = ReleaseBlock(simulator=sim, resource_pool=worker_pool)
@@ -130,53 +116,22 @@ def main():
     # Note: Blocks auto-register with simulator on creation, no need to call sim.add_block()
     source.connect(queue)
     queue.connect(acquire_worker)
-    acquire_worker.connect(go_to_shelf)
+    acquire_worker.connect(pick_and_pack)
+    pick_and_pack.connect(release_worker)
+    release_worker.connect(completed_orders)
 
-    # We need to set the start and target positions for the move blocks
-    # This requires setting these on the agents before they reach the move blocks
-    # We'll use block callbacks to update agent positions
+    # Orders leave from the dispatch area; stage names follow arrivals for visualization
     def on_going_to_shelf(agent):
         if isinstance(agent, OrderAgent):
             agent.start_position = agent.dispatch_location
-            agent.target_position = agent.shelf_location
             agent.current_stage = "going_to_shelf"
 
-            # Update the agent's position as it moves
-            if "position" not in agent.space_state:
-                agent.space_state["position"] = agent.start_position
-
-    def on_shelf_arrival(agent):
-        if isinstance(agent, OrderAgent):
-            agent.current_stage = "picking"
-            # Agent should be at shelf location now
-            agent.space_state["position"] = agent.shelf_location
-
-    def on_going_to_packing(agent):
+    def on_stage_arrival(agent, stage):
         if isinstance(agent, OrderAgent):
-            agent.start_position = agent.shelf_location
-            agent.target_position = agent.packing_location
-            agent.current_stage = "going_to_packing"
+            agent.current_stage = ("picking", "packing")[stage]
 
-    def on_packing_arrival(agent):
-        if isinstance(agent, OrderAgent):
-            agent.current_stage = "packing"
-            # Agent should be at packing location now
-            agent.space_state["position"] = agent.packing_location
-
-    # Set up callbacks
-    go_to_shelf.on_enter = on_going_to_shelf
-    go_to_shelf.on_exit = lambda _: print("hello")
-    picking_time.on_enter = on_shelf_arrival
-    go_to_packing.on_enter = on_going_to_packing
-    packing_time.on_enter = on_packing_arrival
-
-    # Connect the remaining blocks
-    acquire_worker.connect(go_to_shelf)
-    go_to_shelf.connect(picking_time)
-    picking_time.connect(go_to_packing)
-    go_to_packing.connect(packing_time)
-    packing_time.connect(release_worker)
-    release_worker.connect(completed_orders)
+    pick_and_pack.on_enter = on_going_to_shelf
+    pick_and_pack.on_arrival = on_stage_arrival
 
     # Run simulation
     print("Starting warehouse fulfillment simulation with 3D visualization...")
@@ -190,7 +145,8 @@ def main():
     print(f"Workers occupied: {worker_pool.get_occupied_count()}")
 
     # Keep the window open for post-simulation navigation
-    viewer.show_final()
+    if viewer is not None:
+        viewer.show_final()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,43 +5,42 @@ This example demonstrates a simplified system where agents acquire resources,
 wait for a period of time, and then release resources, with basic visualization.
 """
 
-import math
+import numpy as np
 from aim import Simulator, BaseAgent, ResourcePool, ResourceAgent, SeizeBlock, ReleaseBlock, QueueBlock, SinkBlock
 from aim.blocks.source import SourceBlock
 from aim.blocks.delay import DelayBlock
-from aim.visualization import Pygame3DViewer
+from aim.util import ring_positions
+from aim.visualization import make_viewer
+
+# Where an agent is drawn while it is in each kind of block
+BLOCK_POSITIONS = {
+    SourceBlock: (-8, 0, 0),   # Source area (left)
+    QueueBlock: (-4, 0, 0),    # Queue area
+    SeizeBlock: (0, 0, 0),     # Resource acquisition area (center)
+    DelayBlock: (4, 0, 0),     # Processing area — during processing time
+    ReleaseBlock: (8, 0, 0),   # Release area (right)
+    SinkBlock: (0, -8, 0),     # Completed area (bottom)
+}
 
 class ProcessAgent(BaseAgent):
     """Agent that represents a process requiring resources."""
     def __init__(self):
         super().__init__()
-        self.agent_id = id(self)
+        self.agent_id = self.id
 
     def on_enter_block(self, block):
         # Set position based on which block the agent is in
         print('on_enter_block executed')
-        block_name = block.__class__.__name__
-
-        if "Source" in block_name:
-            self.space_state["position"] = (-8, 0, 0)  # Source area (left)
-        elif "Queue" in block_name:
-            self.space_state["position"] = (-4, 0, 0)  # Queue area
-        elif "Seize" in block_name:
-            self.space_state["position"] = (0, 0, 0)   # Resource acquisition area (center)
-        elif "Delay" in block_name:
-            # During processing time, move to processing area
-            self.space_state["position"] = (4, 0, 0)   # Processing area
-        elif "Release" in block_name:
-            self.space_state["position"] = (8, 0, 0)   # Release area (right)
-        elif "Sink" in block_name:
-            self.space_state["position"] = (0, -8, 0)  # Completed area (bottom)
+        position = BLOCK_POSITIONS.get(type(block))
+        if position is not None:
+            self.space_state["position"] = position
 
 def main():
     # Create simulator with 3D visualization
     sim = Simulator(max_ticks=80)
 
-    # Create a Pygame 3D viewer
-    viewer = Pygame3DViewer(sim)
+    # Create a Pygame 3D viewer (None when AIM_HEADLESS is set)
+    viewer = make_viewer(sim)
     sim.viewer = viewer
 
     # Create a ResourcePool with 2 worker resources
@@ -56,20 +55,18 @@ def main():
     )
 
     # Set initial positions for worker resources
-    for i, resource in enumerate(worker_pool.available_resources):
-        angle = 2 * math.pi * i / len(worker_pool.available_resources)
-        x = 2 * math.cos(angle)
-        z = 2 * math.sin(angle)
-        # Place workers slightly above the process line for visibility
-        resource.space_state["position"] = (x, 2, z)
+    # Place workers slightly above the process line for visibility
+    worker_pool.bulk_set_positions(ring_positions(len(worker_pool.available_resources), radius=2, y=2))
 
     # Create blocks following the process flow:
     # Source -> Queue -> Seize -> Delay -> Release -> Sink
 
+    spawn_counts = np.zeros(21, dtype=np.int8)
+    spawn_counts[::2] = 1  # Every other tick up to 20 — 11 agents total
     source = SourceBlock(
         simulator=sim,
         agent_class=ProcessAgent,
-        spawn_schedule=lambda tick: 1 if tick % 2 == 0 and tick <= 20 else 0  # 11 agents total
+        spawn_array=spawn_counts
     )
 
     queue = QueueBlock(simulator=sim)
@@ -87,7 +84,8 @@ def main():
 
     sim.run()
 
-    viewer.show_final()
+    if viewer is not None:
+        viewer.show_final()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,18 +6,19 @@ between different locations in 3D space.
 """
 
 import math
+import numpy as np
 from aim import Simulator, BaseAgent
 from aim.blocks.source import SourceBlock
 from aim.blocks.sink import SinkBlock
 from aim.blocks.move import MoveBlock
 from aim.spaces.no_collision_space import NoCollisionSpace
-from aim.visualization import Pygame3DViewer
+from aim.visualization import make_viewer
 
 class MovingAgent(BaseAgent):
     """Agent that moves through different locations."""
     def __init__(self):
         super().__init__()
-        self.agent_id = id(self)
+        self.agent_id = self.id
         self.color = (0, 255, 0)
 
     def on_enter_block(self, block):
@@ -31,8 +32,8 @@ def main():
     # Create a NoCollisionSpace for spatial movement
     space = NoCollisionSpace()
 
-    # Create a Pygame 3D viewer
-    viewer = Pygame3DViewer(sim, width=1000, height=700)
+    # Create a Pygame 3D viewer (None when AIM_HEADLESS is set)
+    viewer = make_viewer(sim, width=1000, height=700)
     sim.viewer = viewer
 
     # Register the space with the simulator
@@ -45,20 +46,25 @@ def main():
 
     # Create agents that move through these locations
     class WaypointAgent(BaseAgent):
+        # Shared by every agent — built once, not per spawn
+        waypoints = (start_location, mid_location, end_location)
+        # (start, target) pair for each move, indexed by current_waypoint_idx
+        legs = tuple(zip(waypoints, waypoints[1:]))
+
         def __init__(self):
             super().__init__()
-            self.waypoints = [start_location, mid_location, end_location]
             self.current_waypoint_idx = 0
-            self.start_position = self.waypoints[0]  # Need this for first move
-            self.target_position = self.waypoints[1]  # First destination
+            self.start_position, self.target_position = self.legs[0]  # First move
             self.space_state["position"] = self.waypoints[0]  # Start at first location
             self.color = (255, 0, 0)
 
     # Create blocks
+    spawn_counts = np.zeros(31, dtype=np.int8)
+    spawn_counts[::10] = 1  # Ticks 0, 10, 20, 30 — 4 agents total
     source = SourceBlock(
         simulator=sim,
         agent_class=WaypointAgent,
-        spawn_schedule=lambda tick: 1 if tick % 10 == 0 and tick <= 30 else 0  # 4 agents total
+        spawn_array=spawn_counts
     )
 
     # First move: Origin to mid point
@@ -77,24 +83,22 @@ def main():
 
     # Set up agent positions when entering move blocks
     def setup_first_move(agent):
-        if isinstance(agent, WaypointAgent):
-            if agent.current_waypoint_idx < len(agent.waypoints) - 1:
-                agent.start_position = agent.waypoints[agent.current_waypoint_idx]
-                agent.target_position = agent.waypoints[agent.current_waypoint_idx + 1]
+        if agent.current_waypoint_idx < len(agent.legs):
+            agent.start_position, agent.target_position = agent.legs[agent.current_waypoint_idx]
 
     def setup_second_move(agent):
-        if isinstance(agent, WaypointAgent):
-            # Update the waypoint index as the agent moves to next segment
-            agent.current_waypoint_idx += 1
-            if agent.current_waypoint_idx < len(agent.waypoints) - 1:
-                agent.start_position = agent.waypoints[agent.current_waypoint_idx]
-                agent.target_position = agent.waypoints[agent.current_waypoint_idx + 1]
+        # Update the waypoint index as the agent moves to next segment
+        agent.current_waypoint_idx += 1
+        if agent.current_waypoint_idx < len(agent.legs):
+            agent.start_position, agent.target_position = agent.legs[agent.current_waypoint_idx]
 
-    move1.on_enter = setup_first_move
-    move2.on_enter = setup_second_move
+    # Only WaypointAgents carry waypoints — dispatch on their class instead of checking isinstance per call
+    move1.on_enter_for(WaypointAgent, setup_first_move)
+    move2.on_enter_for(WaypointAgent, setup_second_move)
 
     sim.run()
-    viewer.show_final()
+    if viewer is not None:
+        viewer.show_final()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
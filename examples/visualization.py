@@ -1,5 +1,6 @@
 import sys
 import argparse
+from functools import lru_cache
 
 from aim.blocks.source import SourceBlock
 from aim.blocks.sink import SinkBlock
@@ -7,44 +8,59 @@ from aim.core.agent import BaseAgent
 from aim.core.simulator import Simulator
 from aim.spaces.manufacturing.conveyor_space import ConveyorSpace
 from aim.entities.manufacturing.conveyor import Conveyor
-from aim.visualization.console_viewer import ConsoleViewer
 from aim.blocks.manufacturing.conveyor_block import ConveyorBlock
 from aim.blocks import DelayBlock
 
 
-def create_viewer(viz_type: str, simulator):
+@lru_cache(maxsize=None)
+def _viewer_class(name: str):
+    """Import a viewer class on first use — the console path never loads matplotlib."""
+    import aim.visualization
+    return getattr(aim.visualization, name)
+
+
+def _console_viewer(simulator, render_every: int):
+    return _viewer_class("ConsoleViewer")(simulator, render_every=render_every)
+
+
+def _matplotlib_viewer(simulator, render_every: int):
+    try:
+        return _viewer_class("Matplotlib2DViewer")(simulator, render_every=render_every)
+    except ImportError as e:
+        print(f"[ERROR] matplotlib viewer not available: {e}", file=sys.stderr)
+        print("[INFO] Falling back to console viewer.", file=sys.stderr)
+        return _console_viewer(simulator, render_every)
+
+
+# One dict lookup per --viz value instead of a chain of string compares
+_VIEWERS = {
+    "console": _console_viewer,
+    "matplotlib": _matplotlib_viewer,
+}
+
+
+def create_viewer(viz_type: str, simulator, render_every: int = 1):
     """Factory function to create viewer based on type."""
-    if viz_type == "console":
-        from aim.visualization.console_viewer import ConsoleViewer
-        return ConsoleViewer(simulator)
-    elif viz_type == "matplotlib":
-        try:
-            from aim.visualization.matplotlib_viewer import Matplotlib2DViewer
-            return Matplotlib2DViewer(simulator)
-        except ImportError as e:
-            print(f"[ERROR] matplotlib viewer not available: {e}", file=sys.stderr)
-            print("[INFO] Falling back to console viewer.", file=sys.stderr)
-            from aim.visualization.console_viewer import ConsoleViewer
-            return ConsoleViewer(simulator)
-    else:
+    factory = _VIEWERS.get(viz_type)
+    if factory is None:
         print(f"[WARNING] Unknown viz type '{viz_type}', using console.", file=sys.stderr)
-        from aim.visualization.console_viewer import ConsoleViewer
-        return ConsoleViewer(simulator)
+        factory = _console_viewer
+    return factory(simulator, render_every)
 
-NAME = 1
 class Box(BaseAgent):
     def __init__(self):
-        global NAME
         super().__init__()
         self.length = 0.0  # 2m long
-        self.name = NAME
-        NAME += 1
+        # BaseAgent ids are already a dense counter — no module-level one needed
+        self.name = self.id
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Run conveyor simulation with optional visualization.')
     parser.add_argument('--viz', type=str, default='console',
                         choices=['console', 'matplotlib'],
                         help='Visualization backend: "console" or "matplotlib" (default: console)')
+    parser.add_argument('--render-every', type=int, default=1,
+                        help='Render only every N-th tick (default: 1)')
 
     args = parser.parse_args()
 
@@ -52,7 +68,7 @@ if __name__ == '__main__':
     sim = Simulator(max_ticks=30, spaces={"main_line": space})
 
     # Create viewer based on argument
-    viewer = create_viewer(args.viz, sim)
+    viewer = create_viewer(args.viz, sim, render_every=args.render_every)
     sim.viewer = viewer
 
     # Build simulation
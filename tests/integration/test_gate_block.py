@@ -24,7 +24,7 @@ from aim.blocks.sink import SinkBlock
 class ItemAgent(BaseAgent):
     def __init__(self):
         super().__init__()
-        self.agent_id = id(self)
+        self.agent_id = self.id
 
     def on_enter_block(self, block):
         pass
@@ -2,7 +2,11 @@
 Integration test for Resource Pool functionality
 """
 
-from aim import Simulator, BaseAgent, ResourcePool, ResourceAgent, SeizeBlock, ReleaseBlock, QueueBlock, SinkBlock
+import pytest
+
+from aim import (
+    Simulator, BaseAgent, ResourcePool, ResourceAgent, SeizeBlock, ReleaseBlock, ResourceUseBlock, QueueBlock, SinkBlock
+)
 from aim.blocks.source import SourceBlock
 from aim.blocks.delay import DelayBlock
 
@@ -99,7 +103,108 @@ def test_resource_pool_contention():
     assert sink.count >= 2, f"Expected at least 2 completed tasks with 1 resource, got {sink.count}"
     assert resource_pool.get_available_count() == 1, f"Expected 1 available resource, got {resource_pool.get_available_count()}"
 
+def test_resource_pool_bulk_set_positions():
+    sim = Simulator(max_ticks=1)
+    resource_pool = ResourcePool(
+        name="workers",
+        simulator=sim,
+        resource_type="worker",
+        initial_resources=[ResourceAgent(resource_id=f"worker_{i}", resource_type="worker") for i in range(2)]
+    )
+
+    resource_pool.bulk_set_positions([[1, 2, 3], [4, 5, 6]], keys=("position", "start_position"))
+
+    first, second = resource_pool.available_resources
+    assert first.space_state == {"position": (1.0, 2.0, 3.0), "start_position": (1.0, 2.0, 3.0)}
+    assert second.space_state["position"] == (4.0, 5.0, 6.0)
+
+    with pytest.raises(ValueError):
+        resource_pool.bulk_set_positions([[0, 0, 0]])
+
+def test_saturated_pool_stalls_queue_until_release():
+    sim = Simulator(max_ticks=40)
+    resource_pool = ResourcePool(
+        name="single_worker",
+        simulator=sim,
+        resource_type="worker",
+        initial_resources=[ResourceAgent(resource_id="worker_1", resource_type="worker")]
+    )
+
+    source = SourceBlock(simulator=sim, spawn_schedule=lambda tick: 3 if tick == 0 else 0)
+    queue = QueueBlock(simulator=sim)
+    seize = SeizeBlock(simulator=sim, resource_pool=resource_pool, resource_count=1)
+    work_delay = DelayBlock(simulator=sim, delay_ticks=10)
+    release = ReleaseBlock(simulator=sim, resource_pool=resource_pool)
+    sink = SinkBlock(simulator=sim)
+    source.connect(queue)
+    queue.connect(seize)
+    seize.connect(work_delay)
+    work_delay.connect(release)
+    release.connect(sink)
+
+    # (tick, succeeded) for every acquire attempt, and the ticks resources come back
+    attempts = []
+    releases = []
+    seize_resources = resource_pool.seize_resources
+    release_resources = resource_pool.release_resources
+
+    def record_seize(count=1):
+        seized = seize_resources(count)
+        attempts.append((sim.current_tick, bool(seized)))
+        return seized
+
+    def record_release(resources):
+        releases.append(sim.current_tick)
+        return release_resources(resources)
+
+    resource_pool.seize_resources = record_seize
+    resource_pool.release_resources = record_release
+
+    sim.run()
+
+    assert sink.count == 3
+    assert resource_pool.get_available_count() == 1 and resource_pool.get_occupied_count() == 0
+    assert releases == [10, 20, 30]
+    # While the worker is busy the queue stays quiet — failed attempts only on the ticks work arrives or frees up
+    failed_ticks = [tick for tick, seized in attempts if not seized]
+    assert set(failed_ticks) <= {0, *releases}, f"Queue kept retrying a saturated pool: {attempts}"
+    # Each release wakes the queue, which seizes the freed worker on the same tick
+    assert [tick for tick, seized in attempts if seized] == [0, 10, 20]
+
+def test_resource_use_block_matches_seize_delay_release():
+    def finish_ticks(fused):
+        sim = Simulator(max_ticks=30)
+        resource_pool = ResourcePool(
+            name="workers",
+            simulator=sim,
+            resource_type="worker",
+            initial_resources=[ResourceAgent(resource_id=f"worker_{i}", resource_type="worker") for i in range(2)]
+        )
+        source = SourceBlock(simulator=sim, spawn_array=[3, 0, 1, 2])
+        queue = QueueBlock(simulator=sim)
+        sink = SinkBlock(simulator=sim)
+        source.connect(queue)
+        if fused:
+            use = ResourceUseBlock(simulator=sim, resource_pool=resource_pool, delay_ticks=4)
+            queue.connect(use)
+            use.connect(sink)
+        else:
+            seize = SeizeBlock(simulator=sim, resource_pool=resource_pool)
+            work_delay = DelayBlock(simulator=sim, delay_ticks=4)
+            release = ReleaseBlock(simulator=sim, resource_pool=resource_pool)
+            queue.connect(seize)
+            seize.connect(work_delay)
+            work_delay.connect(release)
+            release.connect(sink)
+        ticks = []
+        sink.on_enter = lambda agent: ticks.append(sim.current_tick)
+        sim.run()
+        assert resource_pool.get_available_count() == 2
+        return ticks
+
+    assert finish_ticks(fused=True) == finish_ticks(fused=False) == [4, 4, 8, 8, 12, 12]
+
 if __name__ == "__main__":
     test_resource_pool()
     test_resource_pool_contention()
-    print("All tests passed!")
\ No newline at end of file
+    print("All tests passed!")
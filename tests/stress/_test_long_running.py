@@ -21,5 +21,31 @@ def test_long_running():
     assert end_mem - start_mem < 10 * 1024 * 1024  # < 10MB growth
     assert sink.count == 1000
 
+def test_long_running_periodic_schedule():
+    # Same workload as a SpawnSchedule — the simulator skips the ticks between spawns
+    sim = Simulator(max_ticks=1_000_000)
+    source = SourceBlock(sim, spawn_schedule=SourceBlock.every_n_ticks(1000))
+    sink = SinkBlock(sim)
+    source.connect(sink)
+    start_mem = get_memory_usage()
+    sim.run()
+    end_mem = get_memory_usage()
+    assert end_mem - start_mem < 10 * 1024 * 1024  # < 10MB growth
+    assert sink.count == 1000
+    assert sim.current_tick == 999_999
+
+def test_long_running_run_fast():
+    sim = Simulator(max_ticks=1_000_000)
+    source = SourceBlock(sim, spawn_schedule=lambda t: 1 if t % 1000 == 0 else 0)
+    sink = SinkBlock(sim, keep_agents=False)
+    source.connect(sink)
+    start_mem = get_memory_usage()
+    sim.run_fast()
+    end_mem = get_memory_usage()
+    assert end_mem - start_mem < 10 * 1024 * 1024  # < 10MB growth
+    assert sink.count == 1000
+
 if __name__ == '__main__':
     test_long_running()
+    test_long_running_periodic_schedule()
+    test_long_running_run_fast()
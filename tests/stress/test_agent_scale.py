@@ -8,3 +8,11 @@ def test_agent_scale():
     source.connect(sink)
     sim.run()
     assert sink.count == 10000
+
+def test_agent_scale_run_fast():
+    sim = Simulator(max_ticks=100)
+    source = SourceBlock(sim, agent_class=BaseAgent, spawn_schedule=lambda t: 10000 if t == 1 else 0)
+    sink = SinkBlock(sim, keep_agents=False)
+    source.connect(sink)
+    sim.run_fast()
+    assert sink.count == 10000
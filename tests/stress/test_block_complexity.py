@@ -12,3 +12,15 @@ def test_block_complexity():
     prev.connect(sink)
     sim.run()
     assert sink.count == 1
+
+def test_block_complexity_run_fast():
+    sim = Simulator(max_ticks=1000)
+    prev = SourceBlock(sim, spawn_schedule=lambda t: 1 if t == 1 else 0)
+    for _ in range(1000):
+        block = QueueBlock(sim)
+        prev.connect(block)
+        prev = block
+    sink = SinkBlock(sim)
+    prev.connect(sink)
+    sim.run_fast()
+    assert sink.count == 1
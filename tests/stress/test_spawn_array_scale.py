@@ -0,0 +1,32 @@
+import time
+
+from aim.core import Simulator
+from aim.blocks import SourceBlock, SinkBlock
+
+
+def _run_time(max_ticks, **source_kwargs):
+    sim = Simulator(max_ticks=max_ticks)
+    source = SourceBlock(sim, **source_kwargs)
+    sink = SinkBlock(sim, keep_agents=False)
+    source.connect(sink)
+    start = time.perf_counter()
+    sim.run()
+    elapsed = time.perf_counter() - start
+    return elapsed, sink.count
+
+
+def test_spawn_array_run_time_grows_linearly():
+    # One spawn every 50 ticks — finding the next spawn must not rescan the rest of the array
+    short, short_count = _run_time(20_000, spawn_array=[1 if t % 50 == 0 else 0 for t in range(20_000)])
+    long, long_count = _run_time(80_000, spawn_array=[1 if t % 50 == 0 else 0 for t in range(80_000)])
+
+    assert (short_count, long_count) == (400, 1600)
+    assert long < 8 * short + 0.05, f"4x the ticks took {long / short:.1f}x as long"
+
+
+def test_precomputed_schedule_run_time_grows_linearly():
+    short, _ = _run_time(20_000, spawn_schedule=lambda t: 1, precompute=True)
+    long, count = _run_time(80_000, spawn_schedule=lambda t: 1, precompute=True)
+
+    assert count == 80_000
+    assert long < 8 * short + 0.05, f"4x the ticks took {long / short:.1f}x as long"
@@ -0,0 +1,35 @@
+from aim import BaseAgent, ResourceAgent
+
+
+def test_agent_ids_are_unique_and_increasing():
+    first = BaseAgent()
+    second = ResourceAgent(resource_id="worker")
+    third = BaseAgent()
+
+    assert first.id < second.id < third.id
+
+
+def test_base_agent_slots_core_state_and_keeps_block_state_in_dict():
+    agent = BaseAgent()
+    # Everything __init__ sets lives in slots — nothing reaches the instance dict
+    assert vars(agent) == {}
+    # Attributes that blocks attach in flight go to __dict__, not to core slots
+    agent.children_agents = []
+    agent._restricted_area_start = None
+    del agent._restricted_area_start
+    assert not hasattr(agent, "_restricted_area_start")
+    assert vars(agent) == {"children_agents": []}
+    assert "children_agents" not in BaseAgent.__slots__
+
+    class Box(BaseAgent):
+        pass
+
+    box = Box()
+    box.destination = "dock"
+    assert box.destination == "dock"
+
+
+def test_resource_agent_is_slotted():
+    resource = ResourceAgent(resource_id="worker_1", resource_type="worker")
+    assert vars(resource) == {}, "ResourceAgent fields should all live in slots"
+    assert resource.is_available and resource.occupied_by is None
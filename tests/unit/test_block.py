@@ -0,0 +1,37 @@
+from aim import Simulator, BaseAgent
+from aim.blocks import SourceBlock, SinkBlock
+
+
+class Courier(BaseAgent):
+    pass
+
+
+def test_on_enter_for_dispatches_on_exact_class():
+    sim = Simulator(max_ticks=5)
+
+    couriers = SourceBlock(simulator=sim, agent_class=Courier, spawn_schedule=lambda tick: 1 if tick == 1 else 0)
+    plain = SourceBlock(simulator=sim, spawn_schedule=lambda tick: 1 if tick == 1 else 0)
+    sink = SinkBlock(simulator=sim)
+    couriers.connect(sink)
+    plain.connect(sink)
+
+    seen = []
+    sink.on_enter_for(Courier, lambda agent: seen.append(type(agent)))
+
+    sim.run()
+
+    assert sink.count == 2
+    assert seen == [Courier], "Only the registered agent class should trigger the callback"
+
+
+def test_connect_caches_first_output_take():
+    sim = Simulator(max_ticks=1)
+    source = SourceBlock(simulator=sim)
+    first = SinkBlock(simulator=sim)
+    second = SinkBlock(simulator=sim)
+
+    assert source._forward is None
+    source.connect(first)
+    source.connect(second)
+
+    assert source._forward == first.take, "Ejections go to the first connected output"
@@ -0,0 +1,114 @@
+import random
+
+import pytest
+
+from aim import BaseAgent
+from aim.spaces.collision_space import CollisionSpace
+
+
+def test_contains_point_batch_matches_scalar_check():
+    rng = random.Random(7)
+    space = CollisionSpace(obstacles=[
+        ([(0, -3, 0), (1, -3, 0), (1, 1, 0), (0, 1, 0)], 2.0),
+        ([(2, 2, 1), (5, 2, 1), (3.5, 4, 1)], 1.0),
+    ])
+    points = [(rng.uniform(-1, 6), rng.uniform(-4, 5), rng.uniform(-0.5, 2.5)) for _ in range(500)]
+    # Vertices and edges hit the boundary rules of the ray cast
+    points += [(0, -3, 0), (1, 1, 2), (0.5, 1, 1), (5, 2, 1), (3.5, 2, 2)]
+
+    inside = space.contains_point_batch(points)
+
+    assert inside.tolist() == [space._is_inside_obstacle(p) for p in points]
+    assert inside.any() and not inside.all()
+
+
+def test_contains_point_batch_tracks_obstacle_changes():
+    space = CollisionSpace()
+    assert space.contains_point_batch([(0.5, 0.5, 0.5)]).tolist() == [False]
+
+    space.add_obstacle(([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], 1.0))
+
+    assert space.contains_point_batch([(0.5, 0.5, 0.5)]).tolist() == [True]
+
+
+def test_detour_candidates_match_scalar_checks():
+    rng = random.Random(3)
+    space = CollisionSpace(obstacles=[
+        ([(0, -3, 0), (1, -3, 0), (1, 1, 0), (0, 1, 0)], 2.0),
+        ([(2, 2, 1), (5, 2, 1), (3.5, 4, 1)], 1.0),
+    ])
+    directions = [(0.1, 0, 0), (0.1, 0.1, 0), (0, 0.1, 0), (-0.1, 0.1, 0),
+                  (-0.1, 0, 0), (-0.1, -0.1, 0), (0, -0.1, 0), (0.1, -0.1, 0)]
+
+    def scalar_choice(start, target):
+        best, best_distance = None, float('inf')
+        for dx, dy, dz in directions:
+            candidate = (start[0] + dx, start[1] + dy, start[2] + dz)
+            if space._is_inside_obstacle(candidate) or space._line_intersects_obstacle(start, candidate):
+                continue
+            distance = sum((c - t) ** 2 for c, t in zip(candidate, target)) ** 0.5
+            if distance < best_distance:
+                best, best_distance = candidate, distance
+        return best
+
+    # Starts hugging the obstacle boundaries, where some candidates are blocked
+    starts = [(rng.choice([-0.05, 0.05, 0.95, 1.05]), rng.uniform(-3.5, 1.5), 1.0) for _ in range(200)]
+    starts += [(rng.uniform(1.9, 5.1), rng.uniform(1.9, 2.1), 1.5) for _ in range(200)]
+    for start in starts:
+        target = (rng.uniform(-2, 7), rng.uniform(-5, 6), start[2])
+        assert space._closest_clear_candidate(start, directions, target) == scalar_choice(start, target)
+
+
+def test_segments_intersect_batch_matches_scalar_check():
+    rng = random.Random(11)
+    space = CollisionSpace(obstacles=[
+        ([(0, -3, 0), (1, -3, 0), (1, 1, 0), (0, 1, 0)], 2.0),
+        ([(2, 2, 1), (5, 2, 1), (3.5, 4, 1)], 1.0),
+    ])
+
+    def point():
+        return (rng.uniform(-2, 7), rng.uniform(-5, 6), rng.choice([0.5, 1.0, 1.5, 3.0]))
+
+    starts = [point() for _ in range(500)]
+    ends = [point() for _ in range(500)]
+    # Segments along an obstacle edge are parallel to it
+    starts.append((0, -4, 1))
+    ends.append((0, 2, 1))
+
+    hits = space.segments_intersect_batch(starts, ends)
+
+    assert hits.tolist() == [space._line_intersects_obstacle(p1, p2) for p1, p2 in zip(starts, ends)]
+    assert hits.any() and not hits.all()
+
+
+def test_strict_update_rejects_paths_through_obstacles():
+    space = CollisionSpace(obstacles=[([(-1, -1, 0), (1, -1, 0), (1, 1, 0), (-1, 1, 0)], 2.0)],
+                           strict_collision_checking=True)
+    clear = BaseAgent()
+    blocked = BaseAgent()
+    assert space.register(clear, {"start_position": (-3, 3, 1), "target_position": (3, 3, 1)})
+    assert space.register(blocked, {"start_position": (-3, 0, 1), "target_position": (3, 0, 1),
+                                     "path": [(3, 0, 1)]})
+
+    with pytest.raises(RuntimeError):
+        space.update(1.0)
+    # Agents ahead of the offending one still moved this tick
+    assert clear.space_state["position"] == pytest.approx((-2, 3, 1))
+
+
+def test_broadphase_keeps_segment_query_results():
+    rng = random.Random(5)
+    obstacles = []
+    for _ in range(20):
+        cx, cy = rng.uniform(-20, 20), rng.uniform(-20, 20)
+        obstacles.append(([(cx + rng.uniform(-2, 2), cy + rng.uniform(-2, 2), 0) for _ in range(4)], 2.0))
+    culled = CollisionSpace(obstacles=list(obstacles))
+    plain = CollisionSpace(obstacles=list(obstacles))
+    plain._BROADPHASE_MIN_OBSTACLES = len(obstacles) + 1
+
+    def point():
+        return (rng.uniform(-25, 25), rng.uniform(-25, 25), 1.0)
+
+    for start, end in [(point(), point()) for _ in range(300)]:
+        assert culled._line_intersects_obstacle(start, end) == plain._line_intersects_obstacle(start, end)
+        assert culled._get_intersecting_obstacle(start, end) is plain._get_intersecting_obstacle(start, end)
@@ -0,0 +1,62 @@
+import pytest
+
+from aim import Simulator, BaseAgent
+from aim.blocks import DelayBlock, MoveBlock, MoveDelaySeq
+from aim.blocks.source import SourceBlock
+from aim.blocks.sink import SinkBlock
+from aim.spaces.no_collision_space import NoCollisionSpace
+
+STAGES = [((4.0, 0.0, 0.0), 3), ((4.0, 2.0, 0.0), 2)]
+
+
+class Walker(BaseAgent):
+    def __init__(self):
+        super().__init__()
+        self.start_position = (0.0, 0.0, 0.0)
+        self.target_position = STAGES[0][0]
+
+
+def _exit_ticks(build):
+    sim = Simulator(max_ticks=30)
+    sim.add_space("floor", NoCollisionSpace())
+    source = SourceBlock(sim, agent_class=Walker, spawn_array=[1, 0, 1])
+    sink = SinkBlock(sim)
+    ticks = []
+    sink.on_enter = lambda agent: ticks.append(sim.current_tick)
+    build(sim, source).connect(sink)
+    sim.run()
+    return ticks
+
+
+def test_move_delay_seq_matches_block_chain():
+    def chain(sim, source):
+        first_move = MoveBlock(sim, "floor")
+        first_delay = DelayBlock(sim, delay_ticks=STAGES[0][1])
+        second_move = MoveBlock(sim, "floor")
+        second_delay = DelayBlock(sim, delay_ticks=STAGES[1][1])
+
+        def next_leg(agent):
+            agent.start_position, agent.target_position = STAGES[0][0], STAGES[1][0]
+
+        second_move.on_enter = next_leg
+        source.connect(first_move)
+        first_move.connect(first_delay)
+        first_delay.connect(second_move)
+        second_move.connect(second_delay)
+        return second_delay
+
+    def fused(sim, source):
+        seq = MoveDelaySeq(sim, "floor", stages=STAGES)
+        source.connect(seq)
+        return seq
+
+    chain_ticks = _exit_ticks(chain)
+    assert len(chain_ticks) == 2
+    assert _exit_ticks(fused) == chain_ticks
+
+
+def test_move_delay_seq_requires_stages():
+    sim = Simulator()
+    sim.add_space("floor", NoCollisionSpace())
+    with pytest.raises(ValueError):
+        MoveDelaySeq(sim, "floor", stages=[])
@@ -0,0 +1,30 @@
+import numpy as np
+from aim.entities.manufacturing.conveyor import Conveyor
+
+def test_conveyor_batched_positions_match_scalar():
+    conveyor = Conveyor(points=[(0.0, 0.0, 0.0), (3.0, 4.0, 0.0), (3.0, 10.0, 2.0)], speed=1.0)
+
+    progress = np.linspace(-0.1, 1.1, 25)
+    positions = conveyor.get_positions_at_progress(progress)
+
+    assert positions.shape == (25, 3)
+    for p, pos in zip(progress, positions):
+        assert np.allclose(pos, conveyor.get_position_at_progress(p)), "Batched position should match scalar"
+
+
+def test_conveyor_scalar_position_lookup_skips_zero_length_segments():
+    conveyor = Conveyor(points=[(0.0, 0.0, 0.0), (0.0, 0.0, 0.0), (4.0, 0.0, 0.0), (4.0, 4.0, 0.0)])
+
+    assert conveyor.get_total_length() == 8.0
+    assert conveyor.get_position_at_progress(0.25) == (2.0, 0.0, 0.0)
+    assert conveyor.get_position_at_progress(0.5) == (4.0, 0.0, 0.0)
+    assert conveyor.get_position_at_progress(0.75) == (4.0, 2.0, 0.0)
+
+
+def test_conveyor_stores_waypoints_as_tuples():
+    waypoint = [5.0, 0.0, 0.0]
+    conveyor = Conveyor(points=[(0, 0, 0), waypoint])
+    waypoint[0] = 9.0
+
+    assert conveyor.points == [(0, 0, 0), (5.0, 0.0, 0.0)]
+    assert conveyor.get_position_at_progress(1.0) == (5.0, 0.0, 0.0)
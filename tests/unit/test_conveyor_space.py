@@ -0,0 +1,97 @@
+import pytest
+
+from aim import BaseAgent
+from aim.entities.manufacturing.conveyor import Conveyor
+from aim.spaces.manufacturing.conveyor_space import ConveyorSpace
+
+
+def test_conveyor_space_hands_agents_over_between_entities():
+    first = Conveyor([(0.0, 0.0, 0.0), (2.0, 0.0, 0.0)], speed=1.0, name="first")
+    second = Conveyor([(2.0, 0.0, 0.0), (2.0, 4.0, 0.0)], speed=2.0, name="second")
+    first.connections.append(second)
+    space = ConveyorSpace()
+    space.register_entity(first)
+    space.register_entity(second)
+
+    agent = BaseAgent()
+    assert space.register(agent, {"start_entity": first, "end_entity": second})
+
+    space.update(delta_time=1.0)
+    assert agent.space_state["progress_on_entity"] == pytest.approx(0.5)
+    assert agent.space_state["progress_on_path"] == pytest.approx(0.25)
+
+    space.update(delta_time=1.0)
+    # Finished the first conveyor — now at the start of the second
+    assert agent.space_state["entity"] is second
+    assert agent.space_state["progress_on_entity"] == 0.0
+    assert agent in space._entity_agents[second] and agent not in space._entity_agents[first]
+
+    space.update(delta_time=1.0)
+    space.update(delta_time=1.0)
+    assert space.is_movement_complete(agent)
+
+    assert space.unregister(agent)
+    assert agent.space_state == {}
+    other = BaseAgent()
+    assert space.register(other, {"start_entity": first, "end_entity": first})
+    assert space._agent_slot[other] == 0, "Freed rows are reused"
+
+
+def test_conveyor_space_caches_paths_until_topology_changes():
+    first = Conveyor([(0.0, 0.0, 0.0), (2.0, 0.0, 0.0)], name="first")
+    second = Conveyor([(2.0, 0.0, 0.0), (4.0, 0.0, 0.0)], name="second")
+    first.connections.append(second)
+    space = ConveyorSpace()
+    space.register_entity(first)
+    space.register_entity(second)
+
+    searches = []
+    find = space._find_shortest_path
+    space._find_shortest_path = lambda start, end: searches.append((start, end)) or find(start, end)
+
+    agents = [BaseAgent() for _ in range(3)]
+    for agent in agents:
+        assert space.register(agent, {"start_entity": first, "end_entity": second})
+
+    assert searches == [(first, second)]
+    # Each agent walks its own copy of the path
+    assert agents[0].space_state["path"] == [first, second]
+    assert agents[0].space_state["path"] is not agents[1].space_state["path"]
+
+    space.invalidate_path_cache()
+    assert space.register(BaseAgent(), {"start_entity": first, "end_entity": second})
+    assert len(searches) == 2
+
+
+def test_conveyor_space_reports_arrivals_from_update():
+    conveyor = Conveyor([(0.0, 0.0, 0.0), (2.0, 0.0, 0.0)], speed=1.0, name="line")
+    space = ConveyorSpace()
+    space.register_entity(conveyor)
+
+    agent = BaseAgent()
+    assert space.register(agent, {"start_entity": conveyor, "end_entity": conveyor})
+
+    space.update(delta_time=1.0)
+    assert agent not in space.arrived_agents()
+    space.update(delta_time=1.0)
+    assert space.arrived_agents() == {agent}
+
+    # Starting a new path clears the arrival until the next update
+    assert space.register(agent, {"start_entity": conveyor, "end_entity": conveyor})
+    assert agent not in space.arrived_agents()
+
+
+def test_conveyor_space_prefers_the_faster_branch():
+    start = Conveyor([(0.0, 0.0, 0.0), (1.0, 0.0, 0.0)], speed=1.0, name="start")
+    slow = Conveyor([(1.0, 0.0, 0.0), (9.0, 0.0, 0.0)], speed=1.0, name="slow")
+    fast_a = Conveyor([(1.0, 0.0, 0.0), (2.0, 0.0, 0.0)], speed=1.0, name="fast_a")
+    fast_b = Conveyor([(2.0, 0.0, 0.0), (3.0, 0.0, 0.0)], speed=1.0, name="fast_b")
+    end = Conveyor([(3.0, 0.0, 0.0), (4.0, 0.0, 0.0)], speed=1.0, name="end")
+    start.connections.extend([slow, fast_a])
+    slow.connections.append(end)
+    fast_a.connections.append(fast_b)
+    fast_b.connections.append(end)
+
+    space = ConveyorSpace()
+    assert space._find_shortest_path(start, end) == [start, fast_a, fast_b, end]
+    assert space._find_shortest_path(end, start) is None
@@ -1,5 +1,5 @@
 from aim import Simulator
-from aim.blocks import SourceBlock, SinkBlock, GateBlock, QueueBlock, queue
+from aim.blocks import SourceBlock, SinkBlock, GateBlock, GateState, QueueBlock, queue
 
 def test_delay_block_smoke():
     sim = Simulator(max_ticks=10)
@@ -24,3 +24,80 @@ def test_delay_block_smoke():
 
     assert sink.count == 1, "Gate should release agents when open"
 
+
+
+def test_gate_releases_one_agent_per_tick_in_arrival_order():
+    sim = Simulator(max_ticks=10)
+
+    source = SourceBlock(
+        simulator=sim,
+        spawn_schedule=lambda tick: 3 if tick == 1 else 0
+    )
+    queue = QueueBlock(sim)
+    gate = GateBlock(sim, release_mode="one")
+    sink = SinkBlock(simulator=sim)
+
+    source.connect(queue)
+    queue.connect(gate)
+    gate.connect(sink)
+
+    released = []
+    sink.on_enter = released.append
+    arrived = []
+    gate.on_enter = arrived.append
+
+    for sim.current_tick in range(3):
+        sim.tick()
+    assert gate.size == 3 and sink.count == 0
+
+    gate.open()
+    sim.current_tick = 3
+    sim.tick()
+    assert gate.size == 2 and sink.count == 1
+
+    for sim.current_tick in range(4, 10):
+        sim.tick()
+    assert sink.count == 3
+    assert released == arrived
+
+
+def test_gate_state_round_trips_and_all_mode_releases_whole_line():
+    sim = Simulator(max_ticks=10)
+
+    source = SourceBlock(
+        simulator=sim,
+        spawn_schedule=lambda tick: 4 if tick == 1 else 0
+    )
+    queue = QueueBlock(sim)
+    gate = GateBlock(sim, initial_state="open", release_mode="all")
+    sink = SinkBlock(simulator=sim)
+
+    source.connect(queue)
+    queue.connect(gate)
+    gate.connect(sink)
+
+    assert gate.state() == "open"
+    gate.toggle()
+    assert gate.state() == "closed"
+
+    for sim.current_tick in range(3):
+        sim.tick()
+    assert gate.size == 4 and sink.count == 0
+
+    gate.toggle()
+    sim.current_tick = 3
+    sim.tick()
+    assert gate.state() == "open"
+    assert gate.size == 0 and sink.count == 4
+
+
+def test_gate_accepts_gate_state_enum():
+    sim = Simulator(max_ticks=1)
+
+    gate = GateBlock(sim, initial_state=GateState.OPEN)
+    assert gate.state() == "open"
+    assert gate.gate_state is GateState.OPEN
+
+    gate.toggle()
+    assert gate.gate_state is GateState.CLOSED
+    assert GateBlock(sim, initial_state="closed").gate_state is GateState.CLOSED
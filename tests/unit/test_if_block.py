@@ -1,4 +1,7 @@
-from aim import Simulator
+import numpy as np
+import pytest
+
+from aim import Simulator, BaseAgent
 from aim.blocks import SourceBlock, SinkBlock, IfBlock
 
 def _check_branch(branch: bool) -> int:
@@ -32,3 +35,68 @@ def test_if_block_smoke():
 
     assert true_branch == 1 and false_branch == 1, "Both If branches should release an agent"
 
+
+
+def _route_by_prob(prob: float, count: int) -> tuple:
+    sim = Simulator(max_ticks=3)
+
+    source = SourceBlock(
+        simulator=sim,
+        spawn_schedule=lambda tick: count if tick == 1 else 0
+    )
+
+    ifblock = IfBlock(sim, prob=prob)
+
+    sink_first = SinkBlock(simulator=sim)
+    sink_second = SinkBlock(simulator=sim)
+
+    source.connect(ifblock)
+    ifblock.connect_first(sink_first)
+    ifblock.connect_second(sink_second)
+
+    sim.run()
+
+    return sink_first.count, sink_second.count
+
+
+def test_if_block_prob():
+    assert _route_by_prob(1.0, 10) == (10, 0), "prob=1 should always take the first branch"
+    assert _route_by_prob(0.0, 10) == (0, 10), "prob=0 should always take the second branch"
+
+    first, second = _route_by_prob(0.5, 1000)
+    assert first + second == 1000
+    assert 400 < first < 600, "prob=0.5 should split roughly evenly"
+    assert _route_by_prob(0.5, 1000) == (first, second), "Routing should be reproducible for a fixed seed"
+
+
+def test_if_block_requires_condition_or_prob():
+    sim = Simulator(max_ticks=1)
+    with pytest.raises(ValueError):
+        IfBlock(sim)
+    with pytest.raises(ValueError):
+        IfBlock(sim, condition=lambda _: True, prob=0.5)
+    with pytest.raises(ValueError):
+        IfBlock(sim, prob=0.5, decisions=[True])
+
+
+def test_if_block_decisions():
+    sim = Simulator(max_ticks=3)
+    source = SourceBlock(simulator=sim, spawn_schedule=lambda tick: 4 if tick == 1 else 0)
+    ifblock = IfBlock(sim, decisions=np.array([True, False, False, True]))
+    sink_first = SinkBlock(simulator=sim)
+    sink_second = SinkBlock(simulator=sim)
+    source.connect(ifblock)
+    ifblock.connect_first(sink_first)
+    ifblock.connect_second(sink_second)
+
+    seen = []
+    sink_first.on_enter = lambda agent: seen.append((agent.id, True))
+    sink_second.on_enter = lambda agent: seen.append((agent.id, False))
+
+    sim.run()
+
+    assert [decision for _, decision in sorted(seen)] == [True, False, False, True]
+
+    ifblock.take(BaseAgent())
+    with pytest.raises(RuntimeError):
+        ifblock._tick()
@@ -0,0 +1,45 @@
+import pytest
+
+from aim import BaseAgent
+from aim.spaces.no_collision_space import NoCollisionSpace
+
+
+def _register(space, start, target, speed=1.0):
+    agent = BaseAgent()
+    assert space.register(agent, {"start_position": start, "target_position": target, "speed": speed})
+    return agent
+
+
+def test_no_collision_space_moves_agents_independently():
+    space = NoCollisionSpace()
+    slow = _register(space, (0.0, 0.0, 0.0), (10.0, 0.0, 0.0), speed=1.0)
+    fast = _register(space, (0, 0, 0), (0, 3, 4), speed=2.0)
+    parked = _register(space, (1.0, 1.0, 1.0), (1.0, 1.0, 1.0))
+
+    space.update(delta_time=1.0)
+
+    assert slow.space_state["position"] == pytest.approx((1.0, 0.0, 0.0))
+    assert fast.space_state["position"] == pytest.approx((0.0, 1.2, 1.6))
+    assert space.is_movement_complete(parked)
+
+    for _ in range(3):
+        space.update(delta_time=1.0)
+
+    # Arrival snaps to the registered target tuple
+    assert fast.space_state["position"] == (0, 3, 4)
+    assert space.is_movement_complete(fast)
+    assert slow.space_state["position"] == pytest.approx((4.0, 0.0, 0.0))
+
+
+def test_no_collision_space_reuses_slots():
+    space = NoCollisionSpace()
+    first = _register(space, (0.0, 0.0, 0.0), (5.0, 0.0, 0.0))
+    assert space.unregister(first)
+    assert first.space_state == {}
+    assert not space.unregister(first)
+
+    second = _register(space, (0.0, 0.0, 0.0), (0.0, 5.0, 0.0))
+    space.update(delta_time=1.0)
+
+    assert second.space_state["position"] == pytest.approx((0.0, 1.0, 0.0))
+    assert space.get_state(first) == {}
@@ -0,0 +1,84 @@
+import pytest
+
+from aim import Simulator, BaseAgent, AgentPool
+from aim.blocks.source import SourceBlock
+from aim.blocks.sink import SinkBlock
+
+
+class TaggedAgent(BaseAgent):
+    def __init__(self):
+        super().__init__()
+        self.color = "red"
+
+
+def test_pool_recycles_released_agents():
+    pool = AgentPool(TaggedAgent)
+    agent = pool.acquire()
+    old_id = agent.id
+    agent.color = "blue"
+    agent.space_state["position"] = (1.0, 2.0)
+    agent.children_agents = [BaseAgent()]
+
+    pool.release(agent)
+    assert pool.size == 1
+
+    reused = pool.acquire()
+    assert reused is agent
+    assert reused.id != old_id
+    assert reused.color == "red"
+    assert reused.space_state == {}
+    assert not hasattr(reused, "children_agents")
+    assert pool.size == 0
+
+
+def test_pool_clears_subclass_slots():
+    class Crate(BaseAgent):
+        __slots__ = ('cargo', '__seal')
+
+    pool = AgentPool(Crate)
+    agent = pool.acquire()
+    agent.cargo = "bolts"
+    agent._Crate__seal = True
+    agent._acquired_resources = []
+
+    pool.release(agent)
+    reused = pool.acquire()
+    assert reused is agent
+    assert not hasattr(reused, "cargo")
+    assert not hasattr(reused, "_Crate__seal")
+    assert not hasattr(reused, "_acquired_resources")
+
+
+def test_pool_rejects_foreign_agent_class():
+    pool = AgentPool(TaggedAgent)
+    with pytest.raises(ValueError):
+        pool.release(BaseAgent())
+
+
+def test_source_sink_share_pool():
+    sim = Simulator(max_ticks=20)
+    pool = AgentPool(TaggedAgent)
+
+    source = SourceBlock(simulator=sim, pool=pool, spawn_schedule=lambda tick: 1)
+    sink = SinkBlock(simulator=sim, pool=pool)
+    source.connect(sink)
+
+    sim.run()
+
+    assert sink.count == 20
+    assert len(sink._agents) == 0
+    assert len(sim.agents) == 0
+    # Each agent is absorbed the tick it spawns, so one instance serves the whole run
+    assert pool.size == 1
+
+
+def test_pool_keeps_at_most_max_size_agents():
+    pool = AgentPool(TaggedAgent, max_size=2)
+    for agent in pool.acquire_many(5):
+        pool.release(agent)
+    assert pool.size == 2
+
+    unbounded = AgentPool(TaggedAgent, max_size=None)
+    for agent in unbounded.acquire_many(5):
+        unbounded.release(agent)
+    assert unbounded.size == 5
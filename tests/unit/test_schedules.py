@@ -0,0 +1,55 @@
+from aim.core import Simulator, OneShot, Periodic, Burst
+from aim.blocks import DelayBlock, SinkBlock, SourceBlock
+
+
+def test_schedules_count_and_find_next_event():
+    one_shot = OneShot(5, count=3)
+    assert [one_shot(t) for t in (4, 5, 6)] == [0, 3, 0]
+    assert one_shot.next_event_tick(0) == 5
+    assert one_shot.next_event_tick(6) is None
+
+    periodic = Periodic(4, count=2, offset=1)
+    assert [periodic(t) for t in range(7)] == [0, 2, 0, 0, 0, 2, 0]
+    assert periodic.next_event_tick(0) == 1
+    assert periodic.next_event_tick(2) == 5
+    assert periodic.next_event_tick(5) == 5
+
+    burst = Burst(2, 4)
+    assert [burst(t) for t in range(5)] == [0, 0, 1, 1, 0]
+    assert burst.next_event_tick(3) == 3
+    assert burst.next_event_tick(4) is None
+
+
+def test_simulator_skips_idle_ticks_between_scheduled_spawns():
+    sim = Simulator(max_ticks=1_000_000)
+    source = SourceBlock(sim, spawn_schedule=Periodic(1000))
+    delay = DelayBlock(sim, delay_ticks=7)
+    sink = SinkBlock(sim, keep_agents=False)
+    source.connect(delay)
+    delay.connect(sink)
+
+    ticks = []
+    tick = sim.tick
+    sim.tick = lambda: (ticks.append(sim.current_tick), tick())
+    arrivals = []
+    sink.on_enter = lambda agent: arrivals.append(sim.current_tick)
+    sim.run()
+
+    assert sink.count == 1000
+    assert arrivals[:2] == [7, 1007]
+    # Spawn ticks and delay releases only
+    assert len(ticks) == 2000
+    assert sim.current_tick == 999_999
+
+
+def test_simulator_polls_every_tick_for_plain_callables():
+    sim = Simulator(max_ticks=50)
+    source = SourceBlock(sim, spawn_schedule=lambda tick: 1 if tick % 10 == 0 else 0)
+    source.connect(SinkBlock(sim))
+
+    ticks = []
+    tick = sim.tick
+    sim.tick = lambda: (ticks.append(sim.current_tick), tick())
+    sim.run()
+
+    assert ticks == list(range(50))
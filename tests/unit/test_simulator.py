@@ -0,0 +1,153 @@
+import pytest
+
+from aim.core import Simulator, BaseAgent
+from aim.blocks import DelayBlock, SinkBlock, SourceBlock
+
+
+def test_schedule_event_calls_zero_arg_callbacks_without_tick():
+    sim = Simulator(max_ticks=4)
+    ticks = []
+    calls = []
+
+    sim.schedule_event(ticks.append, delay_ticks=1, recurring=True)
+    sim.schedule_event(lambda: calls.append(sim.current_tick), delay_ticks=2)
+
+    sim.run()
+
+    assert ticks == [1, 2, 3]
+    assert calls == [2]
+
+
+def test_cancel_event_stops_recurring_and_pending_events():
+    sim = Simulator(max_ticks=10)
+    ticks = []
+    calls = []
+
+    recurring = sim.schedule_event(ticks.append, delay_ticks=2, recurring=True)
+    once = sim.schedule_event(calls.append, delay_ticks=8)
+    sim.schedule_event(lambda tick: sim.cancel_event(recurring), delay_ticks=5)
+    assert sim.cancel_event(once)
+    assert not sim.cancel_event(once), "An event can only be cancelled once"
+
+    sim.run()
+
+    assert ticks == [2, 4]
+    assert calls == []
+    assert not sim._live_events and not sim._cancelled_events
+
+
+def test_run_fast_matches_run_without_tracing_hooks():
+    def exit_ticks(run_fast):
+        sim = Simulator(max_ticks=20)
+        source = SourceBlock(simulator=sim, spawn_array=[1, 0, 2, 1])
+        delay = DelayBlock(simulator=sim, delay_ticks=3)
+        sink = SinkBlock(simulator=sim)
+        source.connect(delay)
+        delay.connect(sink)
+        ticks = []
+        sink.on_enter = lambda agent: ticks.append(sim.current_tick)
+        sim.run_fast() if run_fast else sim.run()
+        assert sim.current_tick == 19
+        return ticks
+
+    assert exit_ticks(run_fast=True) == exit_ticks(run_fast=False) == [3, 5, 5, 6]
+
+    sim = Simulator(max_ticks=5)
+    sim.subscribe(BaseAgent(), "ping")
+    with pytest.raises(RuntimeError):
+        sim.run_fast()
+
+
+def test_event_driven_blocks_are_not_polled():
+    sim = Simulator(max_ticks=1)
+    source = SourceBlock(simulator=sim)
+    delay = DelayBlock(simulator=sim, delay_ticks=2)
+    sink = SinkBlock(simulator=sim)
+
+    assert sim.blocks == [source, delay, sink]
+    assert sim._ticking_blocks == [source]
+
+
+def test_parallel_spaces_update_every_space_each_tick():
+    class CountingSpace:
+        def __init__(self):
+            self.updates = 0
+
+        def update(self, delta_time):
+            self.updates += 1
+
+    spaces = {"a": CountingSpace(), "b": CountingSpace(), "c": CountingSpace()}
+    sim = Simulator(max_ticks=5, spaces=spaces, parallel=True)
+
+    sim.run()
+
+    assert [space.updates for space in spaces.values()] == [5, 5, 5]
+    assert sim._space_pool is None
+
+
+def test_blocks_tick_upstream_first_regardless_of_registration_order():
+    from aim.blocks import GateBlock, QueueBlock
+
+    sim = Simulator(max_ticks=3)
+    # Registered downstream-first — ticking in this order would cost one tick per hop
+    sink = SinkBlock(sim)
+    gate = GateBlock(sim, initial_state="open")
+    queue = QueueBlock(sim)
+    source = SourceBlock(sim, spawn_schedule=lambda tick: 1 if tick == 0 else 0)
+    source.connect(queue)
+    queue.connect(gate)
+    gate.connect(sink)
+
+    arrivals = []
+    sink.on_enter = lambda agent: arrivals.append(sim.current_tick)
+    sim.run()
+
+    assert arrivals == [0]
+    assert sim._ticking_blocks == [source, queue, gate]
+
+
+def test_idle_queues_sleep_until_they_receive_agents():
+    from aim.blocks import QueueBlock
+
+    class RejectFirst(SinkBlock):
+        rejected = False
+
+        def take(self, agent):
+            if not self.rejected:
+                self.rejected = True
+                raise RuntimeError("busy")
+            super().take(agent)
+
+    sim = Simulator(max_ticks=6)
+    source = SourceBlock(sim, spawn_schedule=lambda tick: 1 if tick == 3 else 0)
+    queue = QueueBlock(sim)
+    sink = RejectFirst(sim)
+    source.connect(queue)
+    queue.connect(sink)
+
+    ticks = []
+    queue_tick = queue._tick
+    queue._tick = lambda: (ticks.append(sim.current_tick), queue_tick())
+    sim.run()
+
+    # Woken when the rejected agent is held at tick 3, ticked in the same pass, asleep once empty
+    assert ticks == [3]
+    assert sink.count == 1
+    assert not sim._awake
+
+
+def test_empty_queues_pass_agents_straight_through():
+    from aim.blocks import QueueBlock
+
+    sim = Simulator(max_ticks=1)
+    queues = [QueueBlock(sim) for _ in range(3000)]
+    sink = SinkBlock(sim)
+    for upstream, downstream in zip(queues, queues[1:] + [sink]):
+        upstream.connect(downstream)
+
+    agent = BaseAgent()
+    queues[0].take(agent)
+
+    # Far deeper than the recursion limit — the chain is walked in a loop
+    assert sink.count == 1
+    assert all(queue.size == 0 for queue in queues)
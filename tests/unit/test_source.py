@@ -1,4 +1,6 @@
-from aim import Simulator
+import pytest
+
+from aim import Simulator, BaseAgent
 from aim.blocks.source import SourceBlock
 from aim.blocks.sink import SinkBlock
 
@@ -16,3 +18,120 @@ def test_source_block_smoke():
     sim.run()
 
     assert sink.count == 1, "Source should spawn one agent"
+
+
+def test_source_block_spawn_array():
+    sim = Simulator(max_ticks=10)
+
+    # Ticks past the end of the array spawn nothing
+    source = SourceBlock(simulator=sim, spawn_array=[0, 2, 0, 1])
+
+    sink = SinkBlock(simulator=sim)
+    source.connect(sink)
+
+    sim.run()
+
+    assert sink.count == 3, "Source should spawn the counts listed in spawn_array"
+
+
+def test_source_block_uses_bulk_spawn():
+    sim = Simulator(max_ticks=3)
+    requested = []
+
+    class PooledAgent(BaseAgent):
+        @classmethod
+        def _bulk_spawn(cls, n):
+            requested.append(n)
+            return [cls() for _ in range(n)]
+
+    source = SourceBlock(simulator=sim, agent_class=PooledAgent, spawn_schedule=lambda tick: tick)
+    sink = SinkBlock(simulator=sim)
+    source.connect(sink)
+
+    sim.run()
+
+    assert requested == [1, 2], "Ticks with nothing to spawn should not call _bulk_spawn"
+    assert sink.count == 3
+
+
+def test_base_agent_bulk_spawn_matches_init():
+    agents = BaseAgent._bulk_spawn(100)
+    fresh = BaseAgent()
+
+    ids = [agent.id for agent in agents]
+    assert ids == sorted(set(ids)) and fresh.id > ids[-1], "Ids should stay unique and increasing"
+    # Every slot __init__ fills — read from the class, so a new field cannot be missed here
+    for slot in BaseAgent.__slots__:
+        if slot in ('id', '__dict__', '__weakref__'):
+            continue
+        assert hasattr(agents[0], slot) == hasattr(fresh, slot), f"_bulk_spawn and __init__ disagree on {slot}"
+        if hasattr(fresh, slot):
+            assert getattr(agents[0], slot) == getattr(fresh, slot), f"_bulk_spawn sets {slot} differently"
+    assert vars(agents[0]) == vars(fresh), "_bulk_spawn and __init__ should set the same __dict__ fields"
+    assert agents[0].space_state is not agents[1].space_state, "Each agent needs its own state dict"
+
+    class Tagged(BaseAgent):
+        def __init__(self):
+            super().__init__()
+            self.tag = "custom"
+
+    assert all(agent.tag == "custom" for agent in Tagged._bulk_spawn(100)), "Subclass __init__ must still run"
+
+
+def test_source_block_precompute_calls_schedule_once_per_tick():
+    sim = Simulator(max_ticks=10)
+    calls = []
+
+    def schedule(tick):
+        calls.append(tick)
+        return 1 if tick % 3 == 0 else 0
+
+    source = SourceBlock(simulator=sim, spawn_schedule=schedule, precompute=True)
+    assert calls == list(range(10)), "Schedule should be evaluated up front, once per tick"
+
+    sink = SinkBlock(simulator=sim)
+    source.connect(sink)
+
+    sim.run()
+
+    assert calls == list(range(10)), "Precomputed schedule should not be called during the run"
+    assert sink.count == 4
+
+
+def test_source_block_precompute_rejects_spawn_array():
+    sim = Simulator(max_ticks=10)
+    with pytest.raises(ValueError):
+        SourceBlock(simulator=sim, spawn_array=[1], precompute=True)
+
+
+def test_source_block_hands_bursts_downstream_as_one_batch():
+    sim = Simulator(max_ticks=3)
+
+    source = SourceBlock(simulator=sim, spawn_schedule=lambda tick: 5 if tick == 1 else 0)
+    sink = SinkBlock(simulator=sim)
+    batches = []
+    take_many = sink.take_many
+    sink.take_many = lambda agents: (batches.append(len(agents)), take_many(agents))
+    exited = []
+    source.on_exit = exited.append
+    source.connect(sink)
+
+    sim.run()
+
+    assert batches == [5]
+    assert len(exited) == 5
+    assert sink.count == 5
+    assert sim.agents == []
+
+
+def test_sink_block_can_count_without_keeping_agents():
+    sim = Simulator(max_ticks=10)
+
+    source = SourceBlock(simulator=sim, spawn_schedule=lambda tick: 3 if tick % 2 else 1)
+    sink = SinkBlock(simulator=sim, keep_agents=False)
+    source.connect(sink)
+
+    sim.run()
+
+    assert sink.count == 20
+    assert sink.agents == []
@@ -49,3 +49,25 @@ def test_split_block_smoke():
     assert sink_container.count == 1, "SplitBlock should emit one container"
     assert sink_pickup.count == 1, "SplitBlock should emit one pickup"
     assert len(sink_container._agents[0].children_agents) == 0, "Container should have no children after split"
+
+
+def test_split_block_hands_children_over_in_one_batch():
+    sim = Simulator(max_ticks=1)
+    split = SplitBlock(simulator=sim)
+    sink_container = SinkBlock(simulator=sim)
+    sink_pickup = SinkBlock(simulator=sim)
+    split.connect_first(sink_container)
+    split.connect_second(sink_pickup)
+
+    batches = []
+    take_many = sink_pickup.take_many
+    sink_pickup.take_many = lambda agents: (batches.append(len(agents)), take_many(agents))
+
+    container = Container()
+    children = [Pickup() for _ in range(3)]
+    container.children_agents.extend(children)
+    split.take(container)
+
+    assert batches == [3]
+    assert container.children_agents == []
+    assert all(child.parent_agents == [container] for child in children)
@@ -0,0 +1,29 @@
+import io
+import math
+
+import pytest
+
+from aim.util import TickLogger, ring_positions
+
+
+def test_ring_positions():
+    positions = ring_positions(4, radius=2.0, y=1.5)
+
+    assert positions.shape == (4, 3)
+    assert positions[:, 1].tolist() == [1.5] * 4
+    # Counter-clockwise from +X in the XZ plane
+    assert positions[0] == pytest.approx((2.0, 1.5, 0.0))
+    assert positions[1] == pytest.approx((0.0, 1.5, 2.0))
+    assert all(math.hypot(x, z) == pytest.approx(2.0) for x, _, z in positions.tolist())
+
+
+def test_tick_logger_buffers_until_flush():
+    logger = TickLogger()
+    logger.log(3, "entered")
+    logger.log(4, "exited")
+    out = io.StringIO()
+
+    logger.flush(out)
+
+    assert out.getvalue() == "[3] entered\n[4] exited\n"
+    assert logger.lines == []